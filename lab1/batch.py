@@ -0,0 +1,354 @@
+"""
+Модуль batch.py
+
+Пакетная обработка множества изображений в пуле процессов.
+
+Процессы пула создаются один раз: каждый импортирует OpenCV и numba, создаёт
+свой экземпляр реализации и прогревает ядра numba, после чего обрабатывает
+изображения одно за другим. Каждый результат записывается на диск в процессе
+пула сразу после обработки, родитель получает только короткий отчёт и замеры
+времени (metrics.registry.collect()).
+
+Входные изображения задаются путями к файлам, директориями (берутся файлы
+изображений из директории), шаблонами glob (** - рекурсивно) или файлами
+со списком путей по одному в строке (@список.txt). Несколько методов для
+одного изображения считаются через граф операций (run_methods) с общими
+промежуточными результатами.
+
+С кэшем результатов (utils.result_cache) вход сначала хэшируется: результаты,
+уже посчитанные для тех же байтов изображения, метода и параметров, копируются
+из кэша без декодирования и обработки.
+"""
+
+import glob
+import hashlib
+import multiprocessing
+import os
+import time
+from typing import Any
+
+import cv2
+import numpy as np
+
+from lab1 import interfaces
+from lab1.implementation import ImageProcessing
+from lab1.implementation import custom_image_processing
+from lab1.implementation.custom_image_processing import CustomImageProcessing
+from lab1.utils import metrics
+from lab1.utils.result_cache import ResultCache
+
+image_extensions = (".bmp", ".jpeg", ".jpg", ".png", ".tif", ".tiff", ".webp")
+list_file_prefix = "@"
+glob_characters = "*?["
+batch_chunk_size = 4  # изображений на одно обращение к пулу
+# процессы пула запускаются заново, а не через fork: после ядер numba в родителе
+# (потоки TBB/OpenMP) копия процесса может зависнуть на унаследованных блокировках
+pool_start_method = "spawn"
+method_functions = {
+    "edges": "edge_detection",
+    "corners": "corner_detection",
+    "circles": "circle_detection",
+}
+
+# экземпляр реализации процесса пула, создаётся в _init_batch_worker
+_processor: interfaces.IImageProcessing | None = None
+_impl = "lib"
+# кэш результатов процесса пула (None - без кэша)
+_cache: ResultCache | None = None
+
+
+def is_glob(pattern: str) -> bool:
+    """
+    Проверяет, является ли вход шаблоном glob. Существующий путь - не шаблон,
+    даже если в имени есть символы шаблона (например, photo[1].jpg).
+
+    Args:
+        pattern (str): Вход из командной строки
+
+    Returns:
+        bool: True, если вход нужно раскрыть через glob
+    """
+    return not os.path.exists(pattern) and any(character in pattern for character in glob_characters)
+
+
+def collect_inputs(patterns: list[str]) -> list[str]:
+    """
+    Раскрывает пути, директории, шаблоны glob и списки в список файлов.
+
+    Args:
+        patterns (list[str]): Пути к файлам, директориям, шаблоны или @файл_со_списком
+
+    Returns:
+        list[str]: Пути к файлам без повторов, в порядке появления
+    """
+    paths = []
+    for pattern in patterns:
+        if pattern.startswith(list_file_prefix):
+            with open(pattern[len(list_file_prefix):], encoding="utf-8") as file:
+                paths.extend(line.strip() for line in file if line.strip())
+        elif os.path.isdir(pattern):
+            paths.extend(
+                os.path.join(pattern, name) for name in sorted(os.listdir(pattern))
+                if os.path.splitext(name)[1].lower() in image_extensions
+                and os.path.isfile(os.path.join(pattern, name))
+            )
+        elif is_glob(pattern):
+            paths.extend(path for path in sorted(glob.glob(pattern, recursive=True)) if os.path.isfile(path))
+        else:
+            paths.append(pattern)
+
+    return list(dict.fromkeys(paths))
+
+
+def output_paths(inputs: list[str], output_dir: str) -> list[str]:
+    """
+    Пути результатов: структура директорий входов повторяется относительно их
+    общей директории, поэтому одинаковые имена из разных директорий не совпадают.
+
+    Args:
+        inputs (list[str]): Пути к входным изображениям
+        output_dir (str): Директория результатов
+
+    Returns:
+        list[str]: Пути результатов в том же порядке
+    """
+    if not inputs:
+        return []
+    directories = [os.path.dirname(os.path.abspath(path)) for path in inputs]
+    common = os.path.commonpath(directories)
+
+    return [
+        os.path.join(output_dir, os.path.relpath(os.path.abspath(path), common))
+        for path in inputs
+    ]
+
+
+def apply_methods(
+        processor: ImageProcessing | CustomImageProcessing,
+        image: np.ndarray,
+        methods: list[str],
+        pyramid_levels: int = 0,
+) -> dict[str, np.ndarray]:
+    """
+    Применяет к изображению один или несколько методов.
+
+    Один метод вызывается напрямую, несколько - через граф операций
+    processor.run_methods, чтобы общие промежуточные результаты считались один раз.
+    Пирамидальный поиск углов в графе не участвует и вызывается отдельно.
+
+    Args:
+        processor (ImageProcessing | CustomImageProcessing): Реализация обработки
+        image (np.ndarray): Входное изображение
+        methods (list[str]): Методы: edges, corners, circles
+        pyramid_levels (int): Число уровней пирамиды для corners
+
+    Returns:
+        dict[str, np.ndarray]: Результаты по методам в порядке methods
+    """
+    results = {}
+    graph_methods = list(methods)
+    if "corners" in graph_methods and pyramid_levels > 0:
+        results["corners"] = processor.corner_detection(image, pyramid_levels)
+        graph_methods.remove("corners")
+
+    if len(graph_methods) == 1:
+        results[graph_methods[0]] = getattr(processor, method_functions[graph_methods[0]])(image)
+    elif graph_methods:
+        results.update(processor.run_methods(image, graph_methods))
+
+    return {method: results[method] for method in methods}
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """Записывает байты в файл, создавая директорию."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(data)
+
+
+def process_image(
+        processor: ImageProcessing | CustomImageProcessing,
+        impl: str,
+        input_path: str,
+        outputs: dict[str, str],
+        pyramid_levels: int = 0,
+        cache: ResultCache | None = None,
+) -> tuple[int, int]:
+    """
+    Обрабатывает один файл и записывает результаты, используя кэш результатов.
+
+    Результаты, найденные в кэше, записываются без декодирования входа;
+    остальные считаются через apply_methods и добавляются в кэш. Ключ кэша
+    учитывает impl, поэтому processor должен быть реализацией impl с параметрами
+    по умолчанию.
+
+    Args:
+        processor (ImageProcessing | CustomImageProcessing): Реализация обработки
+        impl (str): Реализация - lib или custom
+        input_path (str): Путь к входному изображению
+        outputs (dict[str, str]): Пути результатов по методам (edges, corners, circles)
+        pyramid_levels (int): Число уровней пирамиды для corners
+        cache (ResultCache | None): Кэш результатов (None - без кэша)
+
+    Returns:
+        tuple[int, int]: Число пикселей обработанного изображения (0, если все
+         результаты взяты из кэша) и число результатов из кэша
+    """
+    try:
+        with open(input_path, "rb") as file:
+            data = file.read()
+    except OSError as error:
+        raise ValueError("не удалось загрузить изображение") from error
+
+    keys = {}
+    missing = []
+    image_digest = hashlib.sha256(data).hexdigest() if cache is not None else ""
+    for method, output_path in outputs.items():
+        if cache is not None:
+            params = {"pyramid_levels": pyramid_levels if method == "corners" else 0}
+            keys[method] = cache.key(image_digest, method, impl, os.path.splitext(output_path)[1], params)
+            encoded = cache.get(keys[method])
+            if encoded is not None:
+                _write_file(output_path, encoded)
+                continue
+        missing.append(method)
+    if not missing:
+        return 0, len(outputs)
+
+    image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("не удалось загрузить изображение")
+    results = apply_methods(processor, image, missing, pyramid_levels)
+    for method, result in results.items():
+        success, encoded = cv2.imencode(os.path.splitext(outputs[method])[1], result)
+        if not success:
+            raise ValueError(f"не удалось сохранить результат {outputs[method]}")
+        _write_file(outputs[method], encoded.tobytes())
+        if cache is not None:
+            cache.put(keys[method], encoded.tobytes())
+
+    return image.shape[0] * image.shape[1], len(outputs) - len(missing)
+
+
+def _init_batch_worker(impl: str, cache: ResultCache | None = None) -> None:
+    """
+    Инициализатор процесса пула: создаёт реализацию, общую для всех изображений
+    процесса, и для custom прогревает ядра numba.
+
+    Args:
+        impl (str): Реализация - lib или custom
+        cache (ResultCache | None): Кэш результатов (None - без кэша)
+    """
+    global _processor, _impl, _cache
+    _impl, _cache = impl, cache
+    if impl == "custom":
+        custom_image_processing.warmup()
+        _processor = CustomImageProcessing()
+    else:
+        _processor = ImageProcessing()
+    # время прогрева не должно попасть в замеры обработки
+    metrics.registry.reset()
+
+
+def _process_file(task: tuple[str, dict[str, str], int]) -> dict[str, Any]:
+    """
+    Обрабатывает одно изображение в процессе пула и записывает результаты.
+
+    Args:
+        task (tuple[str, dict[str, str], int]): Входной путь, пути результатов
+         по методам (edges, corners, circles) и число уровней пирамиды для corners
+
+    Returns:
+        dict[str, Any]: Отчёт: пути, число пикселей, число результатов из кэша,
+         время, ошибка и замеры времени
+    """
+    input_path, outputs, pyramid_levels = task
+    report = {"input": input_path, "outputs": outputs, "pixels": 0, "cached": 0, "seconds": 0.0, "error": None}
+
+    start_time = time.perf_counter()
+    try:
+        report["pixels"], report["cached"] = process_image(
+            _processor, _impl, input_path, outputs, pyramid_levels, _cache,
+        )
+    except Exception as exception:
+        report["error"] = str(exception)
+    report["seconds"] = time.perf_counter() - start_time
+    report["metrics"] = metrics.registry.collect()
+
+    return report
+
+
+def run_batch(
+        inputs: list[str],
+        methods: list[str],
+        impl: str,
+        output_dir: str,
+        workers: int | None = None,
+        pyramid_levels: int = 0,
+        cache: ResultCache | None = None,
+) -> dict[str, float]:
+    """
+    Обрабатывает изображения в пуле процессов и печатает сводку.
+
+    Args:
+        inputs (list[str]): Пути к входным изображениям
+        methods (list[str]): Методы обработки: edges, corners, circles
+        impl (str): Реализация - lib или custom
+        output_dir (str): Директория результатов; при нескольких методах
+         результаты каждого метода пишутся в свою поддиректорию
+        workers (int | None): Число процессов (None - по числу ядер)
+        pyramid_levels (int): Число уровней пирамиды для corners
+        cache (ResultCache | None): Кэш результатов (None - без кэша); после
+         обработки размер кэша приводится к пределу
+
+    Returns:
+        dict[str, float]: Сводка: число обработанных изображений и ошибок, число
+         результатов из кэша, время, изображений и мегапикселей в секунду
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("Число процессов должно быть >= 1")
+
+    if len(methods) == 1:
+        method_dirs = {methods[0]: output_dir}
+    else:
+        method_dirs = {method: os.path.join(output_dir, method) for method in methods}
+    method_paths = {method: output_paths(inputs, directory) for method, directory in method_dirs.items()}
+    tasks = [
+        (input_path, {method: paths[index] for method, paths in method_paths.items()}, pyramid_levels)
+        for index, input_path in enumerate(inputs)
+    ]
+    processed, failed, cached, pixels = 0, 0, 0, 0
+
+    start_time = time.perf_counter()
+    context = multiprocessing.get_context(pool_start_method)
+    with context.Pool(workers, initializer=_init_batch_worker, initargs=(impl, cache)) as pool:
+        for report in pool.imap_unordered(_process_file, tasks, chunksize=batch_chunk_size):
+            metrics.registry.merge(report["metrics"])
+            if report["error"] is None:
+                processed += 1
+                pixels += report["pixels"]
+                cached += report["cached"]
+                print(f"[{processed + failed}/{len(tasks)}] {report['input']} -> "
+                      f"{', '.join(report['outputs'].values())} ({report['seconds']:.3f} с)")
+            else:
+                failed += 1
+                print(f"[{processed + failed}/{len(tasks)}] Ошибка: {report['input']}: {report['error']}")
+    if cache is not None:
+        cache.evict()
+    total_seconds = time.perf_counter() - start_time
+
+    summary = {
+        "processed": processed,
+        "failed": failed,
+        "cached": cached,
+        "seconds": total_seconds,
+        "images_per_second": processed / total_seconds if total_seconds > 0 else 0.0,
+        "megapixels_per_second": pixels / 1e6 / total_seconds if total_seconds > 0 else 0.0,
+    }
+    print(
+        f"Обработано {processed} изображений, ошибок {failed}, результатов из кэша {cached} "
+        f"за {total_seconds:.2f} с: "
+        f"{summary['images_per_second']:.2f} изобр./с, {summary['megapixels_per_second']:.2f} Мп/с"
+    )
+
+    return summary
@@ -0,0 +1,330 @@
+"""
+Модуль benchmark.py
+
+Замеры производительности реализаций IImageProcessing.
+
+Каждый метод интерфейса запускается для ImageProcessing и CustomImageProcessing
+на синтетических изображениях от 256x256 до 8K. Первый вызов (компиляция numba,
+прогрев кэшей) замеряется отдельно от установившегося режима. Для каждого
+замера сохраняются медианное и минимальное время, мегапиксели в секунду и пик
+памяти, выделенной через numpy (tracemalloc; внутренние буферы OpenCV не видны).
+
+Запуск:
+    python -m lab1.benchmark [-o результат.json] [--sizes 256 1024 4k]
+        [--implementations lib custom] [--methods edge_detection ...]
+        [--repeat N] [--compare эталон.json] [--tolerance 0.1]
+
+Аргументы:
+    -o, --output: файл JSON с результатами (по умолчанию: results/benchmark.json)
+    --sizes: размеры изображений из benchmark_sizes (по умолчанию: все)
+    --implementations: lib и/или custom (по умолчанию: обе)
+    --methods: методы интерфейса (по умолчанию: все)
+    --repeat: число замеров установившегося режима (по умолчанию: 5)
+    --compare: эталонный JSON; замеры медленнее эталона больше чем на
+     tolerance отмечаются как регрессии, код возврата 1
+    --tolerance: допустимое замедление (по умолчанию: 0.1 - 10 %)
+
+Пример:
+    python -m lab1.benchmark --sizes 256 1024 -o baseline.json
+    python -m lab1.benchmark --sizes 256 1024 --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import cv2
+import numba
+import numpy as np
+
+from lab1 import interfaces
+from lab1.implementation import ImageProcessing
+from lab1.implementation.custom_image_processing import CustomImageProcessing, gaussian_kernel
+from lab1.utils import metrics
+
+# размеры (высота, ширина) синтетических изображений
+benchmark_sizes = {
+    "256": (256, 256),
+    "512": (512, 512),
+    "1024": (1024, 1024),
+    "2048": (2048, 2048),
+    "4k": (2160, 3840),
+    "8k": (4320, 7680),
+}
+benchmark_methods = (
+    "_convolution",
+    "_rgb_to_grayscale",
+    "_gamma_correction",
+    "edge_detection",
+    "corner_detection",
+    "circle_detection",
+)
+benchmark_implementations: dict[str, Callable[[], interfaces.IImageProcessing]] = {
+    "lib": ImageProcessing,
+    "custom": CustomImageProcessing,
+}
+default_output = "results/benchmark.json"
+default_repeat = 5
+default_tolerance = 0.1
+benchmark_gamma = 2.2
+
+
+def synthetic_image(height: int, width: int, seed: int = 0) -> np.ndarray:
+    """
+    Создаёт изображение BGR с шумом, прямоугольниками (границы, углы) и кругами.
+
+    Args:
+        height (int): Высота изображения
+        width (int): Ширина изображения
+        seed (int): Зерно генератора случайных чисел
+
+    Returns:
+        np.ndarray: Изображение uint8 формы (height, width, 3)
+    """
+    rng = np.random.default_rng(seed)
+    image = rng.integers(20, 60, (height, width, 3), dtype=np.uint8)
+    scale = min(height, width)
+
+    for _ in range(12):
+        top, left = int(rng.integers(0, height)), int(rng.integers(0, width))
+        size = int(rng.integers(scale // 20, scale // 5))
+        color = tuple(int(value) for value in rng.integers(80, 255, size=3))
+        cv2.rectangle(image, (left, top), (left + size, top + size // 2), color, -1)
+
+    for _ in range(6):
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        radius = int(rng.integers(scale // 30, scale // 8))
+        color = tuple(int(value) for value in rng.integers(80, 255, size=3))
+        cv2.circle(image, center, max(radius, 10), color, -1)
+
+    return image
+
+
+def method_call(processor: interfaces.IImageProcessing, method: str, image: np.ndarray) -> Callable[[], Any]:
+    """
+    Возвращает вызов метода интерфейса с подготовленными аргументами.
+
+    Args:
+        processor (interfaces.IImageProcessing): Реализация обработки
+        method (str): Имя метода из benchmark_methods
+        image (np.ndarray): Изображение BGR
+
+    Returns:
+        Callable[[], Any]: Функция без аргументов, вызывающая метод
+    """
+    if method == "_convolution":
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY).astype(np.float32)
+        return lambda: processor._convolution(gray, gaussian_kernel)
+    if method == "_gamma_correction":
+        return lambda: processor._gamma_correction(image, benchmark_gamma)
+
+    return lambda: getattr(processor, method)(image)
+
+
+def benchmark_method(call: Callable[[], Any], repeat: int, megapixels: float) -> dict[str, float]:
+    """
+    Замеряет прогрев, установившийся режим и пик памяти одного вызова.
+
+    Args:
+        call (Callable[[], Any]): Замеряемый вызов
+        repeat (int): Число замеров установившегося режима
+        megapixels (float): Размер изображения в мегапикселях
+
+    Returns:
+        dict[str, float]: Результаты замера
+    """
+    # замеры measure_time в реестре metrics здесь не нужны
+    metrics_enabled = metrics.registry.enabled
+    metrics.set_enabled(False)
+    try:
+        start_time = time.perf_counter()
+        call()
+        warmup_seconds = time.perf_counter() - start_time
+
+        timings = []
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            call()
+            timings.append(time.perf_counter() - start_time)
+
+        # отдельный прогон: tracemalloc замедляет выделение памяти
+        tracemalloc.start()
+        try:
+            call()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    finally:
+        metrics.set_enabled(metrics_enabled)
+
+    median_seconds = statistics.median(timings)
+    return {
+        "warmup_seconds": warmup_seconds,
+        "median_seconds": median_seconds,
+        "min_seconds": min(timings),
+        "megapixels_per_second": megapixels / median_seconds if median_seconds > 0 else float("inf"),
+        "peak_memory_mb": peak_bytes / 2 ** 20,
+    }
+
+
+def run_benchmarks(
+        sizes: list[str],
+        implementations: list[str],
+        methods: list[str],
+        repeat: int = default_repeat,
+) -> dict[str, Any]:
+    """
+    Запускает замеры для всех сочетаний размеров, реализаций и методов.
+
+    Args:
+        sizes (list[str]): Ключи benchmark_sizes
+        implementations (list[str]): Ключи benchmark_implementations
+        methods (list[str]): Имена методов из benchmark_methods
+        repeat (int): Число замеров установившегося режима
+
+    Returns:
+        dict[str, Any]: Описание окружения ("environment") и список замеров ("results")
+    """
+    if repeat < 1:
+        raise ValueError("Число замеров должно быть >= 1")
+
+    results = []
+    for size in sizes:
+        height, width = benchmark_sizes[size]
+        image = synthetic_image(height, width)
+        megapixels = height * width / 1e6
+        for implementation in implementations:
+            processor = benchmark_implementations[implementation]()
+            for method in methods:
+                measurement = benchmark_method(method_call(processor, method, image), repeat, megapixels)
+                results.append({
+                    "implementation": implementation,
+                    "method": method,
+                    "size": size,
+                    "height": height,
+                    "width": width,
+                    "megapixels": megapixels,
+                    **measurement,
+                })
+                print(
+                    f"{implementation:>6} {method:<18} {size:>5}: "
+                    f"{measurement['median_seconds']:.4f} с, "
+                    f"{measurement['megapixels_per_second']:.1f} Мп/с, "
+                    f"прогрев {measurement['warmup_seconds']:.4f} с, "
+                    f"память {measurement['peak_memory_mb']:.1f} МБ"
+                )
+
+    return {"environment": environment_info(repeat), "results": results}
+
+
+def environment_info(repeat: int) -> dict[str, Any]:
+    """Описание окружения, в котором сделаны замеры."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numba_threads": numba.config.NUMBA_NUM_THREADS,
+        "numpy": np.__version__,
+        "numba": numba.__version__,
+        "opencv": cv2.__version__,
+        "repeat": repeat,
+    }
+
+
+def compare_results(
+        baseline: dict[str, Any],
+        current: dict[str, Any],
+        tolerance: float = default_tolerance,
+) -> list[dict[str, Any]]:
+    """
+    Сравнивает медианное время замеров с эталоном.
+
+    Args:
+        baseline (dict[str, Any]): Эталонные результаты run_benchmarks
+        current (dict[str, Any]): Текущие результаты run_benchmarks
+        tolerance (float): Допустимое относительное замедление
+
+    Returns:
+        list[dict[str, Any]]: Замеры, найденные в обоих наборах, с отношением
+         времени ("ratio") и признаком регрессии ("regression")
+    """
+    def key(result: dict[str, Any]) -> tuple[str, str, str]:
+        return result["implementation"], result["method"], result["size"]
+
+    baseline_results = {key(result): result for result in baseline["results"]}
+    comparison = []
+    for result in current["results"]:
+        reference = baseline_results.get(key(result))
+        if reference is None:
+            continue
+        ratio = result["median_seconds"] / reference["median_seconds"]
+        comparison.append({
+            "implementation": result["implementation"],
+            "method": result["method"],
+            "size": result["size"],
+            "baseline_seconds": reference["median_seconds"],
+            "current_seconds": result["median_seconds"],
+            "ratio": ratio,
+            "regression": ratio > 1 + tolerance,
+        })
+
+    return comparison
+
+
+def main() -> None:
+    """
+    Разбирает аргументы командной строки, запускает замеры, сохраняет их в JSON
+    и при необходимости сравнивает с эталоном.
+    """
+    parser = argparse.ArgumentParser(description="Замеры производительности реализаций IImageProcessing.")
+    parser.add_argument("-o", "--output", default=default_output,
+                        help=f"Файл JSON с результатами (по умолчанию: {default_output})")
+    parser.add_argument("--sizes", nargs="+", choices=list(benchmark_sizes), default=list(benchmark_sizes),
+                        help="Размеры изображений (по умолчанию: все)")
+    parser.add_argument("--implementations", nargs="+", choices=list(benchmark_implementations),
+                        default=list(benchmark_implementations), help="Реализации (по умолчанию: обе)")
+    parser.add_argument("--methods", nargs="+", choices=benchmark_methods, default=list(benchmark_methods),
+                        help="Методы интерфейса (по умолчанию: все)")
+    parser.add_argument("--repeat", type=int, default=default_repeat,
+                        help=f"Число замеров установившегося режима (по умолчанию: {default_repeat})")
+    parser.add_argument("--compare", help="Эталонный JSON для поиска регрессий")
+    parser.add_argument("--tolerance", type=float, default=default_tolerance,
+                        help=f"Допустимое замедление относительно эталона (по умолчанию: {default_tolerance})")
+    args = parser.parse_args()
+
+    current = run_benchmarks(args.sizes, args.implementations, args.methods, args.repeat)
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(current, file, ensure_ascii=False, indent=2)
+    print(f"Результаты сохранены в {args.output}")
+
+    if not args.compare:
+        return
+
+    with open(args.compare, encoding="utf-8") as file:
+        baseline = json.load(file)
+    comparison = compare_results(baseline, current, args.tolerance)
+    for row in comparison:
+        mark = "РЕГРЕССИЯ" if row["regression"] else "ok"
+        print(
+            f"{row['implementation']:>6} {row['method']:<18} {row['size']:>5}: "
+            f"{row['baseline_seconds']:.4f} с -> {row['current_seconds']:.4f} с "
+            f"(x{row['ratio']:.2f}) {mark}"
+        )
+    if any(row["regression"] for row in comparison):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@
 - гамма-коррекция
 - обнаружение границ (оператор Кэнни)
 - обнаружение углов (алгоритм Харриса)
-- обнаружение окружностей (метод пока не реализован)
+- обнаружение окружностей (градиентное преобразование Хафа)
 
 Модуль предназначен для учебных целей
  (лабораторная работа по курсу "Технологии программирования на Python").
@@ -17,10 +17,18 @@
  Выполнил 6401 Жиляев Максим Иванович
 """
 
+import json
+import os
+import time
+from typing import Iterable
+
+import numba
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from lab1 import interfaces
+from lab1.implementation import keypoints, point_operations
+from lab1.implementation.operator_graph import Operator, OperatorGraph
 
 max_pixel_value = 255.0
 
@@ -28,6 +36,41 @@ red_coefficient = 0.299
 green_coefficient = 0.587
 blue_coefficient = 0.114
 
+# целочисленный режим: веса яркости в фиксированной точке (сумма весов ровно 1 << fixed_point_shift);
+# синий вес - остаток до суммы, веса совпадают с cv2.cvtColor для uint8
+fixed_point_shift = 15
+red_fixed_weight = np.uint16(round(red_coefficient * (1 << fixed_point_shift)))
+green_fixed_weight = np.uint16(round(green_coefficient * (1 << fixed_point_shift)))
+blue_fixed_weight = np.uint16((1 << fixed_point_shift) - red_fixed_weight - green_fixed_weight)
+
+# размер изображения для прогрева: все ветви ядер (плитки, края) проходятся, но быстро
+warmup_size = 96
+
+# размер плитки, которую обрабатывает один поток
+tile_height = 64
+tile_width = 256
+
+# высота полосы (в строках) при обработке изображений, не помещающихся в память
+tiled_strip_height = 1024
+
+# пороги гистерезиса оператора Кэнни, как у ImageProcessing
+canny_low_threshold = 200.0
+canny_high_threshold = 300.0
+canny_tan_22_5 = round((np.sqrt(2.0) - 1.0) * (1 << 15)) / (1 << 15)
+
+# параметры детектора Харриса
+harris_k = 0.04
+corners_amount = 1000
+# пирамидальный режим: отклик на полном разрешении считается только в плитках
+# pyramid_tile_size x pyramid_tile_size вокруг кандидатов с уменьшенного изображения
+pyramid_tile_size = 32
+pyramid_candidate_ratio = 0.01  # кандидат грубого уровня: отклик больше этой доли максимума
+corner_color = (0, 0, 255)  # BGR
+
+# файл, в котором хранятся замеры для выбора между прямой свёрткой и FFT
+fft_calibration_path = os.path.join(os.path.expanduser("~"), ".cache", "lab1", "fft_calibration.json")
+convolution_backends = ("auto", "direct", "fft")
+
 sobel_kernel_x = np.array(
     [
         [-1, 0, 1],
@@ -58,6 +101,191 @@ gaussian_kernel = (
         / 16.0
 )
 
+# gaussian_kernel = np.outer(gaussian_weights, gaussian_weights)
+gaussian_weights = np.array([1, 2, 1], dtype=np.float32) / 4.0
+
+# параметры градиентного преобразования Хафа для окружностей
+circle_edge_ratio = 0.25  # порог границы как доля максимального градиента
+circle_max_edge_points = 200_000  # сколько самых сильных пикселей границы голосует
+circle_accumulator_step = 2  # во сколько раз аккумулятор центров меньше изображения
+circle_min_votes = 10
+circle_vote_ratio = 1.0  # дополнительный порог голосов на единицу min_radius
+circle_max_candidates = 200
+circle_min_alignment = 0.9  # |cos| угла между градиентом и радиусом
+circle_min_support = 0.75  # покрытие окружности пикселями границы (толщина границы > 1, поэтому может быть > 1)
+
+
+@njit(inline="always", cache=True)
+def _sobel_at(image, upper, row, lower, left_col, col, right_col):
+    """
+    Градиенты Собеля в одном пикселе по заданным индексам соседей.
+
+    @param image: двумерное изображение
+    @param upper: индекс строки сверху
+    @param row: индекс строки пикселя
+    @param lower: индекс строки снизу
+    @param left_col: индекс столбца слева
+    @param col: индекс столбца пикселя
+    @param right_col: индекс столбца справа
+    @return: gx и gy в точности float32
+    """
+    top_left = image[upper, left_col]
+    top = image[upper, col]
+    top_right = image[upper, right_col]
+    left = image[row, left_col]
+    right = image[row, right_col]
+    bottom_left = image[lower, left_col]
+    bottom = image[lower, col]
+    bottom_right = image[lower, right_col]
+
+    two = np.float32(2.0)
+    gx = (top_right + two * right + bottom_right) - (top_left + two * left + bottom_left)
+    gy = (bottom_left + two * bottom + bottom_right) - (top_left + two * top + top_right)
+
+    return np.float32(gx), np.float32(gy)
+
+
+@njit(inline="always", cache=True)
+def _gray_at(image, row, col):
+    """
+    Яркость одного пикселя, как в _rgb_to_grayscale (нулевой канал - красный).
+
+    @param image: изображение (H, W, 3) uint8
+    @param row: строка пикселя
+    @param col: столбец пикселя
+    @return: яркость float32
+    """
+    value = (
+            np.int32(red_fixed_weight) * np.int32(image[row, col, 0])
+            + np.int32(green_fixed_weight) * np.int32(image[row, col, 1])
+            + np.int32(blue_fixed_weight) * np.int32(image[row, col, 2])
+    )
+    return np.float32((value + np.int32(1 << (fixed_point_shift - 1))) >> np.int32(fixed_point_shift))
+
+
+@njit(inline="always", cache=True)
+def _canny_sobel_at(upper, middle, lower, left_col, col, right_col, gradient_dtype):
+    """
+    Градиенты Собеля в одном столбце по трём строкам яркости uint8.
+
+    @param upper: строка сверху
+    @param middle: строка пикселя
+    @param lower: строка снизу
+    @param left_col: индекс столбца слева
+    @param col: индекс столбца пикселя
+    @param right_col: индекс столбца справа
+    @param gradient_dtype: тип арифметики (np.int32 или np.float32), значения в обоих случаях совпадают
+    @return: gx и gy
+    """
+    two = gradient_dtype(2)
+    top_left = gradient_dtype(upper[left_col])
+    top_right = gradient_dtype(upper[right_col])
+    bottom_left = gradient_dtype(lower[left_col])
+    bottom_right = gradient_dtype(lower[right_col])
+    gx = (top_right + two * gradient_dtype(middle[right_col]) + bottom_right) - (
+            top_left + two * gradient_dtype(middle[left_col]) + bottom_left)
+    gy = (bottom_left + two * gradient_dtype(lower[col]) + bottom_right) - (
+            top_left + two * gradient_dtype(upper[col]) + top_right)
+
+    return gx, gy
+
+
+@njit(inline="always", cache=True)
+def _canny_direction(gx, gy):
+    """
+    Направление сравнения при подавлении немаксимумов.
+
+    Направление градиента квантуется на 4 сектора (0, 45, 90, 135 градусов)
+    с tg(22.5) в фиксированной точке 15 бит, как в cv2.Canny.
+
+    @param gx: градиент по x
+    @param gy: градиент по y
+    @return: смещение (строка, столбец) к соседу "после" и строгое ли сравнение с ним
+    """
+    abs_x = abs(gx)
+    abs_y = abs(gy)
+    if abs_y < canny_tan_22_5 * abs_x:
+        # граница вертикальная - сравниваем с соседями слева и справа
+        return 0, 1, False
+    if abs_y > (canny_tan_22_5 + 2.0) * abs_x:
+        # граница горизонтальная - сравниваем с соседями сверху и снизу
+        return 1, 0, False
+    # диагональ: знак определяет, какая из двух диагоналей
+    return 1, -1 if (gx < 0) != (gy < 0) else 1, True
+
+
+@njit(inline="always", cache=True)
+def _canny_sobel_row(gray, shared_x, shared_y, row, gradient_x, gradient_y, magnitude, gradient_dtype):
+    """
+    Градиенты Собеля и модуль |gx| + |gy| одной строки с повторением краевых пикселей, как в cv2.Canny.
+
+    @param gray: изображение uint8 в оттенках серого (H, W)
+    @param shared_x: готовый gx (H, W) с другими краями (см. _sobel_gradients) или массив (0, 0)
+    @param shared_y: готовый gy (H, W) или массив (0, 0)
+    @param row: строка изображения
+    @param gradient_x: выходная строка gx (W,)
+    @param gradient_y: выходная строка gy (W,)
+    @param magnitude: выходная строка модуля (W,)
+    @param gradient_dtype: тип арифметики и выходных строк (np.int32 или np.float32)
+    """
+    height, width = gray.shape
+    upper = gray[max(row - 1, 0)]
+    middle = gray[row]
+    lower = gray[min(row + 1, height - 1)]
+
+    # внутренние столбцы без проверок индексов, крайние - отдельно
+    if shared_x.shape[0] > 0 and 0 < row < height - 1:
+        # внутри изображения способ дополнения краёв не важен, градиенты берутся готовые
+        for cols in range(1, width - 1):
+            gx = gradient_dtype(shared_x[row, cols])
+            gy = gradient_dtype(shared_y[row, cols])
+            gradient_x[cols] = gx
+            gradient_y[cols] = gy
+            magnitude[cols] = abs(gx) + abs(gy)
+    else:
+        for cols in range(1, width - 1):
+            gx, gy = _canny_sobel_at(upper, middle, lower, cols - 1, cols, cols + 1, gradient_dtype)
+            gradient_x[cols] = gx
+            gradient_y[cols] = gy
+            magnitude[cols] = abs(gx) + abs(gy)
+
+    for cols in (0, width - 1):
+        left_col = max(cols - 1, 0)
+        right_col = min(cols + 1, width - 1)
+        gx, gy = _canny_sobel_at(upper, middle, lower, left_col, cols, right_col, gradient_dtype)
+        gradient_x[cols] = gx
+        gradient_y[cols] = gy
+        magnitude[cols] = abs(gx) + abs(gy)
+
+
+@njit(cache=True)
+def _canny_follow_edge(flat_map, stack, seed, height, width):
+    """
+    Отмечает границей (3) сильный пиксель и все связанные с ним слабые.
+
+    @param flat_map: карта из _canny_edge_map, вытянутая в строку
+    @param stack: стек индексов размером не меньше числа ненулевых пикселей карты
+    @param seed: индекс сильного пикселя
+    @param height: высота карты
+    @param width: ширина карты
+    """
+    flat_map[seed] = 3
+    stack[0] = seed
+    stack_size = 1
+    while stack_size > 0:
+        stack_size -= 1
+        index = stack[stack_size]
+        rows = index // width
+        cols = index - rows * width
+        for neighbor_row in range(max(0, rows - 1), min(height, rows + 2)):
+            for neighbor_col in range(max(0, cols - 1), min(width, cols + 2)):
+                neighbor = neighbor_row * width + neighbor_col
+                # 1 - слабая, 2 - сильная, ещё не пройденная
+                if 0 < flat_map[neighbor] < 3:
+                    flat_map[neighbor] = 3
+                    stack[stack_size] = neighbor
+                    stack_size += 1
+
 
 class CustomImageProcessing(interfaces.IImageProcessing):
     """
@@ -71,10 +299,71 @@ class CustomImageProcessing(interfaces.IImageProcessing):
         _rgb_to_grayscale(image): Преобразует RGB-изображение в оттенки серого.
         _gamma_correction(image, gamma): Применяет гамма-коррекцию.
         edge_detection(image): Обнаруживает границы (Canny).
-        corner_detection(image): Обнаруживает углы (Harris).
-        circle_detection(image): Обнаруживает окружности (HoughCircles).
+        corner_detection(image, pyramid_levels): Обнаруживает углы (Harris).
+        find_corners(image, pyramid_levels): Возвращает маску углов.
+        corner_keypoints(image, max_keypoints, pyramid_levels): Возвращает углы (y, x, response).
+        draw_corners(image, corners): Рисует углы на изображении на месте.
+        circle_detection(image): Обнаруживает окружности (градиентный Хаф).
+        find_circles(image, min_radius, max_radius): Возвращает окружности (x, y, radius).
+        convolution_batch(images, kernel): Свёртка стопки изображений (N, H, W).
+        edge_detection_batch(images): Обнаруживает границы на стопке изображений.
+        canny_edge_detection(image, low, high): Обнаруживает границы оператором Кэнни.
+        edge_detection_tiled(image, output): Обнаруживает границы по полосам (np.memmap).
+        corner_detection_tiled(image, output): Обнаруживает углы по полосам (np.memmap).
+        run_methods(image, methods): Считает edges, corners, circles с общими промежуточными узлами.
     """
 
+    # замеры стоимости прямой свёртки и FFT по числу потоков, общие для всех экземпляров
+    _fft_calibration: dict[str, dict[str, float]] | None = None
+
+    def __init__(
+            self: "CustomImageProcessing",
+            num_threads: int | None = None,
+            convolution_backend: str = "auto",
+            suppression_radius: int = 1,
+            integer_mode: bool = False,
+    ) -> None:
+        """
+        Инициализация обработчика.
+
+        Args:
+            num_threads (int | None): Число потоков numba для свёрток
+             (по умолчанию: все доступные)
+            convolution_backend (str): Способ свёртки: auto (выбор по размерам),
+             direct (прямая) или fft (через быстрое преобразование Фурье)
+            suppression_radius (int): Радиус окна подавления немаксимумов при поиске
+             углов (1 - окно 3x3, 2 - 5x5, 3 - 7x7)
+            integer_mode (bool): Обнаружение границ в целых числах: градиенты
+             оператора Кэнни считаются в int32 вместо float32
+        """
+        if convolution_backend not in convolution_backends:
+            raise ValueError(
+                f"Неизвестный способ свёртки: {convolution_backend}. "
+                f"Допустимые значения: {', '.join(convolution_backends)}",
+            )
+        if suppression_radius < 1:
+            raise ValueError("Радиус окна подавления немаксимумов должен быть >= 1")
+        self._convolution_backend: str = convolution_backend
+        self._suppression_radius: int = suppression_radius
+        self._integer_mode: bool = integer_mode
+        self._num_threads: int = numba.config.NUMBA_NUM_THREADS
+        if num_threads is not None:
+            self.num_threads = num_threads
+
+    @property
+    def num_threads(self: "CustomImageProcessing") -> int:
+        """Property для получения числа потоков numba."""
+        return self._num_threads
+
+    @num_threads.setter
+    def num_threads(self: "CustomImageProcessing", value: int) -> None:
+        """Property для установки числа потоков numba."""
+        if not 1 <= value <= numba.config.NUMBA_NUM_THREADS:
+            raise ValueError(
+                f"Число потоков должно быть от 1 до {numba.config.NUMBA_NUM_THREADS}",
+            )
+        self._num_threads = value
+
     def _convolution(
             self: "CustomImageProcessing",
             image: np.ndarray,
@@ -83,6 +372,9 @@ class CustomImageProcessing(interfaces.IImageProcessing):
         """
         Выполняет свертку изображения
 
+        Границы обрабатываются отражением (как np.pad(mode="reflect")) прямо внутри
+        ядра через таблицы индексов, поэтому дополненная копия изображения не создаётся.
+
         Args:
             image (np.ndarray): Входное двухканальное изображение
             kernel (np.ndarray): Входное ядро свертки
@@ -90,24 +382,325 @@ class CustomImageProcessing(interfaces.IImageProcessing):
         Returns:
             np.ndarray: Изображение, подвергнутое свертке
         """
+        return self._convolve_stack(image[np.newaxis], kernel)[0]
+
+    def convolution_batch(
+            self: "CustomImageProcessing",
+            images: np.ndarray,
+            kernel: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Выполняет свёртку стопки одинаковых по размеру изображений одним вызовом.
+
+        Args:
+            images (np.ndarray): Стопка изображений формы (N, H, W)
+            kernel (np.ndarray): Входное ядро свертки
+
+        Returns:
+            np.ndarray: Стопка float32 формы (N, H, W) после свёртки
+        """
+        if images.ndim != 3:
+            raise ValueError(f"Ожидается стопка изображений формы (N, H, W), получено {images.shape}")
+
+        return self._convolve_stack(np.ascontiguousarray(images, dtype=np.float32), kernel)
+
+    def _convolve_stack(
+            self: "CustomImageProcessing",
+            images: np.ndarray,
+            kernel: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Выбирает способ свёртки и применяет его ко всей стопке (N, H, W).
+
+        Args:
+            images (np.ndarray): Стопка изображений формы (N, H, W)
+            kernel (np.ndarray): Входное ядро свертки
+
+        Returns:
+            np.ndarray: Стопка изображений после свёртки
+        """
         kernel_height, kernel_width = kernel.shape
-        pad_height, pad_width = kernel_height // 2, kernel_width // 2
+
+        # Ядра ранга 1 (Собель, Гаусс) считаем двумя одномерными проходами:
+        # k + k умножений на пиксель вместо k * k
+        separated = self._separate_kernel(kernel)
+        taps = kernel_height + kernel_width if separated is not None else kernel_height * kernel_width
+        if self._use_fft(images.shape[1:], kernel.shape, taps):
+            return self._fft_convolution(images, kernel)
+
+        row_index = self._reflect_indices(images.shape[1], kernel_height // 2)
+        col_index = self._reflect_indices(images.shape[2], kernel_width // 2)
+        numba.set_num_threads(self._num_threads)
+
+        if separated is not None:
+            column_kernel, row_kernel = separated
+            return self.conv_separable(images, column_kernel, row_kernel, row_index, col_index)
+
+        return self.conv(images, kernel, row_index, col_index)
+
+    def _use_fft(
+            self: "CustomImageProcessing",
+            image_shape: tuple[int, int],
+            kernel_shape: tuple[int, int],
+            taps: int,
+    ) -> bool:
+        """
+        Решает, считать ли свёртку через FFT.
+
+        Стоимость прямой свёртки оценивается как H * W * taps, стоимость FFT - как
+        S * log2(S), где S - площадь спектра. Коэффициенты берутся из калибровки.
+
+        Args:
+            image_shape (tuple[int, int]): Размер изображения
+            kernel_shape (tuple[int, int]): Размер ядра
+            taps (int): Число умножений на пиксель у прямой свёртки
+
+        Returns:
+            bool: True, если FFT должно быть быстрее
+        """
+        if self._convolution_backend != "auto":
+            return self._convolution_backend == "fft"
+        # для маленьких ядер прямая свёртка всегда быстрее, калибровка не нужна
+        if taps <= 25:
+            return False
+
+        calibration = self.calibrate_convolution()
+        fft_area = self._fft_area(image_shape, kernel_shape)
+        direct_cost = calibration["direct_ns_per_tap"] * image_shape[0] * image_shape[1] * taps
+        fft_cost = calibration["fft_ns_per_point"] * fft_area * np.log2(fft_area)
+
+        return fft_cost < direct_cost
+
+    def calibrate_convolution(self: "CustomImageProcessing", force: bool = False) -> dict[str, float]:
+        """
+        Возвращает коэффициенты стоимости прямой свёртки и FFT для текущего числа потоков.
+
+        Замер выполняется один раз и сохраняется в fft_calibration_path, поэтому
+        следующие запуски (и процессы пула) берут готовые значения.
+
+        Args:
+            force (bool): Перемерить, даже если замер уже есть
+
+        Returns:
+            dict[str, float]: Коэффициенты direct_ns_per_tap и fft_ns_per_point
+        """
+        key = str(self._num_threads)
+        if CustomImageProcessing._fft_calibration is None:
+            try:
+                with open(fft_calibration_path, encoding="utf-8") as file:
+                    CustomImageProcessing._fft_calibration = json.load(file)
+            except (OSError, ValueError):
+                CustomImageProcessing._fft_calibration = {}
+
+        calibration = CustomImageProcessing._fft_calibration
+        if key in calibration and not force:
+            return calibration[key]
+
+        rng = np.random.default_rng(0)
+        image = rng.random((1, 256, 256)).astype(np.float32)
+        kernel = rng.random((15, 15)).astype(np.float32)
+        row_index = self._reflect_indices(image.shape[1], kernel.shape[0] // 2)
+        col_index = self._reflect_indices(image.shape[2], kernel.shape[1] // 2)
+        numba.set_num_threads(self._num_threads)
+
+        # первый вызов компилирует ядро, его не учитываем
+        self.conv(image, kernel, row_index, col_index)
+        start_time = time.perf_counter_ns()
+        self.conv(image, kernel, row_index, col_index)
+        direct_time = time.perf_counter_ns() - start_time
+
+        self._fft_convolution(image, kernel)
+        start_time = time.perf_counter_ns()
+        self._fft_convolution(image, kernel)
+        fft_time = time.perf_counter_ns() - start_time
+
+        fft_area = self._fft_area(image.shape[1:], kernel.shape)
+        calibration[key] = {
+            "direct_ns_per_tap": direct_time / (image.size * kernel.size),
+            "fft_ns_per_point": fft_time / (fft_area * float(np.log2(fft_area))),
+        }
+
+        try:
+            os.makedirs(os.path.dirname(fft_calibration_path), exist_ok=True)
+            with open(fft_calibration_path, "w", encoding="utf-8") as file:
+                json.dump(calibration, file, indent=2)
+        except OSError:
+            # без записи на диск замер останется только в памяти процесса
+            pass
+
+        return calibration[key]
+
+    def _fft_convolution(
+            self: "CustomImageProcessing",
+            image: np.ndarray,
+            kernel: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Выполняет свёртку изображения через быстрое преобразование Фурье.
+
+        Результат совпадает с прямой свёрткой (с отражением границ) с точностью
+        до ошибок округления.
+
+        Args:
+            image (np.ndarray): Изображение (H, W) или стопка изображений (N, H, W)
+            kernel (np.ndarray): Входное ядро свертки
+
+        Returns:
+            np.ndarray: Изображение, подвергнутое свертке
+        """
+        kernel_height, kernel_width = kernel.shape
+        height, width = image.shape[-2:]
         padded = np.pad(
             image,
-            ((pad_height, pad_height), (pad_width, pad_width)),
+            ((0, 0),) * (image.ndim - 2)
+            + ((kernel_height // 2, kernel_height // 2), (kernel_width // 2, kernel_width // 2)),
             mode="reflect",
         )
+        fft_shape = (self._fast_fft_length(padded.shape[-2]), self._fast_fft_length(padded.shape[-1]))
+
+        # корреляция - это свёртка с отражённым ядром; циклический сдвиг не задевает
+        # нужную область, так как размер спектра не меньше дополненного изображения
+        spectrum = np.fft.rfft2(padded, fft_shape) * np.fft.rfft2(kernel[::-1, ::-1], fft_shape)
+        full = np.fft.irfft2(spectrum, fft_shape)
+
+        return full[
+               ...,
+               kernel_height - 1: kernel_height - 1 + height,
+               kernel_width - 1: kernel_width - 1 + width,
+               ].astype(image.dtype)
+
+    def _fft_area(
+            self: "CustomImageProcessing",
+            image_shape: tuple[int, int],
+            kernel_shape: tuple[int, int],
+    ) -> int:
+        """Площадь спектра, который строит _fft_convolution."""
+        padded_height = image_shape[0] + 2 * (kernel_shape[0] // 2)
+        padded_width = image_shape[1] + 2 * (kernel_shape[1] // 2)
+        return self._fast_fft_length(padded_height) * self._fast_fft_length(padded_width)
+
+    @staticmethod
+    def _fast_fft_length(size: int) -> int:
+        """Наименьшая длина >= size, раскладывающаяся на множители 2, 3 и 5."""
+        length = size
+        while True:
+            remainder = length
+            for factor in (2, 3, 5):
+                while remainder % factor == 0:
+                    remainder //= factor
+            if remainder == 1:
+                return length
+            length += 1
+
+    @staticmethod
+    def _reflect_indices(size: int, pad: int) -> np.ndarray:
+        """
+        Строит таблицу индексов для отражения границ.
+
+        Элемент i таблицы - номер строки (столбца) исходного изображения, который
+        стоит на позиции i в изображении, дополненном на pad с каждой стороны.
+
+        Args:
+            size (int): Размер изображения вдоль оси
+            pad (int): Ширина дополнения с каждой стороны
+
+        Returns:
+            np.ndarray: Таблица индексов длины size + 2 * pad
+        """
+        return np.pad(np.arange(size, dtype=np.int64), pad, mode="reflect")
+
+    @staticmethod
+    def _separate_kernel(kernel: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Раскладывает ядро ранга 1 на вертикальный и горизонтальный векторы.
 
-        return self.conv(image, padded, kernel_height, kernel_width, kernel)
+        Опорным берётся наибольший по модулю элемент ядра, поэтому для целочисленных
+        ядер (Собель, Гаусс) разложение получается точным.
+
+        Args:
+            kernel (np.ndarray): Двумерное ядро свёртки
+
+        Returns:
+            tuple[np.ndarray, np.ndarray] | None: Векторы (column, row), для которых
+             np.outer(column, row) совпадает с ядром, или None, если ядро не сепарабельно
+        """
+        pivot_row, pivot_col = np.unravel_index(np.argmax(np.abs(kernel)), kernel.shape)
+        pivot = kernel[pivot_row, pivot_col]
+        if pivot == 0:
+            return None
+
+        column = kernel[:, pivot_col] / pivot
+        row = kernel[pivot_row, :]
+        if not np.allclose(np.outer(column, row), kernel, rtol=1e-5, atol=1e-6 * abs(pivot)):
+            return None
+
+        return column.astype(np.float32), row.astype(np.float32)
 
     @staticmethod
-    @njit
-    def conv(image, padded, kernel_height, kernel_width, kernel):
-        output = np.zeros_like(image)
-        for rows in range(image.shape[0]):
-            for cols in range(image.shape[1]):
-                region = padded[rows: rows + kernel_height, cols: cols + kernel_width]
-                output[rows, cols] = np.sum(region * kernel)
+    @njit(parallel=True, cache=True)
+    def conv(images, kernel, row_index, col_index):
+        count, height, width = images.shape
+        kernel_height, kernel_width = kernel.shape
+        output = np.empty_like(images)
+
+        # каждое изображение стопки режется на плитки, плитки раздаются потокам
+        tiles_y = (height + tile_height - 1) // tile_height
+        tiles_x = (width + tile_width - 1) // tile_width
+        tiles_per_image = tiles_y * tiles_x
+        for tile in prange(count * tiles_per_image):
+            index = tile // tiles_per_image
+            image_tile = tile % tiles_per_image
+            row_start = (image_tile // tiles_x) * tile_height
+            col_start = (image_tile % tiles_x) * tile_width
+            row_end = min(row_start + tile_height, height)
+            col_end = min(col_start + tile_width, width)
+
+            for rows in range(row_start, row_end):
+                for cols in range(col_start, col_end):
+                    accumulator = 0.0
+                    for kernel_row in range(kernel_height):
+                        source_row = row_index[rows + kernel_row]
+                        for kernel_col in range(kernel_width):
+                            accumulator += (
+                                    images[index, source_row, col_index[cols + kernel_col]]
+                                    * kernel[kernel_row, kernel_col]
+                            )
+                    output[index, rows, cols] = accumulator
+
+        return output
+
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def conv_separable(images, column_kernel, row_kernel, row_index, col_index):
+        kernel_height = column_kernel.shape[0]
+        kernel_width = row_kernel.shape[0]
+        count, height, width = images.shape
+        tiles_y = (height + tile_height - 1) // tile_height
+
+        # горизонтальный проход: строки дополненного изображения - это отражённые
+        # строки исходного, поэтому достаточно посчитать только исходные
+        horizontal = np.empty((count, height, width), dtype=np.float32)
+        for tile in prange(count * tiles_y):
+            index = tile // tiles_y
+            row_start = (tile % tiles_y) * tile_height
+            for rows in range(row_start, min(row_start + tile_height, height)):
+                for cols in range(width):
+                    accumulator = 0.0
+                    for offset in range(kernel_width):
+                        accumulator += images[index, rows, col_index[cols + offset]] * row_kernel[offset]
+                    horizontal[index, rows, cols] = accumulator
+
+        # вертикальный проход по результату горизонтального
+        output = np.empty_like(images)
+        for tile in prange(count * tiles_y):
+            index = tile // tiles_y
+            row_start = (tile % tiles_y) * tile_height
+            for rows in range(row_start, min(row_start + tile_height, height)):
+                for cols in range(width):
+                    accumulator = 0.0
+                    for offset in range(kernel_height):
+                        accumulator += horizontal[index, row_index[rows + offset], cols] * column_kernel[offset]
+                    output[index, rows, cols] = accumulator
 
         return output
 
@@ -115,28 +708,78 @@ class CustomImageProcessing(interfaces.IImageProcessing):
         """
         Преобразует RGB-изображение в оттенки серого.
 
+        Яркость та же, что у ImageProcessing (cv2.COLOR_RGB2GRAY, см. _canny_grayscale),
+        поэтому границы, углы и окружности считаются по одному серому изображению.
+
         Args:
-            image (np.ndarray): Входное RGB-изображение.
+            image (np.ndarray): Входное RGB-изображение; изображение (H, W),
+             декодированное сразу в оттенках серого, только переводится в float32.
 
         Returns:
             np.ndarray: Одноканальное изображение в оттенках серого.
         """
-        # Стандартные коэффициенты восприятия яркости человеческим глазом
+        if image.ndim == 2:
+            return image.astype(np.float32)
 
-        blue_channel = image[:, :, 0]  # B-канал (синий)
-        green_channel = image[:, :, 1]  # G-канал (зеленый)
-        red_channel = image[:, :, 2]  # R-канал (красный)
-        grayscale = (
-                red_coefficient * red_channel
-                + green_coefficient * green_channel
-                + blue_coefficient * blue_channel
-        )
+        return self._canny_grayscale(image).astype(np.float32)
+
+    def _rgb_to_grayscale_fixed(
+            self: "CustomImageProcessing",
+            image: np.ndarray,
+            red_channel: int = 2,
+    ) -> np.ndarray:
+        """
+        Преобразует RGB-изображение в оттенки серого в фиксированной точке.
+
+        Args:
+            image (np.ndarray): Входное RGB-изображение uint8 или изображение (H, W)
+             в оттенках серого, которое возвращается без изменений.
+            red_channel (int): Номер красного канала: 2 для BGR, 0 - как cv2.COLOR_RGB2GRAY
+
+        Returns:
+            np.ndarray: Одноканальное изображение uint8 (яркость, округлённая до целого).
+        """
+        if image.ndim == 2:
+            return np.ascontiguousarray(image, dtype=np.uint8)
+        # строки пикселей подряд: внутренний цикл по строке с постоянным шагом векторизуется
+        rows = np.ascontiguousarray(image[..., :3], dtype=np.uint8).reshape(-1, image.shape[-2] * 3)
+        numba.set_num_threads(self._num_threads)
+        grayscale = self._grayscale_rows_fixed(rows, red_channel)
+
+        return grayscale.reshape(image.shape[:-1])
 
-        # Ограничиваемся диапазоном [0, 255], тк пиксель у нас от 0 до 255
-        grayscale_clipped = np.clip(grayscale, 0, max_pixel_value)
-        grayscale_float32 = grayscale_clipped.astype(np.float32)
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def _grayscale_rows_fixed(rows, red_channel):
+        """
+        Считает яркость uint8 для строк пикселей формы (R, W * 3) целыми весами.
 
-        return grayscale_float32
+        @param rows: строки пикселей uint8, три канала каждого пикселя подряд
+        @param red_channel: номер красного канала (синий - 2 - red_channel)
+        @return: яркость uint8 формы (R, W)
+        """
+        # веса переставляются вместо каналов, чтобы смещения каналов были постоянными
+        first_weight = np.int32(red_fixed_weight if red_channel == 0 else blue_fixed_weight)
+        green_weight = np.int32(green_fixed_weight)
+        last_weight = np.int32(blue_fixed_weight if red_channel == 0 else red_fixed_weight)
+        rounding = np.int32(1 << (fixed_point_shift - 1))
+        shift = np.int32(fixed_point_shift)
+        count, width = rows.shape[0], rows.shape[1] // 3
+        grayscale = np.empty((count, width), dtype=np.uint8)
+
+        for index in prange(count):
+            pixels = rows[index]
+            line = grayscale[index]
+            for cols in range(width):
+                value = (
+                        first_weight * np.int32(pixels[3 * cols])
+                        + green_weight * np.int32(pixels[3 * cols + 1])
+                        + last_weight * np.int32(pixels[3 * cols + 2])
+                )
+                # сумма весов равна 1 << fixed_point_shift, поэтому результат не больше 255
+                line[cols] = np.uint8((value + rounding) >> shift)
+
+        return grayscale
 
     def _gamma_correction(
             self: "CustomImageProcessing",
@@ -153,25 +796,22 @@ class CustomImageProcessing(interfaces.IImageProcessing):
         Returns:
             np.ndarray: Изображение после гамма-коррекции.
         """
-        if gamma <= 0:
-            raise ValueError("Гамма значение должно быть > 0")
-
-        normalized = image.astype(np.float32) / max_pixel_value
+        # Если gamma > 1 - изображение становится светлее
+        # Если gamma < 1 - изображение становится темнее
+        # Таблица на 256 значений строится один раз на значение gamma и берётся из кэша
+        table = point_operations.build_lut(gamma=float(gamma))
+        if image.dtype != np.uint8:
+            image = np.clip(image, 0, max_pixel_value).astype(np.uint8)
+        numba.set_num_threads(self._num_threads)
 
-        # Если gamma > 1 - изображение становится темнее
-        # Если gamma < 1 - изображение становится светлее
-
-        gamma_exponent = 1 / gamma
-        corrected = np.power(normalized, gamma_exponent)
-
-        return (corrected * max_pixel_value).astype(np.uint8)
+        return point_operations.apply_lut(image, table)
 
     def edge_detection(self: "CustomImageProcessing", image: np.ndarray) -> np.ndarray:
         """
         Выполняет обнаружение границ на изображении.
 
-        Использует оператор Кэнни для выделения границ.
-        Предварительно изображение преобразуется в оттенки серого.
+        Использует оператор Кэнни с порогами ImageProcessing, поэтому результат
+        совпадает с библиотечной реализацией (cv2.Canny).
 
         Args:
             image (np.ndarray): Входное изображение (RGB).
@@ -179,43 +819,645 @@ class CustomImageProcessing(interfaces.IImageProcessing):
         Returns:
             np.ndarray: Одноканальное изображение с выделенными границами.
         """
-        gray = self._rgb_to_grayscale(image)
+        return self.canny_edge_detection(image, canny_low_threshold, canny_high_threshold)
+
+    def edge_detection_batch(self: "CustomImageProcessing", images: np.ndarray) -> np.ndarray:
+        """
+        Выполняет обнаружение границ для стопки одинаковых по размеру изображений.
 
-        gradient_x = self._convolution(gray, sobel_kernel_x)
-        gradient_y = self._convolution(gray, sobel_kernel_y)
+        Градиенты всей стопки считаются одним проходом, подавление немаксимумов
+        и гистерезис - для каждого изображения отдельно, поэтому результат
+        совпадает с поэлементным вызовом edge_detection.
 
-        # величина градиента показывает "силу границ"
-        gradient_magnitude = np.sqrt(gradient_x ** 2 + gradient_y ** 2)
+        Args:
+            images (np.ndarray): Стопка изображений формы (N, H, W, 3)
+
+        Returns:
+            np.ndarray: Стопка uint8 формы (N, H, W) с выделенными границами
+        """
+        if images.ndim != 4:
+            raise ValueError(f"Ожидается стопка изображений формы (N, H, W, 3), получено {images.shape}")
+
+        return self._canny_stack(self._canny_grayscale(images), canny_low_threshold, canny_high_threshold)
+
+    def canny_edge_detection(
+            self: "CustomImageProcessing",
+            image: np.ndarray,
+            low_threshold: float = canny_low_threshold,
+            high_threshold: float = canny_high_threshold,
+    ) -> np.ndarray:
+        """
+        Выполняет обнаружение границ оператором Кэнни.
+
+        Повторяет cv2.Canny с apertureSize=3 и L2gradient=False: градиенты Собеля
+        с повторением краевых пикселей, модуль |gx| + |gy|, подавление немаксимумов
+        вдоль направления градиента и гистерезис одним проходом со стеком.
+
+        Args:
+            image (np.ndarray): Входное изображение (RGB).
+            low_threshold (float): Нижний порог гистерезиса.
+            high_threshold (float): Верхний порог гистерезиса.
+
+        Returns:
+            np.ndarray: Одноканальное изображение uint8, границы - 255.
+        """
+        return self._canny_stack(self._canny_grayscale(image)[np.newaxis], low_threshold, high_threshold)[0]
+
+    def _canny_grayscale(self: "CustomImageProcessing", image: np.ndarray) -> np.ndarray:
+        """
+        Яркость uint8 для оператора Кэнни, как у ImageProcessing._rgb_to_grayscale
+        (cv2.COLOR_RGB2GRAY): нулевой канал считается красным, веса в фиксированной точке.
+
+        Args:
+            image (np.ndarray): Изображение (..., 3) или изображение (H, W) в оттенках серого
 
-        # тут проверяем что больше нуля чтоб на ноль не поделить случайно
-        if gradient_magnitude.max() > 0:
-            gradient_magnitude = (
-                    gradient_magnitude / gradient_magnitude.max() * max_pixel_value
+        Returns:
+            np.ndarray: Яркость uint8
+        """
+        return self._rgb_to_grayscale_fixed(image, red_channel=0)
+
+    def _canny_stack(
+            self: "CustomImageProcessing",
+            gray: np.ndarray,
+            low_threshold: float,
+            high_threshold: float,
+    ) -> np.ndarray:
+        """
+        Оператор Кэнни для стопки изображений uint8 (N, H, W).
+
+        В целочисленном режиме градиенты считаются в int32, иначе в float32;
+        значения градиентов в обоих случаях целые и совпадают.
+
+        Args:
+            gray (np.ndarray): Стопка яркостей uint8
+            low_threshold (float): Нижний порог гистерезиса
+            high_threshold (float): Верхний порог гистерезиса
+
+        Returns:
+            np.ndarray: Стопка uint8 (N, H, W), границы - 255
+        """
+        if low_threshold > high_threshold:
+            low_threshold, high_threshold = high_threshold, low_threshold
+
+        no_gradients = np.empty((0, 0), dtype=np.float32)
+        edges = np.empty(gray.shape, dtype=np.uint8)
+        for index in range(gray.shape[0]):
+            edges[index] = self._canny_from_gradients(
+                gray[index], no_gradients, no_gradients, low_threshold, high_threshold,
             )
 
-        return gradient_magnitude.astype(np.uint8)
+        return edges
 
-    def corner_detection(self, image: np.ndarray) -> np.ndarray:
+    def _canny_from_gradients(
+            self: "CustomImageProcessing",
+            gray: np.ndarray,
+            gradient_x: np.ndarray,
+            gradient_y: np.ndarray,
+            low_threshold: float = canny_low_threshold,
+            high_threshold: float = canny_high_threshold,
+    ) -> np.ndarray:
+        """
+        Оператор Кэнни по яркости uint8 и, если есть, уже посчитанным градиентам.
+
+        Градиенты из _sobel_gradients (узел sobel графа операций) считаются с отражением
+        краёв, поэтому на крайних строках и столбцах они пересчитываются с повторением
+        краевых пикселей, как в cv2.Canny; результат не зависит от того, переданы ли они.
+
+        Args:
+            gray (np.ndarray): Яркость uint8 (H, W)
+            gradient_x (np.ndarray): gx (H, W) из _sobel_gradients или массив (0, 0)
+            gradient_y (np.ndarray): gy (H, W) из _sobel_gradients или массив (0, 0)
+            low_threshold (float): Нижний порог гистерезиса
+            high_threshold (float): Верхний порог гистерезиса
+
+        Returns:
+            np.ndarray: Одноканальное изображение uint8, границы - 255
+        """
+        gradient_dtype = np.int32 if self._integer_mode else np.float32
+        numba.set_num_threads(self._num_threads)
+        edge_map = self._canny_edge_map(gray, gradient_x, gradient_y, low_threshold, high_threshold, gradient_dtype)
+
+        return self._canny_hysteresis(edge_map, np.count_nonzero(edge_map))
+
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def _sobel_magnitude(gray, row_index, col_index, magnitude, gradient_x, gradient_y, store_gradients, l1_norm=False):
+        """
+        Считает градиенты Собеля и их модуль за один проход по стопке изображений.
+
+        @param gray: стопка изображений в оттенках серого (N, H, W)
+        @param row_index: таблица отражённых индексов строк (дополнение 1)
+        @param col_index: таблица отражённых индексов столбцов (дополнение 1)
+        @param magnitude: выходной массив модуля градиента
+        @param gradient_x: выходной массив gx (используется при store_gradients)
+        @param gradient_y: выходной массив gy (используется при store_gradients)
+        @param store_gradients: сохранять ли gx и gy
+        @param l1_norm: считать модуль как |gx| + |gy| (как cv2.Canny) вместо sqrt(gx^2 + gy^2)
+        @return: максимальный модуль градиента каждого изображения для нормализации
+        """
+        count, height, width = magnitude.shape
+        tiles_y = (height + tile_height - 1) // tile_height
+        tile_maxima = np.zeros((count, tiles_y), dtype=np.float64)
+
+        for tile in prange(count * tiles_y):
+            index = tile // tiles_y
+            row_start = (tile % tiles_y) * tile_height
+            tile_max = 0.0
+            image = gray[index]
+            for rows in range(row_start, min(row_start + tile_height, height)):
+                upper = row_index[rows]
+                lower = row_index[rows + 2]
+                for cols in range(width):
+                    # таблица индексов нужна только на крайних столбцах
+                    if 0 < cols < width - 1:
+                        gx, gy = _sobel_at(image, upper, rows, lower, cols - 1, cols, cols + 1)
+                    else:
+                        gx, gy = _sobel_at(image, upper, rows, lower, col_index[cols], cols, col_index[cols + 2])
+                    if l1_norm:
+                        value = abs(gx) + abs(gy)
+                    else:
+                        value = np.sqrt(gx * gx + gy * gy)
+
+                    magnitude[index, rows, cols] = value
+                    if store_gradients:
+                        gradient_x[index, rows, cols] = gx
+                        gradient_y[index, rows, cols] = gy
+                    if value > tile_max:
+                        tile_max = value
+            tile_maxima[index, tile % tiles_y] = tile_max
+
+        max_magnitudes = np.zeros(count, dtype=np.float64)
+        for index in range(count):
+            for tile in range(tiles_y):
+                max_magnitudes[index] = max(max_magnitudes[index], tile_maxima[index, tile])
+
+        return max_magnitudes
+
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def _canny_edge_map(gray, shared_x, shared_y, low_threshold, high_threshold, gradient_dtype):
+        """
+        Градиенты Собеля и подавление немаксимумов за один проход, с классификацией пикселей.
+
+        Полноразмерные массивы градиентов не создаются: каждая полоса строк
+        держит кольцевой буфер из трёх строк gx, gy и модуля |gx| + |gy|.
+        За пределами изображения модуль считается нулевым.
+
+        @param gray: изображение uint8 в оттенках серого (H, W)
+        @param shared_x: готовый gx (H, W) из _sobel_gradients или массив (0, 0) - считать по gray
+        @param shared_y: готовый gy (H, W) или массив (0, 0)
+        @param low_threshold: нижний порог
+        @param high_threshold: верхний порог
+        @param gradient_dtype: тип арифметики и буферов градиентов (np.int32 или np.float32)
+        @return: карта uint8: 0 - не граница, 1 - слабая граница, 2 - сильная граница
+        """
+        height, width = gray.shape
+        edge_map = np.zeros((height, width), dtype=np.uint8)
+        tiles_y = (height + tile_height - 1) // tile_height
+
+        for tile in prange(tiles_y):
+            row_start = tile * tile_height
+            row_end = min(row_start + tile_height, height)
+            gradient_x = np.empty((3, width), dtype=gradient_dtype)
+            gradient_y = np.empty((3, width), dtype=gradient_dtype)
+            magnitude = np.zeros((3, width), dtype=gradient_dtype)
+
+            # строка rows подавляется, когда посчитана строка rows + 1
+            for position in range(row_start - 1, row_end + 1):
+                slot = (position + 3) % 3
+                if 0 <= position < height:
+                    _canny_sobel_row(
+                        gray, shared_x, shared_y, position, gradient_x[slot], gradient_y[slot], magnitude[slot],
+                        gradient_dtype,
+                    )
+                else:
+                    magnitude[slot] = 0
+
+                rows = position - 1
+                if rows < row_start:
+                    continue
+
+                top_slot = (rows + 2) % 3
+                middle_slot = rows % 3
+                for cols in range(width):
+                    value = magnitude[middle_slot, cols]
+                    if value <= low_threshold:
+                        continue
+
+                    row_step, col_step, strict = _canny_direction(
+                        gradient_x[middle_slot, cols], gradient_y[middle_slot, cols],
+                    )
+                    before_slot = top_slot if row_step else middle_slot
+                    after_slot = slot if row_step else middle_slot
+                    before_col = cols - col_step
+                    after_col = cols + col_step
+                    before = magnitude[before_slot, before_col] if 0 <= before_col < width else 0
+                    after = magnitude[after_slot, after_col] if 0 <= after_col < width else 0
+                    if value > before and (value > after or (not strict and value == after)):
+                        edge_map[rows, cols] = 2 if value > high_threshold else 1
+
+        return edge_map
+
+    @staticmethod
+    @njit(cache=True)
+    def _canny_hysteresis(edge_map, candidates):
+        """
+        Гистерезис за линейное время: обход в глубину от сильных границ по
+        8-связным слабым. Каждый пиксель попадает в стек не более одного раза.
+
+        @param edge_map: карта из _canny_edge_map (перезаписывается результатом)
+        @param candidates: число ненулевых пикселей карты (размер стека)
+        @return: изображение uint8, границы - 255
+        """
+        height, width = edge_map.shape
+        flat_map = edge_map.ravel()
+        stack = np.empty(candidates, dtype=np.int64)
+
+        # карта почти вся нулевая: сильные пиксели ищутся по 8 байт за раз
+        size = flat_map.size
+        words = flat_map[:size - size % 8].view(np.uint64)
+        strong_bytes = np.uint64(0x0202020202020202)
+        for word in range(words.size):
+            if words[word] & strong_bytes == 0:
+                continue
+            for seed in range(8 * word, 8 * word + 8):
+                if flat_map[seed] == 2:
+                    _canny_follow_edge(flat_map, stack, seed, height, width)
+        for seed in range(8 * words.size, size):
+            if flat_map[seed] == 2:
+                _canny_follow_edge(flat_map, stack, seed, height, width)
+
+        # карта больше не нужна, переиспользуем её под результат: 3 - граница
+        for index in range(size):
+            flat_map[index] = (flat_map[index] >> 1) * 255
+
+        return edge_map
+
+    def corner_detection(self, image: np.ndarray, pyramid_levels: int = 0) -> np.ndarray:
         """
         Выполняет обнаружение углов на изображении с помощью детектора Харриса.
 
         Args:
             image (np.ndarray): Входное изображение.
+            pyramid_levels (int): Число уровней пирамиды для поиска от грубого
+             к точному (см. find_corners, 0 - полное разрешение)
 
         Returns:
             result (np.ndarray): Изображение после поиска углов
         """
-        # Конфигурационные параметры
-        harris_k = 0.04
-        corners_amount = 1000
+        local_maxima = self.find_corners(image, pyramid_levels)
+        result = self._visualize_corners(image, local_maxima)
+
+        return result
+
+    def find_corners(self, image: np.ndarray, pyramid_levels: int = 0) -> np.ndarray:
+        """
+        Находит углы детектором Харриса и возвращает их маску.
+
+        При pyramid_levels > 0 кандидаты ищутся на изображении, уменьшенном
+        в 2^pyramid_levels раз, а отклик на полном разрешении, нормализация,
+        адаптивный порог и подавление немаксимумов считаются только в плитках
+        pyramid_tile_size x pyramid_tile_size вокруг кандидатов. Углы почти
+        совпадают с полным проходом (полноту см. lab1.utils.corner_recall).
+
+        Args:
+            image (np.ndarray): Входное изображение (RGB).
+            pyramid_levels (int): Число уровней пирамиды (0 - полное разрешение)
+
+        Returns:
+            np.ndarray: Маска углов (H, W) типа bool
+        """
+        return self._find_corners(image, pyramid_levels)[0]
+
+    def corner_keypoints(
+            self,
+            image: np.ndarray,
+            max_keypoints: int | None = corners_amount,
+            pyramid_levels: int = 0,
+    ) -> np.ndarray:
+        """
+        Находит углы и возвращает их координаты без копии изображения.
+
+        Args:
+            image (np.ndarray): Входное изображение (RGB)
+            max_keypoints (int | None): Сколько углов с наибольшим откликом вернуть (None - все)
+            pyramid_levels (int): Число уровней пирамиды (см. find_corners)
+
+        Returns:
+            np.ndarray: Углы keypoints.keypoint_dtype (y, x, нормализованный отклик)
+             по убыванию отклика
+        """
+        corners_mask, r_norm = self._find_corners(image, pyramid_levels)
+
+        return keypoints.mask_to_keypoints(corners_mask, r_norm, max_keypoints)
+
+    @staticmethod
+    def draw_corners(image: np.ndarray, corners: np.ndarray) -> np.ndarray:
+        """
+        Рисует углы квадратами 3x3 на изображении на месте, как corner_detection.
+
+        Args:
+            image (np.ndarray): Изображение (H, W, 3) uint8, изменяется
+            corners (np.ndarray): Углы из corner_keypoints
+
+        Returns:
+            np.ndarray: То же изображение
+        """
+        return keypoints.draw_keypoints(image, corners, corner_color)
+
+    def _find_corners(self, image: np.ndarray, pyramid_levels: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Находит маску углов и нормализованный отклик (см. find_corners).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Маска углов (H, W) и отклик (H, W) float32;
+             при пирамидальном поиске отклик заполнен только в углах
+        """
+        factor = 2 ** pyramid_levels
+        if pyramid_levels < 0 or factor > pyramid_tile_size:
+            raise ValueError(
+                f"Число уровней пирамиды должно быть от 0 до {pyramid_tile_size.bit_length() - 1}",
+            )
+
+        # на слишком маленьком грубом уровне кандидатов не найти
+        if pyramid_levels > 0 and min(image.shape[:2]) // factor >= pyramid_tile_size:
+            return self._find_corners_pyramid(image, factor)
+
         gray_image = self._rgb_to_grayscale(image)
-        harris_response = self._compute_harris_response(gray_image, harris_k)
+
+        return self._corners_from_response(self._compute_harris_response(gray_image, harris_k))
+
+    def _corners_from_response(self, harris_response: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Выбирает углы по отклику Харриса: нормализация, адаптивный порог и подавление немаксимумов.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Маска углов (H, W) и нормализованный отклик
+        """
         r_norm = self._normalize_harris_response(harris_response)
         corner_mask = self._find_corners_with_adaptive_threshold(r_norm, corners_amount)
-        local_maxima = self._non_maximum_suppression(r_norm, corner_mask)
-        result = self._visualize_corners(image, local_maxima)
 
-        return result
+        return self._non_maximum_suppression(r_norm, corner_mask, self._suppression_radius), r_norm
+
+    def _find_corners_pyramid(self, image: np.ndarray, factor: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Пирамидальный поиск углов (см. find_corners).
+
+        Args:
+            image (np.ndarray): Входное изображение (RGB)
+            factor (int): Во сколько раз уменьшено изображение грубого уровня
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Маска углов (H, W) типа bool и нормализованный
+             отклик (H, W), заполненный только в углах
+        """
+        height, width = image.shape[:2]
+        image = np.ascontiguousarray(image)
+        numba.set_num_threads(self._num_threads)
+
+        # усреднение размывает углы сильнее, чем границы, поэтому порог кандидатов
+        # намного ниже порога углов; минимум отклика тоже берётся в окно, чтобы
+        # нормализация совпадала с полным проходом
+        coarse_response = self._compute_harris_response(self._downscale_grayscale(image, factor), harris_k)
+        coarse_mask = coarse_response > pyramid_candidate_ratio * coarse_response.max()
+        coarse_mask.flat[np.argmin(coarse_response)] = True
+
+        # окно кандидата: его блок и по одному блоку грубого уровня с каждой стороны,
+        # плюс радиус подавления немаксимумов; сетка грубого уровня дополняется до целых
+        # плиток, расширяется на окно и сводится к плиткам
+        reach = -(-(factor + self._suppression_radius) // factor)
+        block = pyramid_tile_size // factor
+        tiles_y = (height + pyramid_tile_size - 1) // pyramid_tile_size
+        tiles_x = (width + pyramid_tile_size - 1) // pyramid_tile_size
+        grid = np.zeros((tiles_y * block, tiles_x * block), dtype=np.bool_)
+        grid[:coarse_mask.shape[0], :coarse_mask.shape[1]] = coarse_mask
+        grid = self._dilate_mask(grid, reach)
+        active = grid.reshape(tiles_y, block, tiles_x, block).any(axis=(1, 3))
+
+        tile_rows, tile_cols = np.nonzero(active)
+        tile_map = np.full((tiles_y, tiles_x), -1, dtype=np.int64)
+        tile_map[tile_rows, tile_cols] = np.arange(tile_rows.size)
+
+        row_index = self._reflect_indices(height, 1)
+        col_index = self._reflect_indices(width, 1)
+        response = self._harris_response_tiles(image, row_index, col_index, harris_k, tile_rows, tile_cols)
+
+        # нормализация и порог - по посчитанным пикселям, как _normalize_harris_response
+        # и _find_adaptive_threshold по всему изображению
+        computed = response[np.isfinite(response)]
+        min_value, max_value = computed.min(), computed.max()
+        threshold = self._find_adaptive_threshold(
+            self._normalize_with_range(computed, min_value, max_value), corners_amount,
+        )
+        r_norm = self._normalize_with_range(response, min_value, max_value)
+
+        corners_mask = np.zeros((height, width), dtype=np.bool_)
+        # np.zeros не трогает страницы памяти, пока в них не пишут, а пишутся только углы
+        corners_response = np.zeros((height, width), dtype=r_norm.dtype)
+        self._non_maximum_suppression_tiles(
+            r_norm, threshold, tile_map, tile_rows, tile_cols, self._suppression_radius, corners_mask,
+            corners_response,
+        )
+
+        return corners_mask, corners_response
+
+    @staticmethod
+    def _dilate_mask(mask: np.ndarray, reach: int) -> np.ndarray:
+        """Расширяет маску квадратом (2 * reach + 1) x (2 * reach + 1)."""
+        rows_dilated = mask.copy()
+        for shift in range(1, reach + 1):
+            rows_dilated[shift:] |= mask[:-shift]
+            rows_dilated[:-shift] |= mask[shift:]
+
+        dilated = rows_dilated.copy()
+        for shift in range(1, reach + 1):
+            dilated[:, shift:] |= rows_dilated[:, :-shift]
+            dilated[:, :-shift] |= rows_dilated[:, shift:]
+
+        return dilated
+
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def _downscale_grayscale(image, factor):
+        """
+        Переводит изображение в оттенки серого и уменьшает усреднением блоков factor x factor.
+
+        @param image: изображение (H, W, 3), нулевой канал - красный, как в _rgb_to_grayscale
+        @param factor: размер блока
+        @return: уменьшенное изображение float32 (H // factor, W // factor)
+        """
+        coarse_height = image.shape[0] // factor
+        coarse_width = image.shape[1] // factor
+        coarse = np.empty((coarse_height, coarse_width), dtype=np.float32)
+        block_area = factor * factor
+
+        # яркость линейна по каналам, поэтому достаточно усреднить каналы блока
+        for coarse_row in prange(coarse_height):
+            sums = np.zeros((coarse_width, 3), dtype=np.float64)
+            for rows in range(coarse_row * factor, (coarse_row + 1) * factor):
+                for coarse_col in range(coarse_width):
+                    for cols in range(coarse_col * factor, (coarse_col + 1) * factor):
+                        for channel in range(3):
+                            sums[coarse_col, channel] += image[rows, cols, channel]
+            for coarse_col in range(coarse_width):
+                value = (
+                        red_coefficient * sums[coarse_col, 0]
+                        + green_coefficient * sums[coarse_col, 1]
+                        + blue_coefficient * sums[coarse_col, 2]
+                ) / block_area
+                coarse[coarse_row, coarse_col] = min(max(value, 0.0), max_pixel_value)
+
+        return coarse
+
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def _harris_response_tiles(image, row_index, col_index, harris_coefficient, tile_rows, tile_cols):
+        """
+        Считает отклик Харриса в выбранных плитках pyramid_tile_size x pyramid_tile_size.
+
+        Яркость считается прямо из пикселей только для плитки с перекрытием, порядок
+        вычислений тот же, что в _rgb_to_grayscale и _harris_response, поэтому
+        значения совпадают с откликом, посчитанным по всему изображению.
+
+        @param image: изображение (H, W, 3) uint8
+        @param row_index: таблица отражённых индексов строк (дополнение 1)
+        @param col_index: таблица отражённых индексов столбцов (дополнение 1)
+        @param harris_coefficient: коэффициент k детектора Харриса
+        @param tile_rows: номера строк плиток
+        @param tile_cols: номера столбцов плиток
+        @return: отклик (число плиток, размер плитки, размер плитки); вне изображения -inf
+        """
+        height, width = image.shape[:2]
+        side_weight = gaussian_weights[0]
+        center_weight = gaussian_weights[1]
+        response = np.full((tile_rows.size, pyramid_tile_size, pyramid_tile_size), -np.inf, dtype=np.float32)
+
+        for tile in prange(tile_rows.size):
+            row_start = tile_rows[tile] * pyramid_tile_size
+            col_start = tile_cols[tile] * pyramid_tile_size
+            rows_in_tile = min(row_start + pyramid_tile_size, height) - row_start
+            cols_in_tile = min(col_start + pyramid_tile_size, width) - col_start
+
+            # яркость плитки с перекрытием в 2 пикселя (Собель и сглаживание)
+            first_row = max(row_start - 2, 0)
+            first_col = max(col_start - 2, 0)
+            last_row = min(row_start + rows_in_tile + 1, height - 1)
+            last_col = min(col_start + cols_in_tile + 1, width - 1)
+            gray = np.empty((last_row - first_row + 1, last_col - first_col + 1), dtype=np.float32)
+            for rows in range(first_row, last_row + 1):
+                for cols in range(first_col, last_col + 1):
+                    gray[rows - first_row, cols - first_col] = _gray_at(image, rows, cols)
+
+            # products[channel, i, j] - произведения градиентов в позиции (row_start + i,
+            # col_start + j) изображения, дополненного на 1 пиксель
+            products = np.empty((3, rows_in_tile + 2, cols_in_tile + 2), dtype=np.float32)
+            for i in range(rows_in_tile + 2):
+                source = row_index[row_start + i]
+                upper = row_index[source] - first_row
+                lower = row_index[source + 2] - first_row
+                for j in range(cols_in_tile + 2):
+                    # таблица индексов нужна только у краёв изображения
+                    if 2 <= col_start + j <= width - 1:
+                        cols = col_start + j - 1 - first_col
+                        gx, gy = _sobel_at(gray, upper, source - first_row, lower, cols - 1, cols, cols + 1)
+                    else:
+                        cols = col_index[col_start + j]
+                        gx, gy = _sobel_at(
+                            gray, upper, source - first_row, lower,
+                            col_index[cols] - first_col, cols - first_col, col_index[cols + 2] - first_col,
+                        )
+                    products[0, i, j] = gx * gx
+                    products[1, i, j] = gy * gy
+                    products[2, i, j] = gx * gy
+
+            smoothed = np.empty((3, rows_in_tile + 2, cols_in_tile), dtype=np.float32)
+            for channel in range(3):
+                for i in range(rows_in_tile + 2):
+                    for j in range(cols_in_tile):
+                        smoothed[channel, i, j] = (
+                                side_weight * products[channel, i, j]
+                                + center_weight * products[channel, i, j + 1]
+                                + side_weight * products[channel, i, j + 2]
+                        )
+
+            for i in range(rows_in_tile):
+                for j in range(cols_in_tile):
+                    smoothed_xx = (
+                            side_weight * smoothed[0, i, j]
+                            + center_weight * smoothed[0, i + 1, j]
+                            + side_weight * smoothed[0, i + 2, j]
+                    )
+                    smoothed_yy = (
+                            side_weight * smoothed[1, i, j]
+                            + center_weight * smoothed[1, i + 1, j]
+                            + side_weight * smoothed[1, i + 2, j]
+                    )
+                    smoothed_xy = (
+                            side_weight * smoothed[2, i, j]
+                            + center_weight * smoothed[2, i + 1, j]
+                            + side_weight * smoothed[2, i + 2, j]
+                    )
+
+                    determinant = smoothed_xx * smoothed_yy - smoothed_xy * smoothed_xy
+                    trace = smoothed_xx + smoothed_yy
+                    response[tile, i, j] = determinant - harris_coefficient * trace * trace
+
+        return response
+
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def _non_maximum_suppression_tiles(
+            normalized_response, threshold, tile_map, tile_rows, tile_cols, radius, corners_mask, corners_response,
+    ):
+        """
+        Подавление немаксимумов для отклика, посчитанного только в плитках.
+
+        Соседи из непосчитанных плиток считаются меньше кандидата; как и в
+        _non_maximum_suppression, пиксели ближе radius к краю изображения пропускаются.
+
+        @param normalized_response: нормализованный отклик плиток (число плиток, размер, размер)
+        @param threshold: порог отклика для кандидатов в углы
+        @param tile_map: номер плитки по её положению или -1
+        @param tile_rows: номера строк плиток
+        @param tile_cols: номера столбцов плиток
+        @param radius: радиус окна сравнения
+        @param corners_mask: выходная маска углов (H, W), заполняется на месте
+        @param corners_response: выходной отклик (H, W), заполняется на месте в углах
+        """
+        height, width = corners_mask.shape
+
+        for tile in prange(tile_rows.size):
+            row_start = tile_rows[tile] * pyramid_tile_size
+            col_start = tile_cols[tile] * pyramid_tile_size
+            for i in range(pyramid_tile_size):
+                row = row_start + i
+                if row < radius or row >= height - radius:
+                    continue
+                for j in range(pyramid_tile_size):
+                    col = col_start + j
+                    value = normalized_response[tile, i, j]
+                    if col < radius or col >= width - radius or not value > threshold:
+                        continue
+
+                    is_maximum = True
+                    for neighbor_row in range(row - radius, row + radius + 1):
+                        for neighbor_col in range(col - radius, col + radius + 1):
+                            neighbor_tile = tile_map[neighbor_row // pyramid_tile_size,
+                                                     neighbor_col // pyramid_tile_size]
+                            if neighbor_tile < 0:
+                                continue
+                            neighbor = normalized_response[neighbor_tile,
+                                                           neighbor_row % pyramid_tile_size,
+                                                           neighbor_col % pyramid_tile_size]
+                            if neighbor > value:
+                                is_maximum = False
+                                break
+                        if not is_maximum:
+                            break
+
+                    if is_maximum:
+                        corners_mask[row, col] = True
+                        corners_response[row, col] = value
 
     def _compute_harris_response(
             self,
@@ -223,59 +1465,280 @@ class CustomImageProcessing(interfaces.IImageProcessing):
             harris_coefficient: float,
     ) -> np.ndarray:
         """Вычисляет отклик Харриса для изображения в градациях серого."""
-        gradient_x = self._convolution(gray_image, sobel_kernel_x)
-        gradient_y = self._convolution(gray_image, sobel_kernel_y)
+        row_index = self._reflect_indices(gray_image.shape[0], 1)
+        col_index = self._reflect_indices(gray_image.shape[1], 1)
+        numba.set_num_threads(self._num_threads)
 
-        gradient_xx = gradient_x * gradient_x
-        gradient_yy = gradient_y * gradient_y
-        gradient_xy = gradient_x * gradient_y
+        return self._harris_response(gray_image, row_index, col_index, harris_coefficient)
 
-        smoothed_xx = self._convolution(gradient_xx, gaussian_kernel)
-        smoothed_yy = self._convolution(gradient_yy, gaussian_kernel)
-        smoothed_xy = self._convolution(gradient_xy, gaussian_kernel)
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def _harris_response(gray, row_index, col_index, harris_coefficient):
+        """
+        Считает отклик Харриса за один проход: градиенты Собеля, их произведения,
+        сглаживание окном Гаусса 3x3 и det - k * trace^2.
 
-        determinant = smoothed_xx * smoothed_yy - smoothed_xy * smoothed_xy
-        trace = smoothed_xx + smoothed_yy
-        harris_response = determinant - harris_coefficient * trace * trace
+        Полноразмерные промежуточные массивы не создаются: каждая полоса строк
+        держит кольцевой буфер из трёх строк произведений градиентов.
 
-        return harris_response
+        @param gray: изображение в оттенках серого
+        @param row_index: таблица отражённых индексов строк (дополнение 1)
+        @param col_index: таблица отражённых индексов столбцов (дополнение 1)
+        @param harris_coefficient: коэффициент k детектора Харриса
+        @return: отклик Харриса
+        """
+        height, width = gray.shape
+        response = np.empty((height, width), dtype=np.float32)
+        tiles_y = (height + tile_height - 1) // tile_height
+        side_weight = gaussian_weights[0]
+        center_weight = gaussian_weights[1]
+
+        for tile in prange(tiles_y):
+            row_start = tile * tile_height
+            row_end = min(row_start + tile_height, height)
+
+            # products - xx, yy, xy одной строки; ring - три последние строки,
+            # уже сглаженные по горизонтали
+            products = np.empty((3, width), dtype=np.float32)
+            ring = np.empty((3, 3, width), dtype=np.float32)
+
+            # позиция в изображении, дополненном на 1 строку: строка rows
+            # сглаживается по позициям rows, rows + 1 и rows + 2
+            for position in range(row_start, row_end + 2):
+                source = row_index[position]
+                upper = row_index[source]
+                lower = row_index[source + 2]
+                for cols in range(width):
+                    if 0 < cols < width - 1:
+                        gx, gy = _sobel_at(gray, upper, source, lower, cols - 1, cols, cols + 1)
+                    else:
+                        gx, gy = _sobel_at(gray, upper, source, lower, col_index[cols], cols, col_index[cols + 2])
+                    products[0, cols] = gx * gx
+                    products[1, cols] = gy * gy
+                    products[2, cols] = gx * gy
+
+                slot = position % 3
+                for channel in range(3):
+                    for cols in range(width):
+                        ring[slot, channel, cols] = (
+                                side_weight * products[channel, col_index[cols]]
+                                + center_weight * products[channel, cols]
+                                + side_weight * products[channel, col_index[cols + 2]]
+                        )
+
+                if position < row_start + 2:
+                    continue
+
+                rows = position - 2
+                top_slot = rows % 3
+                middle_slot = (rows + 1) % 3
+                for cols in range(width):
+                    smoothed_xx = (
+                            side_weight * ring[top_slot, 0, cols]
+                            + center_weight * ring[middle_slot, 0, cols]
+                            + side_weight * ring[slot, 0, cols]
+                    )
+                    smoothed_yy = (
+                            side_weight * ring[top_slot, 1, cols]
+                            + center_weight * ring[middle_slot, 1, cols]
+                            + side_weight * ring[slot, 1, cols]
+                    )
+                    smoothed_xy = (
+                            side_weight * ring[top_slot, 2, cols]
+                            + center_weight * ring[middle_slot, 2, cols]
+                            + side_weight * ring[slot, 2, cols]
+                    )
+
+                    determinant = smoothed_xx * smoothed_yy - smoothed_xy * smoothed_xy
+                    trace = smoothed_xx + smoothed_yy
+                    response[rows, cols] = determinant - harris_coefficient * trace * trace
+
+        return response
+
+    def _compute_sobel_gradients(self, gray: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Считает градиенты Собеля gx и gy (float32) с отражением краёв, как в _harris_response."""
+        row_index = self._reflect_indices(gray.shape[0], 1)
+        col_index = self._reflect_indices(gray.shape[1], 1)
+        numba.set_num_threads(self._num_threads)
+
+        return self._sobel_gradients(gray, row_index, col_index)
+
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def _sobel_gradients(gray, row_index, col_index):
+        """
+        Считает градиенты Собеля по изображению в оттенках серого.
+
+        @param gray: изображение в оттенках серого (H, W): uint8 или float32
+        @param row_index: таблица отражённых индексов строк (дополнение 1)
+        @param col_index: таблица отражённых индексов столбцов (дополнение 1)
+        @return: gx и gy float32 (H, W)
+        """
+        height, width = gray.shape
+        gradient_x = np.empty((height, width), dtype=np.float32)
+        gradient_y = np.empty((height, width), dtype=np.float32)
+
+        for rows in prange(height):
+            upper = row_index[rows]
+            lower = row_index[rows + 2]
+            for cols in range(width):
+                if 0 < cols < width - 1:
+                    gx, gy = _sobel_at(gray, upper, rows, lower, cols - 1, cols, cols + 1)
+                else:
+                    gx, gy = _sobel_at(gray, upper, rows, lower, col_index[cols], cols, col_index[cols + 2])
+                gradient_x[rows, cols] = gx
+                gradient_y[rows, cols] = gy
+
+        return gradient_x, gradient_y
+
+    def _compute_harris_response_gradients(
+            self,
+            gradient_x: np.ndarray,
+            gradient_y: np.ndarray,
+            harris_coefficient: float,
+    ) -> np.ndarray:
+        """Вычисляет отклик Харриса по уже посчитанным градиентам Собеля."""
+        row_index = self._reflect_indices(gradient_x.shape[0], 1)
+        col_index = self._reflect_indices(gradient_x.shape[1], 1)
+        numba.set_num_threads(self._num_threads)
+
+        return self._harris_response_gradients(gradient_x, gradient_y, row_index, col_index, harris_coefficient)
+
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def _harris_response_gradients(gradient_x, gradient_y, row_index, col_index, harris_coefficient):
+        """
+        Считает отклик Харриса по градиентам Собеля тем же порядком операций,
+        что и _harris_response, поэтому результат совпадает с ним.
+
+        @param gradient_x: градиент по x (H, W)
+        @param gradient_y: градиент по y (H, W)
+        @param row_index: таблица отражённых индексов строк (дополнение 1)
+        @param col_index: таблица отражённых индексов столбцов (дополнение 1)
+        @param harris_coefficient: коэффициент k детектора Харриса
+        @return: отклик Харриса
+        """
+        height, width = gradient_x.shape
+        response = np.empty((height, width), dtype=np.float32)
+        tiles_y = (height + tile_height - 1) // tile_height
+        side_weight = gaussian_weights[0]
+        center_weight = gaussian_weights[1]
+
+        for tile in prange(tiles_y):
+            row_start = tile * tile_height
+            row_end = min(row_start + tile_height, height)
+            products = np.empty((3, width), dtype=np.float32)
+            ring = np.empty((3, 3, width), dtype=np.float32)
+
+            for position in range(row_start, row_end + 2):
+                source = row_index[position]
+                for cols in range(width):
+                    gx = gradient_x[source, cols]
+                    gy = gradient_y[source, cols]
+                    products[0, cols] = gx * gx
+                    products[1, cols] = gy * gy
+                    products[2, cols] = gx * gy
+
+                slot = position % 3
+                for channel in range(3):
+                    for cols in range(width):
+                        ring[slot, channel, cols] = (
+                                side_weight * products[channel, col_index[cols]]
+                                + center_weight * products[channel, cols]
+                                + side_weight * products[channel, col_index[cols + 2]]
+                        )
+
+                if position < row_start + 2:
+                    continue
+
+                rows = position - 2
+                top_slot = rows % 3
+                middle_slot = (rows + 1) % 3
+                for cols in range(width):
+                    smoothed_xx = (
+                            side_weight * ring[top_slot, 0, cols]
+                            + center_weight * ring[middle_slot, 0, cols]
+                            + side_weight * ring[slot, 0, cols]
+                    )
+                    smoothed_yy = (
+                            side_weight * ring[top_slot, 1, cols]
+                            + center_weight * ring[middle_slot, 1, cols]
+                            + side_weight * ring[slot, 1, cols]
+                    )
+                    smoothed_xy = (
+                            side_weight * ring[top_slot, 2, cols]
+                            + center_weight * ring[middle_slot, 2, cols]
+                            + side_weight * ring[slot, 2, cols]
+                    )
+
+                    determinant = smoothed_xx * smoothed_yy - smoothed_xy * smoothed_xy
+                    trace = smoothed_xx + smoothed_yy
+                    response[rows, cols] = determinant - harris_coefficient * trace * trace
+
+        return response
 
     @staticmethod
     def _normalize_harris_response(harris_response: np.ndarray) -> np.ndarray:
         """Нормализует отклик Харриса к диапазону [0, 1]."""
-        min_value = np.min(harris_response)
-        max_value = np.max(harris_response)
-
-        if max_value - min_value > 0:
-            return (harris_response - min_value) / (max_value - min_value)
-        else:
-            return np.zeros_like(harris_response)
+        return CustomImageProcessing._normalize_with_range(
+            harris_response, np.min(harris_response), np.max(harris_response),
+        )
 
     @staticmethod
-    @njit
     def _find_adaptive_threshold(
             response_norm: np.ndarray,
             target_corners_number: int,
     ) -> float:
         """
         Получаем динамический порог основываясь на нужном числе углом
+        Вместо полной сортировки используется выбор k-го элемента (np.partition) за O(n)
         @param response_norm: норма от отклика харриса
         @param target_corners_number: число углов которое нужно
         @return: порог, который даст необходимое число углов
         """
-        flat_response_list = response_norm.flatten()
-        sorted_response = np.sort(flat_response_list)[::-1]
+        flat_response = response_norm.ravel()
+        size = flat_response.size
 
         # Если углов много, берем значение, которое находится на target_corners_number
-        # Если углов мало, берем самое маленькое значение.
+        # (в порядке убывания). Если углов мало, берем самое маленькое значение.
         # Если углов вообще нет, берем 0.5 потому что можем
 
-        if len(sorted_response) > target_corners_number:
-            threshold = sorted_response[target_corners_number]
+        if size > target_corners_number:
+            kth = size - 1 - target_corners_number
+            threshold = np.partition(flat_response, kth)[kth]
         else:
-            threshold = sorted_response[-1] if len(sorted_response) > 0 else 0.5
+            threshold = flat_response.min() if size > 0 else 0.5
+
+        return float(max(0.1, min(0.9, threshold)))
+
+    @staticmethod
+    def _find_top_corners(
+            response_norm: np.ndarray,
+            top_k: int,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Возвращает координаты top_k пикселей с наибольшим откликом без полной сортировки.
+
+        Args:
+            response_norm (np.ndarray): Нормализованный отклик Харриса
+            top_k (int): Сколько пикселей вернуть
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Строки, столбцы и значения отклика,
+             упорядоченные по убыванию отклика
+        """
+        flat_response = response_norm.ravel()
+        top_k = min(top_k, flat_response.size)
+        if top_k <= 0:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty, np.empty(0, dtype=response_norm.dtype)
 
-        return max(0.1, min(0.9, threshold))
+        candidates = np.argpartition(flat_response, flat_response.size - top_k)[-top_k:]
+        order = np.argsort(flat_response[candidates], kind="stable")[::-1]
+        flat_indices = candidates[order]
+        rows, cols = np.unravel_index(flat_indices, response_norm.shape)
+
+        return rows, cols, flat_response[flat_indices]
 
     def _find_corners_with_adaptive_threshold(
             self,
@@ -290,27 +1753,45 @@ class CustomImageProcessing(interfaces.IImageProcessing):
         return normalized_response > threshold
 
     @staticmethod
-    def _non_maximum_suppression(
-            normalized_response: np.ndarray,
-            corners_mask: np.ndarray,
-    ) -> np.ndarray:
-        """Применяет подавление немаксимумов для устранения дубликатов углов."""
-        height, width = normalized_response.shape
-        local_maxima_mask = np.zeros_like(corners_mask, dtype=bool)
+    @njit(parallel=True, cache=True)
+    def _non_maximum_suppression(normalized_response, corners_mask, radius=1):
+        """
+        Применяет подавление немаксимумов для устранения дубликатов углов.
+
+        @param normalized_response: нормализованный отклик Харриса
+        @param corners_mask: маска кандидатов в углы
+        @param radius: радиус окна сравнения (1 - окно 3x3, 2 - 5x5, 3 - 7x7)
+        @return: маска локальных максимумов
+        """
+        if radius < 1:
+            raise ValueError("Радиус окна подавления немаксимумов должен быть >= 1")
 
-        for row in range(1, height - 1):
-            for col in range(1, width - 1):
-                if corners_mask[row, col]:
-                    # берем область 3x3 вокруг текущего пикселя
-                    # это окно для сравнения силы угла с соседями
-                    neighborhood = normalized_response[row - 1: row + 2, col - 1: col + 2]
-                    if normalized_response[row, col] == np.max(neighborhood):
-                        local_maxima_mask[row, col] = True
+        height, width = normalized_response.shape
+        local_maxima_mask = np.zeros(corners_mask.shape, dtype=np.bool_)
+
+        for row in prange(radius, height - radius):
+            for col in range(radius, width - radius):
+                if not corners_mask[row, col]:
+                    continue
+
+                # берем область (2r+1)x(2r+1) вокруг текущего пикселя
+                # это окно для сравнения силы угла с соседями
+                value = normalized_response[row, col]
+                is_maximum = True
+                for neighbor_row in range(row - radius, row + radius + 1):
+                    for neighbor_col in range(col - radius, col + radius + 1):
+                        if normalized_response[neighbor_row, neighbor_col] > value:
+                            is_maximum = False
+                            break
+                    if not is_maximum:
+                        break
+
+                local_maxima_mask[row, col] = is_maximum
 
         return local_maxima_mask
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def _visualize_corners(image: np.ndarray, corners_mask: np.ndarray) -> np.ndarray:
         """Визуализирует найденные углы на изображении."""
         result_image = image.copy().astype(np.uint8)
@@ -332,20 +1813,614 @@ class CustomImageProcessing(interfaces.IImageProcessing):
 
         return result_image
 
+    def operator_graph(self) -> OperatorGraph:
+        """
+        Граф операций для run_methods.
+
+        Узлы: gray - яркость uint8 (общая для всех методов, см. _rgb_to_grayscale);
+        sobel - градиенты Собеля gx и gy; harris - отклик Харриса по этим градиентам;
+        edges, corners, circles - результаты edge_detection, corner_detection и
+        circle_detection. Границы и углы используют одни и те же градиенты.
+
+        Returns:
+            OperatorGraph: Граф операций
+        """
+        def corners(image: np.ndarray, harris_response: np.ndarray) -> np.ndarray:
+            corners_mask, _ = self._corners_from_response(harris_response)
+            return self._visualize_corners(image, corners_mask)
+
+        def circles(image: np.ndarray, gray: np.ndarray) -> np.ndarray:
+            return self._visualize_circles(image, self._find_circles_gray(gray.astype(np.float32)))
+
+        return OperatorGraph([
+            Operator("gray", ("image",), self._canny_grayscale),
+            Operator("sobel", ("gray",), self._compute_sobel_gradients),
+            Operator(
+                "harris", ("sobel",),
+                lambda gradients: self._compute_harris_response_gradients(*gradients, harris_k),
+            ),
+            Operator("edges", ("gray", "sobel"), lambda gray, gradients: self._canny_from_gradients(gray, *gradients)),
+            Operator("corners", ("image", "harris"), corners),
+            Operator("circles", ("image", "gray"), circles),
+        ])
+
+    def run_methods(self, image: np.ndarray, methods: Iterable[str]) -> dict[str, np.ndarray]:
+        """
+        Считает несколько результатов за один проход графа операций.
+
+        Общие узлы (оттенки серого, градиенты Собеля) считаются один раз,
+        промежуточные массивы освобождаются после последнего потребителя.
+        Результаты совпадают с edge_detection, corner_detection и circle_detection.
+
+        Args:
+            image (np.ndarray): Входное изображение (RGB)
+            methods (Iterable[str]): Имена узлов: edges, corners, circles (см. operator_graph)
+
+        Returns:
+            dict[str, np.ndarray]: Результаты по именам
+        """
+        return self.operator_graph().run(image, methods)
+
+    def edge_detection_tiled(
+            self: "CustomImageProcessing",
+            image: np.ndarray,
+            output: np.ndarray,
+            strip_height: int = tiled_strip_height,
+    ) -> np.ndarray:
+        """
+        Выполняет edge_detection по горизонтальным полосам для изображений больше памяти.
+
+        Изображение и результат обычно отображены в память (np.memmap), поэтому
+        в памяти одновременно находится только одна полоса с перекрытием в 2 строки
+        (градиенты и подавление немаксимумов). Первый проход пишет в output карту
+        слабых и сильных границ, второй - гистерезис по всему output на месте:
+        связность границ не ограничена полосой. Результат совпадает с edge_detection
+        для всего изображения.
+
+        Args:
+            image (np.ndarray): Входное изображение (H, W, 3), например np.memmap
+            output (np.ndarray): Выходной массив uint8 формы (H, W), например np.memmap
+            strip_height (int): Число строк результата в одной полосе
+
+        Returns:
+            np.ndarray: Массив output с выделенными границами
+        """
+        height, width = self._check_tiled_arrays(image, output, image.shape[:2], strip_height)
+        halo = 2
+        no_gradients = np.empty((0, 0), dtype=np.float32)
+        gradient_dtype = np.int32 if self._integer_mode else np.float32
+        numba.set_num_threads(self._num_threads)
+
+        for row_start in range(0, height, strip_height):
+            row_stop = min(row_start + strip_height, height)
+            strip_start, strip_stop = self._strip_bounds(height, row_start, row_stop, halo)
+            gray = self._canny_grayscale(image[strip_start:strip_stop])
+            edge_map = self._canny_edge_map(
+                gray, no_gradients, no_gradients, canny_low_threshold, canny_high_threshold, gradient_dtype,
+            )
+            # строки перекрытия посчитаны с неполными соседями и отбрасываются
+            output[row_start:row_stop] = edge_map[row_start - strip_start:row_stop - strip_start]
+
+        # np.asarray не копирует np.memmap, гистерезис идёт прямо по отображённому файлу
+        edge_map = np.asarray(output)
+        self._canny_hysteresis(edge_map, np.count_nonzero(edge_map))
+
+        if isinstance(output, np.memmap):
+            output.flush()
+
+        return output
+
+    def corner_detection_tiled(
+            self: "CustomImageProcessing",
+            image: np.ndarray,
+            output: np.ndarray,
+            strip_height: int = tiled_strip_height,
+    ) -> np.ndarray:
+        """
+        Выполняет corner_detection по горизонтальным полосам для изображений больше памяти.
+
+        Первый проход собирает по полосам минимум и максимум отклика Харриса и
+        corners_amount + 1 наибольших значений, из которых получается тот же
+        адаптивный порог, что и для всего изображения. Второй проход пересчитывает
+        отклик с перекрытием полос (сглаживание, подавление немаксимумов и рисование
+        квадратов 3x3) и пишет результат. Результат совпадает с corner_detection.
+
+        Args:
+            image (np.ndarray): Входное изображение (H, W, 3), например np.memmap
+            output (np.ndarray): Выходной массив uint8 формы (H, W, 3), например np.memmap
+            strip_height (int): Число строк результата в одной полосе
+
+        Returns:
+            np.ndarray: Массив output с выделенными углами
+        """
+        height, width = self._check_tiled_arrays(image, output, image.shape, strip_height)
+        image_row_index = self._reflect_indices(height, 1)
+        col_index = self._reflect_indices(width, 1)
+        radius = self._suppression_radius
+
+        def strip_response(strip_start, strip_stop):
+            gray = self._strip_grayscale(image[strip_start:strip_stop])
+            row_index = self._strip_row_indices(image_row_index, strip_start, strip_stop)
+            return self._harris_response(gray, row_index, col_index, harris_k)
+
+        # первый проход: минимум, максимум и наибольшие значения отклика
+        min_value = max_value = None
+        largest = np.empty(0, dtype=np.float32)
+        for row_start in range(0, height, strip_height):
+            row_stop = min(row_start + strip_height, height)
+            # сглаженный отклик зависит от строк на расстоянии до 2
+            strip_start, strip_stop = self._strip_bounds(height, row_start, row_stop, 2)
+            response = strip_response(strip_start, strip_stop)[row_start - strip_start:row_stop - strip_start]
+            strip_min, strip_max = response.min(), response.max()
+            min_value = strip_min if min_value is None else min(min_value, strip_min)
+            max_value = strip_max if max_value is None else max(max_value, strip_max)
+            largest = self._merge_largest(largest, response.ravel(), corners_amount + 1)
+
+        threshold = self._tiled_corner_threshold(largest, height * width, min_value, max_value)
+
+        # второй проход: квадрат угла задевает соседнюю строку, подавление немаксимумов -
+        # ещё radius строк, отклик Харриса - ещё 2 строки
+        halo = 1 + radius + 2
+        numba.set_num_threads(self._num_threads)
+        for row_start in range(0, height, strip_height):
+            row_stop = min(row_start + strip_height, height)
+            strip_start, strip_stop = self._strip_bounds(height, row_start, row_stop, halo)
+            r_norm = self._normalize_with_range(strip_response(strip_start, strip_stop), min_value, max_value)
+            local_maxima = self._non_maximum_suppression(r_norm, r_norm > threshold, radius)
+
+            mask_start, mask_stop = self._strip_bounds(height, row_start, row_stop, 1)
+            result = self._visualize_corners(
+                np.ascontiguousarray(image[mask_start:mask_stop]),
+                local_maxima[mask_start - strip_start:mask_stop - strip_start],
+            )
+            output[row_start:row_stop] = result[row_start - mask_start:row_stop - mask_start]
+
+        if isinstance(output, np.memmap):
+            output.flush()
+
+        return output
+
+    @staticmethod
+    def _check_tiled_arrays(
+            image: np.ndarray,
+            output: np.ndarray,
+            output_shape: tuple[int, ...],
+            strip_height: int,
+    ) -> tuple[int, int]:
+        """Проверяет входной и выходной массивы полосовой обработки, возвращает (H, W)."""
+        if image.ndim != 3:
+            raise ValueError(f"Ожидается изображение формы (H, W, 3), получено {image.shape}")
+        if output.shape != tuple(output_shape) or output.dtype != np.uint8:
+            raise ValueError(
+                f"Ожидается выходной массив uint8 формы {tuple(output_shape)}, "
+                f"получено {output.dtype} {output.shape}",
+            )
+        if strip_height < 1:
+            raise ValueError("Высота полосы должна быть >= 1")
+
+        return image.shape[0], image.shape[1]
+
+    @staticmethod
+    def _strip_bounds(height: int, row_start: int, row_stop: int, halo: int) -> tuple[int, int]:
+        """Границы полосы [row_start, row_stop) вместе с перекрытием halo строк."""
+        return max(row_start - halo, 0), min(row_stop + halo, height)
+
+    @staticmethod
+    def _strip_row_indices(row_index: np.ndarray, strip_start: int, strip_stop: int) -> np.ndarray:
+        """
+        Таблица индексов строк (дополнение 1) для полосы [strip_start, strip_stop).
+
+        На краях изображения индексы берутся из таблицы всего изображения.
+        На краях полосы внутри изображения соседей нет, поэтому индексы
+        прижимаются к полосе; такие строки затем отбрасываются.
+
+        Args:
+            row_index (np.ndarray): Таблица индексов строк всего изображения (дополнение 1)
+            strip_start (int): Первая строка полосы
+            strip_stop (int): Строка после последней строки полосы
+
+        Returns:
+            np.ndarray: Индексы строк внутри полосы
+        """
+        row_index = row_index[strip_start:strip_stop + 2]
+        return np.clip(row_index, strip_start, strip_stop - 1) - strip_start
+
+    def _strip_grayscale(self: "CustomImageProcessing", strip: np.ndarray) -> np.ndarray:
+        """Переводит полосу изображения в оттенки серого, результат формы (h, W) float32."""
+        gray = self._rgb_to_grayscale(strip)
+        numba.set_num_threads(self._num_threads)
+
+        return gray
+
+    @staticmethod
+    def _merge_largest(largest: np.ndarray, values: np.ndarray, count: int) -> np.ndarray:
+        """Оставляет count наибольших значений из объединения largest и values."""
+        merged = np.concatenate((largest, values))
+        if merged.size <= count:
+            return merged
+
+        return np.partition(merged, merged.size - count)[-count:]
+
+    def _tiled_corner_threshold(
+            self: "CustomImageProcessing",
+            largest: np.ndarray,
+            size: int,
+            min_value: np.float32,
+            max_value: np.float32,
+    ) -> float:
+        """
+        Адаптивный порог углов по наибольшим значениям отклика всех полос.
+
+        Нормализация монотонна, поэтому (corners_amount + 1)-е по величине значение
+        нормализованного отклика - это нормализованное (corners_amount + 1)-е значение
+        исходного отклика, и порог совпадает с _find_adaptive_threshold.
+        """
+        if size > corners_amount:
+            value = np.partition(largest, largest.size - corners_amount - 1)[largest.size - corners_amount - 1]
+        else:
+            value = min_value
+        normalized = self._normalize_with_range(np.array([value], dtype=np.float32), min_value, max_value)
+
+        return self._find_adaptive_threshold(normalized, 0)
+
+    @staticmethod
+    def _normalize_with_range(
+            harris_response: np.ndarray,
+            min_value: np.float32,
+            max_value: np.float32,
+    ) -> np.ndarray:
+        """Нормализует отклик Харриса к [0, 1] по заданным минимуму и максимуму."""
+        if max_value - min_value > 0:
+            return (harris_response - min_value) / (max_value - min_value)
+        else:
+            return np.zeros_like(harris_response)
+
     def circle_detection(
             self,
             image: np.ndarray,
+            min_radius: int = 10,
+            max_radius: int | None = None,
     ) -> np.ndarray:
         """
         Выполняет обнаружение окружностей на изображении.
 
-        Использует преобразование Хафа (cv2.HoughCircles) для поиска окружностей.
+        Использует градиентный вариант преобразования Хафа (см. find_circles).
         Найденные окружности выделяются зелёным цветом, центры — красным.
 
         Args:
             image (np.ndarray): Входное изображение (RGB).
+            min_radius (int): Минимальный радиус окружности.
+            max_radius (int | None): Максимальный радиус окружности
+             (по умолчанию: половина меньшей стороны изображения).
+
+        Returns:
+            np.ndarray: Изображение с выделенными окружностями.
+        """
+        circles = self.find_circles(image, min_radius, max_radius)
+        return self._visualize_circles(image, circles)
 
-        Raises:
-            NotImplementedError: Ошибка о не написании
+    def find_circles(
+            self,
+            image: np.ndarray,
+            min_radius: int = 10,
+            max_radius: int | None = None,
+    ) -> np.ndarray:
+        """
+        Находит окружности градиентным преобразованием Хафа.
+
+        Каждый пиксель границы голосует только вдоль направления своего градиента
+        (в обе стороны, на расстояниях от min_radius до max_radius), поэтому
+        аккумулятор центров двумерный. Радиус для каждого кандидата в центры
+        подбирается отдельно по гистограмме расстояний до пикселей границы,
+        так что память не зависит от диапазона радиусов.
+
+        Args:
+            image (np.ndarray): Входное изображение (RGB).
+            min_radius (int): Минимальный радиус окружности.
+            max_radius (int | None): Максимальный радиус окружности
+             (по умолчанию: половина меньшей стороны изображения).
+
+        Returns:
+            np.ndarray: Массив int32 формы (K, 3) со строками (x, y, radius),
+             упорядоченный по убыванию доли покрытой окружности.
         """
-        raise NotImplementedError("Метод обнаружения окружностей пока не реализован.")
+        return self._find_circles_gray(self._rgb_to_grayscale(image), min_radius, max_radius)
+
+    def _find_circles_gray(
+            self,
+            gray: np.ndarray,
+            min_radius: int = 10,
+            max_radius: int | None = None,
+    ) -> np.ndarray:
+        """Находит окружности на изображении в оттенках серого (см. find_circles)."""
+        height, width = gray.shape
+        if max_radius is None:
+            max_radius = min(height, width) // 2
+        if not 1 <= min_radius <= max_radius:
+            raise ValueError("Радиусы окружностей должны удовлетворять 1 <= min_radius <= max_radius")
+
+        # сглаживание убирает шум, который иначе даёт ложные направления градиента
+        smoothed = self._convolution(gray, gaussian_kernel)[np.newaxis]
+        magnitude = np.empty_like(smoothed)
+        gradient_x = np.empty_like(smoothed)
+        gradient_y = np.empty_like(smoothed)
+        row_index = self._reflect_indices(height, 1)
+        col_index = self._reflect_indices(width, 1)
+        numba.set_num_threads(self._num_threads)
+        max_magnitudes = self._sobel_magnitude(
+            smoothed, row_index, col_index, magnitude, gradient_x, gradient_y, True,
+        )
+        magnitude, gradient_x, gradient_y = magnitude[0], gradient_x[0], gradient_y[0]
+
+        edge_threshold = circle_edge_ratio * max_magnitudes[0]
+        # на очень больших изображениях голосуют только самые сильные границы
+        if np.count_nonzero(magnitude > edge_threshold) > circle_max_edge_points:
+            edge_threshold = self._find_adaptive_threshold_value(magnitude, circle_max_edge_points)
+        edge_rows, edge_cols = np.nonzero(magnitude > edge_threshold)
+
+        accumulator = self._vote_circle_centers(
+            edge_rows, edge_cols, gradient_x, gradient_y, magnitude, min_radius, max_radius,
+        )
+        center_rows, center_cols, votes = self._find_circle_centers(
+            accumulator, max(circle_min_votes, int(circle_vote_ratio * min_radius)),
+        )
+        order = np.argsort(votes, kind="stable")[::-1][:circle_max_candidates]
+        center_rows = center_rows[order] * circle_accumulator_step + circle_accumulator_step // 2
+        center_cols = center_cols[order] * circle_accumulator_step + circle_accumulator_step // 2
+
+        radii, supports = self._estimate_circle_radii(
+            center_rows, center_cols, edge_rows, edge_cols,
+            gradient_x, gradient_y, magnitude, min_radius, max_radius,
+        )
+
+        circles = []
+        for candidate in np.argsort(supports, kind="stable")[::-1]:
+            if supports[candidate] < circle_min_support:
+                break
+            center_row, center_col = center_rows[candidate], center_cols[candidate]
+            # центр внутри уже найденной окружности - это она же, только хуже совмещённая
+            if any(
+                    (center_col - x) ** 2 + (center_row - y) ** 2 < max(min_radius, radius) ** 2
+                    for x, y, radius in circles
+            ):
+                continue
+            circles.append((center_col, center_row, radii[candidate]))
+
+        return np.array(circles, dtype=np.int32).reshape(-1, 3)
+
+    @staticmethod
+    def _find_adaptive_threshold_value(values: np.ndarray, count: int) -> float:
+        """Значение, выше которого лежат не более count элементов массива."""
+        flat_values = values.ravel()
+        kth = flat_values.size - 1 - count
+        return float(np.partition(flat_values, kth)[kth])
+
+    @staticmethod
+    @njit(cache=True)
+    def _vote_circle_centers(edge_rows, edge_cols, gradient_x, gradient_y, magnitude, min_radius, max_radius):
+        """
+        Голосование пикселей границы за центры окружностей вдоль направления градиента.
+
+        @param edge_rows: строки пикселей границы
+        @param edge_cols: столбцы пикселей границы
+        @param gradient_x: градиент по x
+        @param gradient_y: градиент по y
+        @param magnitude: модуль градиента
+        @param min_radius: минимальный радиус
+        @param max_radius: максимальный радиус
+        @return: аккумулятор центров, уменьшенный в circle_accumulator_step раз
+        """
+        height, width = magnitude.shape
+        accumulator = np.zeros(
+            (
+                (height + circle_accumulator_step - 1) // circle_accumulator_step,
+                (width + circle_accumulator_step - 1) // circle_accumulator_step,
+            ),
+            dtype=np.int32,
+        )
+
+        for index in range(edge_rows.size):
+            row = edge_rows[index]
+            col = edge_cols[index]
+            direction_y = gradient_y[row, col] / magnitude[row, col]
+            direction_x = gradient_x[row, col] / magnitude[row, col]
+
+            # центр может лежать как по градиенту, так и против него
+            for sign in (-1.0, 1.0):
+                for radius in range(min_radius, max_radius + 1):
+                    center_row = np.floor(row + sign * radius * direction_y + 0.5)
+                    center_col = np.floor(col + sign * radius * direction_x + 0.5)
+                    # дальше вдоль луча центр только сильнее уходит за границу
+                    if center_row < 0 or center_row >= height or center_col < 0 or center_col >= width:
+                        break
+                    accumulator[
+                        int(center_row) // circle_accumulator_step,
+                        int(center_col) // circle_accumulator_step,
+                    ] += 1
+
+        return accumulator
+
+    @staticmethod
+    @njit(cache=True)
+    def _find_circle_centers(accumulator, min_votes):
+        """
+        Ищет локальные максимумы аккумулятора центров.
+
+        @param accumulator: аккумулятор центров
+        @param min_votes: минимальное число голосов
+        @return: строки, столбцы и число голосов кандидатов в центры
+        """
+        height, width = accumulator.shape
+        center_rows = []
+        center_cols = []
+        votes = []
+
+        for row in range(height):
+            for col in range(width):
+                value = accumulator[row, col]
+                if value < min_votes:
+                    continue
+
+                is_maximum = True
+                for neighbor_row in range(max(0, row - 1), min(height, row + 2)):
+                    for neighbor_col in range(max(0, col - 1), min(width, col + 2)):
+                        neighbor = accumulator[neighbor_row, neighbor_col]
+                        # при равных значениях максимумом считается первый по обходу
+                        if neighbor > value or (
+                                neighbor == value and (neighbor_row, neighbor_col) < (row, col)
+                        ):
+                            is_maximum = False
+                if is_maximum:
+                    center_rows.append(row)
+                    center_cols.append(col)
+                    votes.append(value)
+
+        return np.array(center_rows, dtype=np.int64), np.array(center_cols, dtype=np.int64), np.array(votes)
+
+    @staticmethod
+    @njit(parallel=True, cache=True)
+    def _estimate_circle_radii(
+            center_rows, center_cols, edge_rows, edge_cols,
+            gradient_x, gradient_y, magnitude, min_radius, max_radius,
+    ):
+        """
+        Подбирает радиус для каждого кандидата в центры.
+
+        Учитываются только пиксели границы, градиент которых направлен вдоль
+        радиуса. Радиус выбирается по максимуму доли покрытой окружности.
+
+        @param center_rows: строки кандидатов в центры
+        @param center_cols: столбцы кандидатов в центры
+        @param edge_rows: строки пикселей границы
+        @param edge_cols: столбцы пикселей границы
+        @param gradient_x: градиент по x
+        @param gradient_y: градиент по y
+        @param magnitude: модуль градиента
+        @param min_radius: минимальный радиус
+        @param max_radius: максимальный радиус
+        @return: радиусы и доли покрытия окружностей
+        """
+        count = center_rows.size
+        radii = np.zeros(count, dtype=np.int64)
+        supports = np.zeros(count, dtype=np.float64)
+        bins = max_radius - min_radius + 3
+
+        for candidate in prange(count):
+            histogram = np.zeros(bins, dtype=np.int64)
+            center_row = center_rows[candidate]
+            center_col = center_cols[candidate]
+
+            for index in range(edge_rows.size):
+                offset_y = edge_rows[index] - center_row
+                offset_x = edge_cols[index] - center_col
+                if abs(offset_y) > max_radius + 1 or abs(offset_x) > max_radius + 1:
+                    continue
+                distance = np.sqrt(offset_x * offset_x + offset_y * offset_y)
+                if distance < min_radius - 1 or distance > max_radius + 1:
+                    continue
+
+                row = edge_rows[index]
+                col = edge_cols[index]
+                alignment = abs(offset_x * gradient_x[row, col] + offset_y * gradient_y[row, col])
+                if alignment < circle_min_alignment * distance * magnitude[row, col]:
+                    continue
+
+                histogram[int(distance + 0.5) - min_radius + 1] += 1
+
+            best_radius = min_radius
+            best_support = 0.0
+            for radius in range(min_radius, max_radius + 1):
+                position = radius - min_radius + 1
+                radius_votes = histogram[position - 1] + histogram[position] + histogram[position + 1]
+                support = radius_votes / (2.0 * np.pi * radius)
+                if support > best_support:
+                    best_support = support
+                    best_radius = radius
+
+            radii[candidate] = best_radius
+            supports[candidate] = best_support
+
+        return radii, supports
+
+    @staticmethod
+    @njit(cache=True)
+    def _visualize_circles(image: np.ndarray, circles: np.ndarray) -> np.ndarray:
+        """Визуализирует найденные окружности (зелёным) и их центры (красным)."""
+        result_image = image.copy().astype(np.uint8)
+        height, width = image.shape[:2]
+
+        for index in range(circles.shape[0]):
+            center_col = circles[index, 0]
+            center_row = circles[index, 1]
+            radius = circles[index, 2]
+
+            steps = int(2.0 * np.pi * radius) + 8
+            for step in range(steps):
+                angle = 2.0 * np.pi * step / steps
+                row = int(np.floor(center_row + radius * np.sin(angle) + 0.5))
+                col = int(np.floor(center_col + radius * np.cos(angle) + 0.5))
+                if 0 <= row < height and 0 <= col < width:
+                    result_image[row, col, 0] = 0  # B
+                    result_image[row, col, 1] = 255  # G
+                    result_image[row, col, 2] = 0  # R
+
+            # Рисуем центр квадратом 3x3 пикселя
+            y_start = max(0, center_row - 1)
+            y_end = min(height, center_row + 2)
+            x_start = max(0, center_col - 1)
+            x_end = min(width, center_col + 2)
+
+            result_image[y_start:y_end, x_start:x_end, 0] = 0  # B
+            result_image[y_start:y_end, x_start:x_end, 1] = 0  # G
+            result_image[y_start:y_end, x_start:x_end, 2] = 255  # R
+
+        return result_image
+
+
+def warmup(num_threads: int | None = None) -> dict[str, float]:
+    """
+    Заранее компилирует ядра numba для типов данных, с которыми работают лабораторные.
+
+    Скомпилированный код сохраняется на диск (cache=True), поэтому при повторном
+    запуске и в каждом новом процессе ядра только загружаются из кэша.
+    Вызывается из инициализаторов пулов процессов, чтобы первое изображение
+    не платило за компиляцию.
+
+    Args:
+        num_threads (int | None): Число потоков numba (по умолчанию: все доступные)
+
+    Returns:
+        dict[str, float]: Время прогрева каждой операции в секундах и итог под ключом "total"
+    """
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, (warmup_size, warmup_size, 3), dtype=np.uint8)
+    gray = rng.random((warmup_size, warmup_size), dtype=np.float32)
+    stack = np.stack([image, image])
+    # ядро ранга 2 не раскладывается и идёт через плотную свёртку
+    dense_kernel = np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]], dtype=np.float32)
+    processor = CustomImageProcessing(num_threads=num_threads)
+    integer_processor = CustomImageProcessing(num_threads=num_threads, integer_mode=True)
+
+    operations = {
+        "convolution": lambda: processor._convolution(gray, gaussian_kernel),
+        "convolution_dense": lambda: processor._convolution(gray, dense_kernel),
+        "gamma_correction": lambda: processor._gamma_correction(image, 2.2),
+        "edge_detection": lambda: processor.edge_detection(image),
+        "edge_detection_batch": lambda: processor.edge_detection_batch(stack),
+        "edge_detection_integer": lambda: integer_processor.edge_detection_batch(stack),
+        "canny_edge_detection": lambda: processor.canny_edge_detection(image),
+        "corner_detection": lambda: processor.corner_detection(image),
+        "corner_detection_pyramid": lambda: processor.find_corners(image, 1),
+        "corner_keypoints": lambda: processor.draw_corners(image.copy(), processor.corner_keypoints(image, 1, 1)),
+        "circle_detection": lambda: processor.circle_detection(image),
+    }
+
+    timings = {}
+    start_total = time.perf_counter()
+    for name, operation in operations.items():
+        start_time = time.perf_counter()
+        operation()
+        timings[name] = time.perf_counter() - start_time
+    timings["total"] = time.perf_counter() - start_total
+
+    return timings
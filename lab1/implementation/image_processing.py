@@ -9,17 +9,48 @@
 - гамма-коррекция
 - обнаружение границ (оператор Кэнни)
 - обнаружение углов (алгоритм Харриса)
-- обнаружение окружностей (метод пока не реализован)
+- обнаружение окружностей (преобразование Хафа)
 
 Модуль предназначен для учебных целей (лабораторная работа по курсу "Технологии программирования на Python").
 """
 
+from typing import Iterable
+
 import cv2
 import numpy as np
 
 from lab1 import interfaces
+from lab1.implementation import keypoints, point_operations
+from lab1.implementation.operator_graph import Operator, OperatorGraph
 from lab1.utils.time_measure import measure_time
 
+# параметры cv2.HoughCircles
+hough_canny_threshold = 150  # верхний порог Кэнни (param1)
+hough_accumulator_threshold = 20  # порог аккумулятора центров (param2)
+hough_refine_threshold = 10  # порог аккумулятора при уточнении в окне кандидата
+hough_merge_area_ratio = 1.5  # окна объединяются, если общее окно не больше стольких площадей большего
+hough_refine_edge_ratio = 4.0  # окно уточняется, если пикселей границ не больше стольких длин окружностей
+# параметры поиска окружностей от грубого к точному
+hough_min_coarse_size = 256  # большая сторона изображения на грубом уровне не меньше
+hough_min_coarse_radius = 16  # максимальный радиус окружности на грубом уровне не меньше
+hough_max_candidates = 64  # сколько самых сильных кандидатов грубого уровня уточняется
+# параметры cv2.cornerHarris
+harris_block_size = 2
+harris_aperture = 3
+harris_k = 0.04
+harris_threshold_ratio = 0.01  # угол: отклик больше этой доли максимума
+# пирамидальный режим Харриса: отклик на полном разрешении считается только в плитках
+# вокруг кандидатов грубого уровня
+harris_tile_size = 64
+harris_tile_halo = 4  # перекрытие области cv2.cornerHarris вокруг плиток
+harris_candidate_ratio = 0.001  # кандидат грубого уровня: отклик больше этой доли максимума
+harris_max_keypoints = 1000
+corner_color = (255, 0, 0)  # BGR
+
+# пороги гистерезиса cv2.Canny
+canny_low_threshold = 200
+canny_high_threshold = 300
+
 
 class ImageProcessing(interfaces.IImageProcessing):
     """
@@ -33,8 +64,12 @@ class ImageProcessing(interfaces.IImageProcessing):
         _rgb_to_grayscale(image): Преобразует RGB-изображение в оттенки серого.
         _gamma_correction(image, gamma): Применяет гамма-коррекцию.
         edge_detection(image): Обнаруживает границы (Canny).
-        corner_detection(image): Обнаруживает углы (Harris).
+        corner_detection(image, pyramid_levels): Обнаруживает углы (Harris).
+        find_corners(image, pyramid_levels): Возвращает маску углов.
+        corner_keypoints(image, max_keypoints, pyramid_levels): Возвращает углы (y, x, response).
+        draw_corners(image, corners): Рисует углы на изображении на месте.
         circle_detection(image): Обнаруживает окружности (HoughCircles).
+        run_methods(image, methods): Считает edges, corners, circles с общими промежуточными узлами.
     """
 
     def _convolution(self, image: np.ndarray, kernel: np.ndarray) -> np.ndarray:
@@ -75,18 +110,22 @@ class ImageProcessing(interfaces.IImageProcessing):
         в чёрно-белое.
 
         Args:
-            image (np.ndarray): Входное RGB-изображение.
+            image (np.ndarray): Входное RGB-изображение; изображение (H, W),
+             декодированное сразу в оттенках серого, возвращается без изменений.
 
         Returns:
             np.ndarray: Одноканальное изображение в оттенках серого.
         """
+        if image.ndim == 2:
+            return image
         return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
 
     def _gamma_correction(self, image: np.ndarray, gamma: float) -> np.ndarray:
         """
         Применяет гамма-коррекцию к изображению.
 
-        Коррекция осуществляется с помощью таблицы преобразования значений пикселей.
+        Коррекция осуществляется с помощью таблицы преобразования значений пикселей,
+        таблица запоминается для каждого значения gamma.
 
         Args:
             image (np.ndarray): Входное изображение.
@@ -95,10 +134,7 @@ class ImageProcessing(interfaces.IImageProcessing):
         Returns:
             np.ndarray: Изображение после гамма-коррекции.
         """
-        inv_gamma = 1.0 / gamma
-        table = np.array([(i / 255.0) ** inv_gamma * 255 for i in range(256)]).astype(
-            "uint8"
-        )
+        table = point_operations.build_lut(gamma=float(gamma))
         return cv2.LUT(image, table)
 
     @measure_time
@@ -116,11 +152,11 @@ class ImageProcessing(interfaces.IImageProcessing):
             np.ndarray: Одноканальное изображение с выделенными границами.
         """
         gray = self._rgb_to_grayscale(image)
-        edges = cv2.Canny(gray, 200, 300)
+        edges = cv2.Canny(gray, canny_low_threshold, canny_high_threshold)
         return edges
 
     @measure_time
-    def corner_detection(self, image: np.ndarray) -> np.ndarray:
+    def corner_detection(self, image: np.ndarray, pyramid_levels: int = 0) -> np.ndarray:
         """
         Выполняет обнаружение углов на изображении.
 
@@ -129,19 +165,191 @@ class ImageProcessing(interfaces.IImageProcessing):
 
         Args:
             image (np.ndarray): Входное изображение (RGB).
+            pyramid_levels (int): Число уровней пирамиды для поиска от грубого
+             к точному (см. find_corners, 0 - полное разрешение).
 
         Returns:
             np.ndarray: Изображение с выделенными углами (красные точки).
         """
-        gray = self._rgb_to_grayscale(image)
-        gray = np.float32(gray)
-        dst = cv2.cornerHarris(gray, 2, 3, 0.04)
-        dst = cv2.dilate(dst, None)
+        return self._draw_corner_mask(image, self.find_corners(image, pyramid_levels))
+
+    @staticmethod
+    def _draw_corner_mask(image: np.ndarray, corners: np.ndarray) -> np.ndarray:
+        """Рисует маску углов квадратами 3x3 на копии изображения."""
+        # расширение маски углов равносильно cv2.dilate отклика перед порогом
         result = image.copy()
-        result[dst > 0.01 * dst.max()] = [255, 0, 0]
+        result[cv2.dilate(corners.view(np.uint8), None) > 0] = corner_color
         return result
 
-    def circle_detection(self, image: np.ndarray) -> np.ndarray:
+    def find_corners(self, image: np.ndarray, pyramid_levels: int = 0) -> np.ndarray:
+        """
+        Находит пиксели углов (отклик Харриса больше доли максимума).
+
+        При pyramid_levels > 0 кандидаты ищутся на изображении, уменьшенном
+        cv2.pyrDown pyramid_levels раз, а cv2.cornerHarris на полном разрешении
+        вызывается только для плиток вокруг кандидатов (полноту относительно
+        полного прохода см. lab1.utils.corner_recall).
+
+        Args:
+            image (np.ndarray): Входное изображение (RGB).
+            pyramid_levels (int): Число уровней пирамиды (0 - полное разрешение).
+
+        Returns:
+            np.ndarray: Маска углов (H, W) типа bool.
+        """
+        return self._find_corners(image, pyramid_levels)[0]
+
+    def corner_keypoints(
+            self,
+            image: np.ndarray,
+            max_keypoints: int | None = harris_max_keypoints,
+            pyramid_levels: int = 0,
+    ) -> np.ndarray:
+        """
+        Находит пиксели углов и возвращает их координаты без копии изображения.
+
+        Args:
+            image (np.ndarray): Входное изображение (RGB).
+            max_keypoints (int | None): Сколько пикселей с наибольшим откликом вернуть (None - все).
+            pyramid_levels (int): Число уровней пирамиды (см. find_corners).
+
+        Returns:
+            np.ndarray: Углы keypoints.keypoint_dtype (y, x, отклик cv2.cornerHarris)
+             по убыванию отклика.
+        """
+        corners, dst = self._find_corners(image, pyramid_levels)
+        return keypoints.mask_to_keypoints(corners, dst, max_keypoints)
+
+    @staticmethod
+    def draw_corners(image: np.ndarray, corners: np.ndarray) -> np.ndarray:
+        """
+        Рисует углы квадратами 3x3 на изображении на месте, как corner_detection.
+
+        Args:
+            image (np.ndarray): Изображение (H, W, 3) uint8, изменяется.
+            corners (np.ndarray): Углы из corner_keypoints.
+
+        Returns:
+            np.ndarray: То же изображение.
+        """
+        return keypoints.draw_keypoints(image, corners, corner_color)
+
+    def _find_corners(self, image: np.ndarray, pyramid_levels: int) -> tuple[np.ndarray, np.ndarray]:
+        """Находит маску углов и отклик cv2.cornerHarris (см. find_corners)."""
+        factor = 2 ** pyramid_levels
+        if pyramid_levels < 0 or factor > harris_tile_size:
+            raise ValueError(
+                f"Число уровней пирамиды должно быть от 0 до {harris_tile_size.bit_length() - 1}"
+            )
+
+        return self._find_corners_gray(np.float32(self._rgb_to_grayscale(image)), pyramid_levels)
+
+    def _find_corners_gray(self, gray: np.ndarray, pyramid_levels: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        """Находит маску углов и отклик по изображению в оттенках серого float32."""
+        factor = 2 ** pyramid_levels
+        if pyramid_levels > 0 and min(gray.shape) // factor >= harris_tile_size:
+            dst = self._corner_harris_pyramid(gray, pyramid_levels)
+        else:
+            dst = cv2.cornerHarris(gray, harris_block_size, harris_aperture, harris_k)
+        return dst > harris_threshold_ratio * dst.max(), dst
+
+    @staticmethod
+    def _corner_harris_pyramid(gray: np.ndarray, pyramid_levels: int) -> np.ndarray:
+        """
+        Считает cv2.cornerHarris на полном разрешении только вокруг кандидатов
+        грубого уровня пирамиды; вне выбранных плиток отклик равен 0.
+        """
+        height, width = gray.shape
+        factor = 2 ** pyramid_levels
+        coarse = gray
+        for _ in range(pyramid_levels):
+            coarse = cv2.pyrDown(coarse)
+        coarse_dst = cv2.cornerHarris(coarse, harris_block_size, harris_aperture, harris_k)
+        candidates = (coarse_dst > harris_candidate_ratio * coarse_dst.max()).astype(np.uint8)
+
+        # пиксель грубого уровня с соседями покрывает окно полного разрешения;
+        # сетка дополняется до целых плиток и сводится к плиткам
+        block = harris_tile_size // factor
+        tiles_y = -(-height // harris_tile_size)
+        tiles_x = -(-width // harris_tile_size)
+        grid = np.zeros((tiles_y * block, tiles_x * block), dtype=np.uint8)
+        rows, cols = min(coarse.shape[0], grid.shape[0]), min(coarse.shape[1], grid.shape[1])
+        grid[:rows, :cols] = candidates[:rows, :cols]
+        grid = cv2.dilate(grid, np.ones((5, 5), dtype=np.uint8))
+        active = grid.reshape(tiles_y, block, tiles_x, block).max(axis=(1, 3)) > 0
+
+        dst = np.zeros_like(gray)
+        for tile_row in range(tiles_y):
+            # соседние плитки строки обрабатываются одним вызовом
+            runs = np.flatnonzero(np.diff(np.concatenate(([0], active[tile_row].view(np.int8), [0]))))
+            row_start = tile_row * harris_tile_size
+            row_stop = min(row_start + harris_tile_size, height)
+            top = max(row_start - harris_tile_halo, 0)
+            bottom = min(row_stop + harris_tile_halo, height)
+            for first_tile, last_tile in zip(runs[::2], runs[1::2]):
+                col_start = first_tile * harris_tile_size
+                col_stop = min(last_tile * harris_tile_size, width)
+                left = max(col_start - harris_tile_halo, 0)
+                right = min(col_stop + harris_tile_halo, width)
+                region = cv2.cornerHarris(
+                    np.ascontiguousarray(gray[top:bottom, left:right]),
+                    harris_block_size, harris_aperture, harris_k,
+                )
+                dst[row_start:row_stop, col_start:col_stop] = region[
+                    row_start - top:row_stop - top, col_start - left:col_stop - left
+                ]
+        return dst
+
+    def operator_graph(self) -> OperatorGraph:
+        """
+        Граф операций для run_methods.
+
+        Узлы: gray - оттенки серого uint8, общий для всех методов; gray_float - он же
+        в float32 для cv2.cornerHarris; edges, corners, circles - результаты
+        edge_detection, corner_detection и circle_detection.
+
+        Returns:
+            OperatorGraph: Граф операций.
+        """
+        def corners(image: np.ndarray, gray_float: np.ndarray) -> np.ndarray:
+            return self._draw_corner_mask(image, self._find_corners_gray(gray_float)[0])
+
+        def circles(image: np.ndarray, gray: np.ndarray) -> np.ndarray:
+            return self._draw_circles(image, self._find_circles_gray(gray))
+
+        return OperatorGraph([
+            Operator("gray", ("image",), self._rgb_to_grayscale),
+            Operator("gray_float", ("gray",), np.float32),
+            Operator("edges", ("gray",), lambda gray: cv2.Canny(gray, canny_low_threshold, canny_high_threshold)),
+            Operator("corners", ("image", "gray_float"), corners),
+            Operator("circles", ("image", "gray"), circles),
+        ])
+
+    @measure_time
+    def run_methods(self, image: np.ndarray, methods: Iterable[str]) -> dict[str, np.ndarray]:
+        """
+        Считает несколько результатов за один проход графа операций.
+
+        Оттенки серого считаются один раз, промежуточные массивы освобождаются
+        после последнего потребителя. Результаты совпадают с edge_detection,
+        corner_detection и circle_detection.
+
+        Args:
+            image (np.ndarray): Входное изображение (RGB).
+            methods (Iterable[str]): Имена узлов: edges, corners, circles (см. operator_graph).
+
+        Returns:
+            dict[str, np.ndarray]: Результаты по именам.
+        """
+        return self.operator_graph().run(image, methods)
+
+    def circle_detection(
+            self,
+            image: np.ndarray,
+            min_radius: int = 10,
+            max_radius: int | None = None,
+            pyramid_levels: int | None = None,
+    ) -> np.ndarray:
         """
         Выполняет обнаружение окружностей на изображении.
 
@@ -150,8 +358,260 @@ class ImageProcessing(interfaces.IImageProcessing):
 
         Args:
             image (np.ndarray): Входное изображение (RGB).
+            min_radius (int): Минимальный радиус окружности.
+            max_radius (int | None): Максимальный радиус окружности
+             (по умолчанию: половина меньшей стороны изображения).
+            pyramid_levels (int | None): Число уровней пирамиды для поиска
+             от грубого к точному (см. find_circles).
 
         Returns:
             np.ndarray: Изображение с выделенными окружностями.
         """
-        raise NotImplementedError("Метод обнаружения окружностей пока не реализован.")
+        return self._draw_circles(image, self.find_circles(image, min_radius, max_radius, pyramid_levels))
+
+    @staticmethod
+    def _draw_circles(image: np.ndarray, circles: np.ndarray) -> np.ndarray:
+        """Рисует окружности (зелёным) и их центры (красным) на копии изображения."""
+        result = image.copy()
+        for x, y, radius in circles:
+            cv2.circle(result, (int(x), int(y)), int(radius), (0, 255, 0), 2)
+            cv2.circle(result, (int(x), int(y)), 2, (0, 0, 255), 3)
+        return result
+
+    def find_circles(
+            self,
+            image: np.ndarray,
+            min_radius: int = 10,
+            max_radius: int | None = None,
+            pyramid_levels: int | None = None,
+    ) -> np.ndarray:
+        """
+        Находит окружности с помощью cv2.HoughCircles.
+
+        В режиме пирамиды окружности ищутся на уменьшенном в 2^pyramid_levels раз
+        изображении, а на полном разрешении HoughCircles запускается только
+        в окнах вокруг самых сильных кандидатов; близкие окна объединяются,
+        а окна, перегруженные границами, не уточняются.
+
+        Args:
+            image (np.ndarray): Входное изображение (RGB).
+            min_radius (int): Минимальный радиус окружности.
+            max_radius (int | None): Максимальный радиус окружности
+             (по умолчанию: половина меньшей стороны изображения).
+            pyramid_levels (int | None): Число уровней пирамиды: 0 - поиск сразу
+             на полном разрешении, None - выбрать автоматически по размеру изображения
+             и max_radius.
+
+        Returns:
+            np.ndarray: Массив int32 формы (K, 3) со строками (x, y, radius).
+        """
+        return self._find_circles_gray(self._rgb_to_grayscale(image), min_radius, max_radius, pyramid_levels)
+
+    def _find_circles_gray(
+            self,
+            gray: np.ndarray,
+            min_radius: int = 10,
+            max_radius: int | None = None,
+            pyramid_levels: int | None = None,
+    ) -> np.ndarray:
+        """Находит окружности на изображении в оттенках серого (см. find_circles)."""
+        gray = cv2.medianBlur(gray, 5)
+        height, width = gray.shape
+        if max_radius is None:
+            max_radius = min(height, width) // 2
+        if not 1 <= min_radius <= max_radius:
+            raise ValueError("Радиусы окружностей должны удовлетворять 1 <= min_radius <= max_radius")
+        if pyramid_levels is None:
+            pyramid_levels = self._choose_pyramid_levels(gray.shape, max_radius)
+        if pyramid_levels < 0:
+            raise ValueError("Число уровней пирамиды должно быть >= 0")
+
+        if pyramid_levels == 0:
+            return self._hough_circles(gray, min_radius, max_radius, hough_accumulator_threshold)
+
+        coarse = gray
+        for _ in range(pyramid_levels):
+            coarse = cv2.pyrDown(coarse)
+        scale = 2 ** pyramid_levels
+
+        # HoughCircles возвращает центры по убыванию голосов, поэтому срез оставляет самых сильных
+        candidates = self._hough_circles(
+            coarse,
+            max(1, min_radius // scale),
+            max(1, -(-max_radius // scale)),
+            hough_accumulator_threshold,
+        )[:hough_max_candidates]
+
+        circles = []
+        for group in self._group_candidates(candidates * scale, scale, gray.shape):
+            circles.extend(self._refine_candidates(gray, group, scale, min_radius, max_radius))
+
+        return np.array(circles, dtype=np.int32).reshape(-1, 3)
+
+    @staticmethod
+    def _candidate_window(circle: np.ndarray, scale: int, shape: tuple[int, int]) -> tuple[int, int, int, int]:
+        """Окно (y_start, y_end, x_start, x_end) вокруг кандидата (x, y, radius) полного разрешения."""
+        center_x, center_y, radius = (int(value) for value in circle)
+        margin = radius + 3 * scale
+        return (
+            max(0, center_y - margin), min(shape[0], center_y + margin + 1),
+            max(0, center_x - margin), min(shape[1], center_x + margin + 1),
+        )
+
+    def _group_candidates(
+            self,
+            candidates: np.ndarray,
+            scale: int,
+            shape: tuple[int, int],
+    ) -> list[np.ndarray]:
+        """
+        Объединяет кандидатов с близкими радиусами, окна которых почти совпадают
+        (общее окно не больше hough_merge_area_ratio площадей большего): обычно это
+        повторы одной окружности, и HoughCircles не обрабатывает одно окно дважды.
+
+        Args:
+            candidates (np.ndarray): Кандидаты (x, y, radius) в координатах полного разрешения
+            scale (int): Масштаб грубого уровня
+            shape (tuple[int, int]): Размер изображения полного разрешения
+
+        Returns:
+            list[np.ndarray]: Группы кандидатов формы (K, 3)
+        """
+        groups = [([index], self._candidate_window(circle, scale, shape)) for index, circle in enumerate(candidates)]
+
+        def area(window):
+            return (window[1] - window[0]) * (window[3] - window[2])
+
+        merged = True
+        while merged:
+            merged = False
+            for first in range(len(groups)):
+                for second in range(first + 1, len(groups)):
+                    (first_members, a), (second_members, b) = groups[first], groups[second]
+                    if a[0] >= b[1] or b[0] >= a[1] or a[2] >= b[3] or b[2] >= a[3]:
+                        continue
+                    # общий диапазон радиусов не должен стать шире, чем у отдельных окон
+                    radii = np.concatenate([candidates[first_members, 2], candidates[second_members, 2]])
+                    if radii.max() - radii.min() > 4 * scale:
+                        continue
+                    union = (min(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), max(a[3], b[3]))
+                    if area(union) <= hough_merge_area_ratio * max(area(a), area(b)):
+                        groups[first] = (first_members + second_members, union)
+                        del groups[second]
+                        merged = True
+                        break
+                if merged:
+                    break
+
+        return [candidates[members] for members, _ in groups]
+
+    def _refine_candidates(
+            self,
+            gray: np.ndarray,
+            group: np.ndarray,
+            scale: int,
+            min_radius: int,
+            max_radius: int,
+    ) -> list[tuple[int, int, int]]:
+        """
+        Уточняет группу кандидатов одним HoughCircles в их общем окне.
+
+        Каждому кандидату достаётся ближайшая уточнённая окружность, центр и радиус
+        которой отличаются не больше чем на 2 * scale; без такой окружности
+        остаётся кандидат грубого уровня.
+
+        Args:
+            gray (np.ndarray): Сглаженное изображение полного разрешения
+            group (np.ndarray): Кандидаты (x, y, radius) в координатах полного разрешения
+            scale (int): Масштаб грубого уровня
+            min_radius (int): Минимальный радиус окружности
+            max_radius (int): Максимальный радиус окружности
+
+        Returns:
+            list[tuple[int, int, int]]: Окружности (x, y, radius) без повторов
+        """
+        windows = np.array([self._candidate_window(circle, scale, gray.shape) for circle in group])
+        y_start, x_start = windows[:, 0].min(), windows[:, 2].min()
+        y_end, x_end = windows[:, 1].max(), windows[:, 3].max()
+        window = gray[y_start:y_end, x_start:x_end]
+
+        # время HoughCircles растёт как (число центров) x (число пикселей границ): в окне
+        # с текстурой уточнение стоит секунды, поэтому там остаются кандидаты грубого уровня
+        edge_count = np.count_nonzero(cv2.Canny(window, hough_canny_threshold // 2, hough_canny_threshold))
+        if edge_count <= hough_refine_edge_ratio * 2 * np.pi * group[:, 2].max():
+            refined = self._hough_circles(
+                window,
+                max(min_radius, int(group[:, 2].min()) - 2 * scale),
+                min(max_radius, int(group[:, 2].max()) + 2 * scale),
+                hough_refine_threshold,
+                min_distance=int(group[:, 2].min()) + 3 * scale,
+            ) + np.array([x_start, y_start, 0], dtype=np.int32)
+        else:
+            refined = np.empty((0, 3), dtype=np.int32)
+
+        circles = []
+        for circle in group:
+            difference = np.abs(refined - circle).max(axis=1) if len(refined) > 0 else np.empty(0)
+            if difference.size > 0 and difference.min() <= 2 * scale:
+                circle = refined[np.argmin(difference)]
+            circle = tuple(int(value) for value in circle)
+            # соседние кандидаты могут уточниться до одной окружности
+            if circle not in circles:
+                circles.append(circle)
+
+        return circles
+
+    @staticmethod
+    def _choose_pyramid_levels(shape: tuple[int, int], max_radius: int) -> int:
+        """
+        Подбирает число уровней пирамиды по размеру изображения и максимальному радиусу:
+        уровни добавляются, пока большая сторона грубого изображения не меньше
+        hough_min_coarse_size, а максимальный радиус на нём - hough_min_coarse_radius.
+
+        Время HoughCircles растёт с числом пикселей границ и диапазоном радиусов,
+        поэтому каждый уровень сокращает поиск кандидатов примерно в 8 раз.
+        """
+        levels = 0
+        while (
+                max(shape) / 2 ** (levels + 1) >= hough_min_coarse_size
+                and max_radius / 2 ** (levels + 1) >= hough_min_coarse_radius
+        ):
+            levels += 1
+        return levels
+
+    @staticmethod
+    def _hough_circles(
+            gray: np.ndarray,
+            min_radius: int,
+            max_radius: int,
+            accumulator_threshold: int,
+            min_distance: int | None = None,
+    ) -> np.ndarray:
+        """
+        Обёртка над cv2.HoughCircles.
+
+        Args:
+            gray (np.ndarray): Сглаженное изображение в оттенках серого.
+            min_radius (int): Минимальный радиус окружности.
+            max_radius (int): Максимальный радиус окружности.
+            accumulator_threshold (int): Порог аккумулятора (param2).
+            min_distance (int | None): Минимальное расстояние между центрами
+             (по умолчанию: min_radius).
+
+        Returns:
+            np.ndarray: Массив int32 формы (K, 3) со строками (x, y, radius).
+        """
+        circles = cv2.HoughCircles(
+            gray,
+            cv2.HOUGH_GRADIENT,
+            dp=1,
+            minDist=max(1, min_distance or min_radius),
+            param1=hough_canny_threshold,
+            param2=accumulator_threshold,
+            minRadius=min_radius,
+            maxRadius=max_radius,
+        )
+        if circles is None:
+            return np.empty((0, 3), dtype=np.int32)
+
+        return np.round(circles[0]).astype(np.int32)
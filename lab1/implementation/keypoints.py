@@ -0,0 +1,101 @@
+"""
+Модуль keypoints.py
+
+Компактное представление найденных углов и их отрисовка.
+
+Углы хранятся структурированным массивом keypoint_dtype с полями y, x
+(строка и столбец пикселя) и response (отклик детектора в шкале реализации),
+упорядоченным по убыванию отклика. Для 1000 углов это 12 КБ вместо копии
+изображения, поэтому такой результат дёшево передавать из процессов пула.
+
+Модуль предназначен для учебных целей
+ (лабораторная работа по курсу "Технологии программирования на Python").
+"""
+
+import numpy as np
+from numba import njit
+
+keypoint_dtype = np.dtype([("y", np.int32), ("x", np.int32), ("response", np.float32)])
+keypoint_square_radius = 1  # углы рисуются квадратами 3x3
+
+
+def mask_to_keypoints(mask: np.ndarray, response: np.ndarray, max_keypoints: int | None = None) -> np.ndarray:
+    """
+    Собирает углы маски в массив keypoint_dtype.
+
+    Args:
+        mask (np.ndarray): Маска углов (H, W) типа bool.
+        response (np.ndarray): Отклик детектора (H, W); используются значения под маской.
+        max_keypoints (int | None): Сколько углов с наибольшим откликом оставить
+         (None - все).
+
+    Returns:
+        np.ndarray: Углы keypoint_dtype по убыванию отклика.
+    """
+    if mask.shape != response.shape:
+        raise ValueError(f"Формы маски {mask.shape} и отклика {response.shape} не совпадают")
+    if max_keypoints is not None and max_keypoints < 0:
+        raise ValueError("Число углов должно быть >= 0")
+
+    indices = np.flatnonzero(mask)
+    values = response.ravel()[indices]
+    if max_keypoints is not None and indices.size > max_keypoints:
+        strongest = np.argpartition(values, indices.size - max_keypoints)[indices.size - max_keypoints:]
+        indices, values = indices[strongest], values[strongest]
+    # при равном отклике порядок - по положению, чтобы результат не зависел от argpartition
+    order = np.lexsort((indices, -values))
+
+    keypoints = np.empty(indices.size, dtype=keypoint_dtype)
+    keypoints["y"], keypoints["x"] = np.divmod(indices[order], mask.shape[1])
+    keypoints["response"] = values[order]
+
+    return keypoints
+
+
+def draw_keypoints(image: np.ndarray, keypoints: np.ndarray, color: tuple[int, int, int]) -> np.ndarray:
+    """
+    Рисует углы квадратами 3x3 прямо на изображении.
+
+    Args:
+        image (np.ndarray): Изображение (H, W, 3) uint8, изменяется на месте.
+        keypoints (np.ndarray): Углы keypoint_dtype.
+        color (tuple[int, int, int]): Цвет квадратов по каналам изображения.
+
+    Returns:
+        np.ndarray: То же изображение.
+    """
+    if image.ndim != 3 or image.dtype != np.uint8:
+        raise ValueError(f"Ожидается изображение uint8 формы (H, W, C), получено {image.dtype} {image.shape}")
+    if keypoints.dtype != keypoint_dtype:
+        raise ValueError(f"Ожидается массив углов {keypoint_dtype}, получено {keypoints.dtype}")
+    if len(color) != image.shape[2]:
+        raise ValueError(f"Цвет должен содержать {image.shape[2]} значений, получено {len(color)}")
+
+    _draw_squares(
+        image,
+        np.ascontiguousarray(keypoints["y"]),
+        np.ascontiguousarray(keypoints["x"]),
+        np.asarray(color, dtype=np.uint8),
+        keypoint_square_radius,
+    )
+
+    return image
+
+
+@njit(cache=True)
+def _draw_squares(image, rows, cols, color, radius):
+    """
+    Закрашивает квадраты вокруг точек, обрезая их по краям изображения.
+
+    @param image: изображение (H, W, C) uint8, изменяется на месте
+    @param rows: строки точек
+    @param cols: столбцы точек
+    @param color: цвет по каналам
+    @param radius: полуразмер квадрата
+    """
+    height, width, channels = image.shape
+    for index in range(rows.size):
+        for row in range(max(rows[index] - radius, 0), min(rows[index] + radius + 1, height)):
+            for col in range(max(cols[index] - radius, 0), min(cols[index] + radius + 1, width)):
+                for channel in range(channels):
+                    image[row, col, channel] = color[channel]
@@ -0,0 +1,119 @@
+"""
+Модуль operator_graph.py
+
+Граф операций обработки изображения с общими промежуточными результатами.
+
+Каждый метод IImageProcessing заново переводит изображение в оттенки серого
+и считает свои градиенты. Граф описывает методы как узлы с входами (серое
+изображение, градиенты Собеля, отклик Харриса и т. д.), поэтому при запросе
+нескольких результатов общие узлы считаются один раз. Промежуточный результат
+удаляется сразу после его последнего потребителя.
+
+Графы реализаций строят ImageProcessing.operator_graph() и
+CustomImageProcessing.operator_graph().
+
+Модуль предназначен для учебных целей
+ (лабораторная работа по курсу "Технологии программирования на Python").
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+source_node = "image"
+
+
+@dataclass(frozen=True)
+class Operator:
+    """
+    Узел графа.
+
+    Attributes:
+        name (str): Имя результата узла.
+        inputs (tuple[str, ...]): Имена узлов, результаты которых нужны на входе.
+        function (Callable[..., Any]): Функция от результатов входов (в порядке inputs).
+    """
+    name: str
+    inputs: tuple[str, ...]
+    function: Callable[..., Any]
+
+
+class OperatorGraph:
+    """
+    Граф операций: считает только узлы, нужные для запрошенных результатов.
+
+    Входное изображение доступно узлам под именем source_node.
+    """
+
+    def __init__(self, operators: Iterable[Operator]) -> None:
+        self._operators: dict[str, Operator] = {}
+        for operator in operators:
+            if operator.name == source_node or operator.name in self._operators:
+                raise ValueError(f"Узел {operator.name} уже есть в графе")
+            self._operators[operator.name] = operator
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Имена всех узлов графа."""
+        return tuple(self._operators)
+
+    def plan(self, outputs: Iterable[str]) -> list[Operator]:
+        """
+        Порядок вычисления узлов, нужных для запрошенных результатов.
+
+        Args:
+            outputs (Iterable[str]): Имена запрошенных результатов.
+
+        Returns:
+            list[Operator]: Узлы в порядке, при котором входы считаются раньше потребителей.
+        """
+        order = []
+        visited = set()
+        in_progress = set()
+
+        def visit(name: str) -> None:
+            if name == source_node or name in visited:
+                return
+            if name not in self._operators:
+                raise ValueError(f"Неизвестный узел {name}, доступны: {', '.join(self._operators)}")
+            if name in in_progress:
+                raise ValueError(f"Цикл в графе через узел {name}")
+            in_progress.add(name)
+            for input_name in self._operators[name].inputs:
+                visit(input_name)
+            in_progress.discard(name)
+            visited.add(name)
+            order.append(self._operators[name])
+
+        for output in outputs:
+            visit(output)
+
+        return order
+
+    def run(self, image: Any, outputs: Iterable[str]) -> dict[str, Any]:
+        """
+        Считает запрошенные результаты для изображения.
+
+        Промежуточные результаты удаляются сразу после последнего потребителя,
+        поэтому пик памяти определяется самым широким местом графа, а не суммой узлов.
+
+        Args:
+            image (Any): Входное изображение.
+            outputs (Iterable[str]): Имена запрошенных результатов.
+
+        Returns:
+            dict[str, Any]: Результаты по именам в порядке запроса.
+        """
+        outputs = list(dict.fromkeys(outputs))
+        plan = self.plan(outputs)
+        consumers = Counter(input_name for operator in plan for input_name in operator.inputs)
+        values = {source_node: image}
+
+        for operator in plan:
+            values[operator.name] = operator.function(*(values[name] for name in operator.inputs))
+            for name in operator.inputs:
+                consumers[name] -= 1
+                if consumers[name] == 0 and name != source_node and name not in outputs:
+                    del values[name]
+
+        return {name: values[name] for name in outputs}
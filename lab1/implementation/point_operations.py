@@ -0,0 +1,98 @@
+"""
+Модуль point_operations.py
+
+Поэлементные (точечные) преобразования изображений uint8 через таблицы (LUT).
+
+Гамма-коррекция, контраст, яркость и ограничение диапазона сводятся в одну
+таблицу из 256 значений, которая применяется к изображению за один проход.
+Таблицы запоминаются по параметрам, число хранимых таблиц ограничено (LRU).
+
+Модуль предназначен для учебных целей
+ (лабораторная работа по курсу "Технологии программирования на Python").
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from numba import njit, prange
+
+lut_size = 256
+lut_cache_size = 64  # сколько разных таблиц храним одновременно
+
+
+@lru_cache(maxsize=lut_cache_size)
+def build_lut(
+        gamma: float = 1.0,
+        contrast: float = 1.0,
+        brightness: float = 0.0,
+        low: int = 0,
+        high: int = 255,
+) -> np.ndarray:
+    """
+    Строит таблицу преобразования uint8 -> uint8.
+
+    Преобразования применяются по порядку: гамма-коррекция
+    (255 * (i / 255) ^ (1 / gamma)), затем контраст и яркость
+    (value * contrast + brightness), затем ограничение диапазоном [low, high].
+    Дробная часть отбрасывается, как при astype(np.uint8).
+
+    Результат запоминается, поэтому возвращаемая таблица доступна только для чтения.
+
+    Args:
+        gamma (float): Коэффициент гамма-коррекции (>0).
+        contrast (float): Множитель контраста.
+        brightness (float): Сдвиг яркости.
+        low (int): Нижняя граница результата.
+        high (int): Верхняя граница результата.
+
+    Returns:
+        np.ndarray: Таблица uint8 из 256 значений.
+    """
+    if gamma <= 0:
+        raise ValueError("Гамма значение должно быть > 0")
+    if not 0 <= low <= high <= lut_size - 1:
+        raise ValueError(f"Границы диапазона должны удовлетворять 0 <= low <= high <= {lut_size - 1}")
+
+    values = np.arange(lut_size, dtype=np.float64) / (lut_size - 1)
+    values = np.power(values, 1.0 / gamma) * (lut_size - 1)
+    values = values * contrast + brightness
+    table = np.clip(values, low, high).astype(np.uint8)
+    table.setflags(write=False)
+
+    return table
+
+
+def apply_lut(image: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """
+    Применяет таблицу к изображению uint8 любой формы за один проход numba.
+
+    Args:
+        image (np.ndarray): Изображение uint8.
+        table (np.ndarray): Таблица uint8 из 256 значений.
+
+    Returns:
+        np.ndarray: Преобразованное изображение той же формы.
+    """
+    if image.dtype != np.uint8:
+        raise ValueError(f"Таблица применяется только к изображениям uint8, получено {image.dtype}")
+    if table.shape != (lut_size,):
+        raise ValueError(f"Таблица должна содержать {lut_size} значений, получено {table.shape}")
+
+    pixels = np.ascontiguousarray(image).reshape(-1)
+    return _gather(pixels, np.ascontiguousarray(table, dtype=np.uint8)).reshape(image.shape)
+
+
+@njit(parallel=True, cache=True)
+def _gather(pixels, table):
+    """
+    Заменяет каждый пиксель значением из таблицы.
+
+    @param pixels: пиксели изображения uint8 (одномерный массив)
+    @param table: таблица uint8 из 256 значений
+    @return: преобразованные пиксели
+    """
+    output = np.empty_like(pixels)
+    for index in prange(pixels.size):
+        output[index] = table[pixels[index]]
+
+    return output
@@ -11,30 +11,210 @@ main.py
 - обнаружение окружностей (circles)
 
 Запуск:
-    python main.py <метод> <путь_к_изображению> [-o путь_для_сохранения]
+    python main.py <метод[,метод...]> <путь_к_изображению> [-o путь_для_сохранения]
+    python main.py <метод> <директория | шаблон | @список> ... [-o директория] [-j N]
 
 Аргументы:
-    метод: edges | corners | circles
-    путь_к_изображению: путь к входному изображению
+    метод: edges | corners | circles; несколько методов через запятую
+     (edges,corners) считаются с общими промежуточными результатами
+    путь_к_изображению: путь к входному изображению; несколько путей, директории,
+     шаблоны glob (** - рекурсивно) и файлы со списком путей (@список.txt)
+     обрабатываются пакетно в пуле процессов (см. lab1.batch)
     -o, --output: путь для сохранения результата
-     (по умолчанию: <имя_входного_файла>_result.png)
+     (по умолчанию: <имя_входного_файла>_result.png); при пакетной обработке -
+     директория результатов
+    -j, --jobs: число процессов пакетной обработки (по умолчанию: по числу ядер)
     -i,  --impl: выбор реализации - lib (стандартная) или custom (пользовательская)
      (по умолчанию: lib)
+    --tiled: обработка по полосам для изображений больше оперативной памяти
+     (только custom, методы edges и corners); вход и результат - файлы .npy
+     или сырые файлы uint8, отображённые в память
+    --strip-height: число строк в полосе (по умолчанию: 1024)
+    --shape: форма сырого входного файла, например 20000 30000 3
+    --pyramid-levels: число уровней пирамиды для поиска углов от грубого к точному
+     (по умолчанию: 0 - полное разрешение)
+    --report-recall: для corners с --pyramid-levels сравнить углы с полным
+     разрешением и вывести полноту и ускорение
+    --cache-dir: директория кэша результатов; результаты для тех же байтов
+     изображения, метода, реализации и параметров берутся из кэша
+    --cache-size: предельный размер кэша в МБ (по умолчанию: 1024), при
+     превышении удаляются давно не использованные результаты
 
 Пример:
     python main.py edges input.jpg
     python main.py corners input.jpg -o corners_result.png
+    python main.py edges scan.npy -i custom --tiled -o scan_edges.npy
+    python main.py edges photos/ "scans/**/*.png" -i custom -j 4 -o results/batch
+    python main.py edges,corners,circles input.jpg -i custom
+    python main.py corners photos/ -i custom --cache-dir results/cache
 
 Автор: Жиляев Максим
 """
 
 import argparse
 import os
+import time
 
 import cv2
+import numpy as np
 
+from lab1 import batch
 from lab1.implementation import ImageProcessing
-from lab1.implementation.custom_image_processing import CustomImageProcessing
+from lab1.implementation.custom_image_processing import CustomImageProcessing, tiled_strip_height
+from lab1.utils import memmap_io
+from lab1.utils.corner_recall import corner_recall
+from lab1.utils.result_cache import ResultCache, default_cache_size
+
+
+method_names = ("edges", "corners", "circles")
+
+
+def parse_methods(value: str) -> list[str]:
+    """
+    Разбирает список методов через запятую.
+
+    Args:
+        value (str): Аргумент командной строки, например edges,corners
+
+    Returns:
+        list[str]: Методы без повторов
+    """
+    methods = list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    if not methods or any(method not in method_names for method in methods):
+        raise argparse.ArgumentTypeError(
+            f"неизвестный метод {value}: доступны {', '.join(method_names)} и их списки через запятую"
+        )
+    return methods
+
+
+def output_paths(args: argparse.Namespace, default_dir: str) -> dict[str, str]:
+    """
+    Пути результатов обработки одного изображения по методам.
+
+    Args:
+        args (argparse.Namespace): Аргументы командной строки
+        default_dir (str): Директория результатов реализации
+
+    Returns:
+        dict[str, str]: Пути результатов по методам
+    """
+    base, ext = os.path.splitext(args.input)
+    outputs = {}
+    for method in args.method:
+        if args.output and len(args.method) == 1:
+            outputs[method] = args.output
+        elif args.output:
+            output_base, output_ext = os.path.splitext(args.output)
+            outputs[method] = f"{output_base}_{method}{output_ext or '.png'}"
+        else:
+            os.makedirs(f"{default_dir}/{method}", exist_ok=True)
+            outputs[method] = f"{default_dir}/{method}/{os.path.basename(base)}{ext or '.png'}"
+
+    return outputs
+
+
+def run_tiled(args: argparse.Namespace) -> None:
+    """
+    Обрабатывает изображение, отображённое в память, по полосам.
+
+    Args:
+        args (argparse.Namespace): Аргументы командной строки
+    """
+    if args.impl != "custom" or args.method not in ("edges", "corners"):
+        print("Ошибка: обработка по полосам доступна только для custom и методов edges, corners")
+        return
+
+    image = memmap_io.open_image(args.input, args.shape)
+    processor = CustomImageProcessing()
+
+    if args.output:
+        output_path = args.output
+    else:
+        output_dir = f"results/custom_images/{args.method}"
+        os.makedirs(output_dir, exist_ok=True)
+        filename = os.path.splitext(os.path.basename(args.input))[0]
+        output_path = f"{output_dir}/{filename}{memmap_io.npy_extension}"
+
+    if args.method == "edges":
+        output = memmap_io.create_output(output_path, image.shape[:2])
+        processor.edge_detection_tiled(image, output, args.strip_height)
+    else:
+        output = memmap_io.create_output(output_path, image.shape)
+        processor.corner_detection_tiled(image, output, args.strip_height)
+
+    print(f"Результат сохранён в {output_path}")
+
+
+def is_batch(inputs: list[str]) -> bool:
+    """
+    Проверяет, нужна ли пакетная обработка: несколько входов, директория,
+    шаблон glob или файл со списком путей.
+
+    Args:
+        inputs (list[str]): Входы из командной строки
+
+    Returns:
+        bool: True, если входов больше одного файла
+    """
+    if len(inputs) > 1:
+        return True
+    pattern = inputs[0]
+
+    return (
+        pattern.startswith(batch.list_file_prefix)
+        or os.path.isdir(pattern)
+        or batch.is_glob(pattern)
+    )
+
+
+def run_batch(args: argparse.Namespace, cache: ResultCache | None = None) -> None:
+    """
+    Обрабатывает множество изображений в пуле процессов.
+
+    Args:
+        args (argparse.Namespace): Аргументы командной строки
+        cache (ResultCache | None): Кэш результатов (None - без кэша)
+    """
+    inputs = batch.collect_inputs(args.input)
+    if not inputs:
+        print("Ошибка: не найдено ни одного изображения")
+        return
+
+    if args.output:
+        output_dir = args.output
+    elif len(args.method) == 1:
+        output_dir = f"results/{args.impl}_images/{args.method[0]}"
+    else:
+        output_dir = f"results/{args.impl}_images"
+    batch.run_batch(inputs, args.method, args.impl, output_dir, args.jobs, args.pyramid_levels, cache)
+
+
+def report_corner_recall(
+        processor: ImageProcessing | CustomImageProcessing,
+        image: np.ndarray,
+        pyramid_levels: int,
+) -> None:
+    """
+    Выводит полноту углов пирамидального режима относительно полного разрешения.
+
+    Args:
+        processor (ImageProcessing | CustomImageProcessing): Реализация обработки
+        image (np.ndarray): Входное изображение
+        pyramid_levels (int): Число уровней пирамиды
+    """
+    start_time = time.perf_counter()
+    reference = processor.find_corners(image)
+    full_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    corners = processor.find_corners(image, pyramid_levels)
+    pyramid_time = time.perf_counter() - start_time
+
+    print(
+        f"Полнота углов: {corner_recall(reference, corners):.3f} "
+        f"(полное разрешение {full_time:.4f} с, пирамида {pyramid_time:.4f} с, "
+        f"ускорение {full_time / pyramid_time:.1f}x)"
+    )
 
 
 def main() -> None:
@@ -51,21 +231,26 @@ def main() -> None:
     )
     parser.add_argument(
         "method",
-        choices=[
-            "edges",
-            "corners",
-            "circles",
-        ],
-        help="Метод обработки: edges, corners, circles",
+        type=parse_methods,
+        help="Метод обработки: edges, corners, circles или несколько через запятую",
     )
     parser.add_argument(
         "input",
-        help="Путь к входному изображению",
+        nargs="+",
+        help="Путь к входному изображению; несколько путей, директории, шаблоны glob"
+        " и @файл_со_списком обрабатываются пакетно",
     )
     parser.add_argument(
         "-o",
         "--output",
-        help="Путь для сохранения результата (по умолчанию: <input>_result.png)",
+        help="Путь для сохранения результата (по умолчанию: <input>_result.png);"
+        " при пакетной обработке - директория результатов",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Число процессов пакетной обработки (по умолчанию: по числу ядер)",
     )
     parser.add_argument(
         "-i",
@@ -76,15 +261,68 @@ def main() -> None:
         " (по умолчанию: lib)",
     )
 
+    parser.add_argument(
+        "--tiled",
+        action="store_true",
+        help="Обработка по полосам файла .npy или сырого файла, отображённого в память",
+    )
+    parser.add_argument(
+        "--strip-height",
+        type=int,
+        default=tiled_strip_height,
+        help=f"Число строк в полосе при обработке по полосам (по умолчанию: {tiled_strip_height})",
+    )
+    parser.add_argument(
+        "--shape",
+        type=int,
+        nargs="+",
+        help="Форма сырого входного файла при обработке по полосам, например 20000 30000 3",
+    )
+
+    parser.add_argument(
+        "--pyramid-levels",
+        type=int,
+        default=0,
+        help="Число уровней пирамиды для поиска углов (по умолчанию: 0 - полное разрешение)",
+    )
+    parser.add_argument(
+        "--report-recall",
+        action="store_true",
+        help="Сравнить углы пирамидального режима с полным разрешением",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help="Директория кэша результатов: результаты для тех же байтов изображения,"
+        " метода и параметров берутся из кэша (по умолчанию: без кэша)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=default_cache_size >> 20,
+        help=f"Предельный размер кэша результатов в МБ (по умолчанию: {default_cache_size >> 20})",
+    )
+
     args = parser.parse_args()
+    cache = ResultCache(args.cache_dir, args.cache_size << 20) if args.cache_dir else None
 
-    # Загрузка изображения
-    image = cv2.imread(args.input)
-    if image is None:
-        print(f"Ошибка: не удалось загрузить изображение {args.input}")
+    if is_batch(args.input):
+        if args.tiled:
+            print("Ошибка: обработка по полосам доступна только для одного файла")
+            return
+        run_batch(args, cache)
         return
+    args.input = args.input[0]
 
-        # Выбор реализации
+    if args.tiled:
+        if len(args.method) > 1:
+            print("Ошибка: обработка по полосам доступна только для одного метода")
+            return
+        args.method = args.method[0]
+        run_tiled(args)
+        return
+
+    # Выбор реализации
     if args.impl == "lib":
         processor = ImageProcessing()
         default_dir = "results/lib_images"
@@ -92,34 +330,18 @@ def main() -> None:
         processor = CustomImageProcessing()
         default_dir = "results/custom_images"
 
-    # Выбор метода
-    if args.method == "edges":
-        default_dir += "/edges"
-        result = processor.edge_detection(image)
-    elif args.method == "corners":
-        default_dir += "/corners"
-        result = processor.corner_detection(image)
-    elif args.method == "circles":
-        default_dir += "/circles"
-        result = processor.circle_detection(image)
-    else:
-        print("Ошибка: неизвестный метод")
+    # Обработка и сохранение результатов; найденные в кэше результаты не пересчитываются
+    outputs = output_paths(args, default_dir)
+    try:
+        batch.process_image(processor, args.impl, args.input, outputs, args.pyramid_levels, cache)
+    except ValueError as exception:
+        print(f"Ошибка: {args.input}: {exception}")
         return
+    for output_path in outputs.values():
+        print(f"Результат сохранён в {output_path}")
 
-    # Создаем директорию для результатов, если она не существует
-    os.makedirs(default_dir, exist_ok=True)
-
-    # Определение пути для сохранения
-    if args.output:
-        output_path = args.output
-    else:
-        base, ext = os.path.splitext(args.input)
-        filename = os.path.basename(base)
-        output_path = f"{default_dir}/{filename}{ext or '.png'}"
-
-    # Сохранение результата
-    cv2.imwrite(output_path, result)
-    print(f"Результат сохранён в {output_path}")
+    if args.report_recall and args.pyramid_levels > 0 and "corners" in args.method:
+        report_corner_recall(processor, cv2.imread(args.input), args.pyramid_levels)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from lab1 import batch
+from lab1.implementation import ImageProcessing
+from lab1.utils.result_cache import ResultCache
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        """Создание директории с изображениями в двух поддиректориях."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        rng = np.random.default_rng(13)
+        self.images = {}
+        for subdirectory, name in (("a", "cat.png"), ("a", "dog.png"), ("b", "cat.png")):
+            path = os.path.join(self.root, subdirectory, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            image = rng.integers(0, 256, (40, 60, 3), dtype=np.uint8)
+            cv2.imwrite(path, image)
+            self.images[path] = image
+        with open(os.path.join(self.root, "a", "notes.txt"), "w", encoding="utf-8") as file:
+            file.write("не изображение")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_collect_inputs(self):
+        """Тест раскрытия директорий, шаблонов и списков путей."""
+        first, second, third = self.images
+        list_path = os.path.join(self.root, "list.txt")
+        with open(list_path, "w", encoding="utf-8") as file:
+            file.write(f"{third}\n\n{first}\n")
+
+        self.assertEqual(batch.collect_inputs([os.path.join(self.root, "a")]), [first, second])
+        self.assertEqual(batch.collect_inputs([os.path.join(self.root, "**", "cat.png")]), [first, third])
+        self.assertEqual(batch.collect_inputs(["@" + list_path, first]), [third, first])
+
+        # имя с символами шаблона - обычный файл, а не glob
+        bracket_path = os.path.join(self.root, "photo[1].png")
+        with open(bracket_path, "wb") as file:
+            file.write(b"")
+        self.assertEqual(batch.collect_inputs([bracket_path]), [bracket_path])
+        self.assertFalse(batch.is_glob(bracket_path))
+        self.assertTrue(batch.is_glob(os.path.join(self.root, "photo[2].png")))
+
+    def test_run_batch(self):
+        """Тест пакетной обработки: результаты совпадают с обработкой по одному."""
+        output_dir = os.path.join(self.root, "out")
+        summary = batch.run_batch(
+            list(self.images) + [os.path.join(self.root, "b", "missing.png")], ["edges"], "lib", output_dir, workers=2,
+        )
+
+        self.assertEqual((summary["processed"], summary["failed"]), (3, 1))
+        self.assertGreater(summary["images_per_second"], 0)
+        processor = ImageProcessing()
+        for path, output_path in zip(self.images, batch.output_paths(list(self.images), output_dir)):
+            self.assertTrue(output_path.startswith(output_dir))
+            expected = processor.edge_detection(cv2.imread(path))
+            np.testing.assert_array_equal(cv2.imread(output_path, cv2.IMREAD_GRAYSCALE), expected)
+        with self.assertRaises(ValueError):
+            batch.run_batch(list(self.images), ["edges"], "lib", output_dir, workers=0)
+
+    def test_run_batch_methods(self):
+        """Тест пакетной обработки несколькими методами: каждый метод в своей поддиректории."""
+        output_dir = os.path.join(self.root, "out")
+        summary = batch.run_batch(list(self.images), ["edges", "corners"], "lib", output_dir, workers=1)
+
+        self.assertEqual((summary["processed"], summary["failed"]), (3, 0))
+        processor = ImageProcessing()
+        for path in self.images:
+            image = cv2.imread(path)
+            relative = os.path.relpath(path, self.root)
+            edges = cv2.imread(os.path.join(output_dir, "edges", relative), cv2.IMREAD_GRAYSCALE)
+            corners = cv2.imread(os.path.join(output_dir, "corners", relative))
+            np.testing.assert_array_equal(edges, processor.edge_detection(image))
+            np.testing.assert_array_equal(corners, processor.corner_detection(image))
+
+    def test_run_batch_cache(self):
+        """Тест кэша результатов: повторный запуск берёт все результаты из кэша."""
+        cache = ResultCache(os.path.join(self.root, "cache"))
+        first_dir, second_dir = os.path.join(self.root, "first"), os.path.join(self.root, "second")
+        first = batch.run_batch(list(self.images), ["edges", "corners"], "lib", first_dir, workers=1, cache=cache)
+        second = batch.run_batch(list(self.images), ["edges", "corners"], "lib", second_dir, workers=1, cache=cache)
+
+        self.assertEqual((first["processed"], first["cached"]), (3, 0))
+        self.assertEqual((second["processed"], second["cached"]), (3, 6))
+        for method in ("edges", "corners"):
+            for path in self.images:
+                relative = os.path.join(method, os.path.relpath(path, self.root))
+                with open(os.path.join(first_dir, relative), "rb") as file:
+                    expected = file.read()
+                with open(os.path.join(second_dir, relative), "rb") as file:
+                    self.assertEqual(file.read(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
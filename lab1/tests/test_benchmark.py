@@ -0,0 +1,43 @@
+import unittest
+
+from lab1 import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_benchmarks(self):
+        """Тест замеров: прогрев отделён, все поля заполнены для каждой реализации."""
+        results = benchmark.run_benchmarks(
+            ["256"], ["lib", "custom"], ["_gamma_correction", "edge_detection"], repeat=1,
+        )
+
+        self.assertEqual(len(results["results"]), 4)
+        self.assertIn("numba_threads", results["environment"])
+        for result in results["results"]:
+            self.assertEqual((result["height"], result["width"]), (256, 256))
+            self.assertGreater(result["median_seconds"], 0)
+            self.assertGreater(result["megapixels_per_second"], 0)
+            self.assertGreaterEqual(result["warmup_seconds"], 0)
+            self.assertGreaterEqual(result["peak_memory_mb"], 0)
+
+        with self.assertRaises(ValueError):
+            benchmark.run_benchmarks(["256"], ["lib"], ["edge_detection"], repeat=0)
+
+    def test_compare_results(self):
+        """Тест поиска регрессий относительно эталона."""
+        def results(seconds):
+            return {"results": [
+                {"implementation": "custom", "method": method, "size": "256", "median_seconds": value}
+                for method, value in seconds.items()
+            ]}
+
+        baseline = results({"edge_detection": 1.0, "corner_detection": 1.0})
+        current = results({"edge_detection": 1.05, "corner_detection": 1.5, "circle_detection": 2.0})
+        comparison = benchmark.compare_results(baseline, current, tolerance=0.1)
+
+        self.assertEqual([row["method"] for row in comparison], ["edge_detection", "corner_detection"])
+        self.assertEqual([row["regression"] for row in comparison], [False, True])
+        self.assertAlmostEqual(comparison[1]["ratio"], 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
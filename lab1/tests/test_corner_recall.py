@@ -0,0 +1,25 @@
+import unittest
+
+import numpy as np
+
+from lab1.utils.corner_recall import corner_recall
+
+
+class TestCornerRecall(unittest.TestCase):
+    def test_corner_recall(self):
+        """Тест полноты углов с допуском по смещению."""
+        reference = np.zeros((20, 20), dtype=bool)
+        reference[[2, 10, 15], [3, 10, 18]] = True
+        detected = np.zeros_like(reference)
+        detected[3, 4] = True
+        detected[10, 12] = True
+
+        self.assertAlmostEqual(corner_recall(reference, detected), 1 / 3)
+        self.assertAlmostEqual(corner_recall(reference, detected, tolerance=2), 2 / 3)
+        self.assertEqual(corner_recall(np.zeros_like(reference), detected), 1.0)
+        with self.assertRaises(ValueError):
+            corner_recall(reference, detected[:10])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,494 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from lab1.implementation.custom_image_processing import (
+    CustomImageProcessing,
+    gaussian_kernel,
+    sobel_kernel_x,
+    sobel_kernel_y,
+    warmup,
+)
+from lab1.implementation.image_processing import ImageProcessing
+from lab1.implementation.keypoints import keypoint_dtype
+from lab1.utils import memmap_io
+from lab1.utils.corner_recall import corner_recall
+
+
+def dense_convolution(image: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """Эталонная плотная свёртка (корреляция) с отражением границ."""
+    kernel_height, kernel_width = kernel.shape
+    pad_height, pad_width = kernel_height // 2, kernel_width // 2
+    padded = np.pad(image, ((pad_height, pad_height), (pad_width, pad_width)), mode="reflect")
+    windows = np.lib.stride_tricks.sliding_window_view(padded, kernel.shape)
+    result = np.einsum("ijkl,kl->ij", windows, kernel).astype(np.float32)
+    return result[:image.shape[0], :image.shape[1]]
+
+
+class TestCustomConvolution(unittest.TestCase):
+    def setUp(self):
+        """Создание тестового изображения."""
+        rng = np.random.default_rng(0)
+        self.processor = CustomImageProcessing()
+        self.gray = (rng.random((61, 47)) * 255).astype(np.float32)
+
+    def test_separate_kernel(self):
+        """Тест разложения ядер ранга 1."""
+        for kernel in (sobel_kernel_x, sobel_kernel_y, gaussian_kernel):
+            column, row = self.processor._separate_kernel(kernel)
+            np.testing.assert_allclose(np.outer(column, row), kernel, atol=1e-7)
+
+        laplacian = np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]], dtype=np.float32)
+        self.assertIsNone(self.processor._separate_kernel(laplacian))
+        self.assertIsNone(self.processor._separate_kernel(np.zeros((3, 3), dtype=np.float32)))
+
+    def test_separable_matches_dense(self):
+        """Тест совпадения сепарабельного пути с плотным."""
+        wide_gaussian = np.outer([1, 4, 6, 4, 1], [1, 4, 6, 4, 1]).astype(np.float32) / 256.0
+        for kernel in (sobel_kernel_x, sobel_kernel_y, gaussian_kernel, wide_gaussian):
+            expected = dense_convolution(self.gray, kernel)
+            result = self.processor._convolution(self.gray, kernel)
+            self.assertEqual(result.dtype, np.float32)
+            np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-3)
+
+    def test_non_separable_kernel(self):
+        """Тест свёртки с несепарабельным ядром."""
+        laplacian = np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]], dtype=np.float32)
+        expected = dense_convolution(self.gray, laplacian)
+        np.testing.assert_allclose(self.processor._convolution(self.gray, laplacian), expected, atol=1e-3)
+
+    def test_large_image_tiles(self):
+        """Тест свёртки изображения из нескольких плиток с ядром больше 3x3."""
+        rng = np.random.default_rng(2)
+        gray = (rng.random((150, 530)) * 255).astype(np.float32)
+        kernel = rng.random((5, 7)).astype(np.float32)
+        np.testing.assert_allclose(
+            self.processor._convolution(gray, kernel), dense_convolution(gray, kernel), rtol=1e-5, atol=1e-3,
+        )
+
+    def test_convolution_batch(self):
+        """Тест пакетной свёртки стопки изображений."""
+        rng = np.random.default_rng(5)
+        images = (rng.random((4, 33, 29)) * 255).astype(np.float32)
+        laplacian = np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]], dtype=np.float32)
+
+        for kernel in (sobel_kernel_x, laplacian):
+            result = self.processor.convolution_batch(images, kernel)
+            self.assertEqual(result.shape, images.shape)
+            for index in range(len(images)):
+                np.testing.assert_allclose(result[index], dense_convolution(images[index], kernel), atol=1e-3)
+
+        fft_result = CustomImageProcessing(convolution_backend="fft").convolution_batch(images, laplacian)
+        np.testing.assert_allclose(fft_result, self.processor.convolution_batch(images, laplacian), atol=1e-2)
+
+    def test_num_threads(self):
+        """Тест настройки числа потоков."""
+        processor = CustomImageProcessing(num_threads=1)
+        self.assertEqual(processor.num_threads, 1)
+        np.testing.assert_allclose(
+            processor._convolution(self.gray, sobel_kernel_x), dense_convolution(self.gray, sobel_kernel_x), atol=1e-3,
+        )
+        with self.assertRaises(ValueError):
+            CustomImageProcessing(num_threads=0)
+
+
+class TestWarmup(unittest.TestCase):
+    def test_warmup(self):
+        """Тест прогрева ядер numba и отчёта о времени."""
+        timings = warmup(num_threads=1)
+
+        self.assertIn("edge_detection", timings)
+        self.assertIn("corner_detection", timings)
+        self.assertTrue(all(value >= 0 for value in timings.values()))
+        self.assertAlmostEqual(
+            timings["total"], sum(value for name, value in timings.items() if name != "total"), delta=0.1,
+        )
+
+
+class TestFFTConvolution(unittest.TestCase):
+    def setUp(self):
+        """Создание тестового изображения и ядра."""
+        rng = np.random.default_rng(3)
+        self.gray = (rng.random((90, 77)) * 255).astype(np.float32)
+        self.kernel = rng.random((15, 15)).astype(np.float32)
+
+    def test_fft_matches_direct(self):
+        """Тест совпадения FFT-свёртки с прямой."""
+        result = CustomImageProcessing(convolution_backend="fft")._convolution(self.gray, self.kernel)
+        expected = dense_convolution(self.gray, self.kernel)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected, rtol=1e-4)
+
+        even_kernel = self.kernel[:4, :6]
+        result = CustomImageProcessing(convolution_backend="fft")._convolution(self.gray, even_kernel)
+        np.testing.assert_allclose(result, dense_convolution(self.gray, even_kernel), rtol=1e-4)
+
+    def test_auto_backend_uses_calibration(self):
+        """Тест выбора способа свёртки по сохранённой калибровке."""
+        processor = CustomImageProcessing()
+        saved_calibration = CustomImageProcessing._fft_calibration
+        try:
+            CustomImageProcessing._fft_calibration = {
+                str(processor.num_threads): {"direct_ns_per_tap": 1.0, "fft_ns_per_point": 1.0},
+            }
+            self.assertFalse(processor._use_fft((1000, 1000), (3, 3), 6))
+            self.assertTrue(processor._use_fft((1000, 1000), (31, 31), 31 * 31))
+        finally:
+            CustomImageProcessing._fft_calibration = saved_calibration
+
+    def test_unknown_backend(self):
+        """Тест ошибки при неизвестном способе свёртки."""
+        with self.assertRaises(ValueError):
+            CustomImageProcessing(convolution_backend="winograd")
+
+
+class TestCustomEdgeDetection(unittest.TestCase):
+    def setUp(self):
+        """Создание тестового изображения."""
+        rng = np.random.default_rng(1)
+        self.processor = CustomImageProcessing()
+        self.image = rng.integers(0, 256, (53, 71, 3), dtype=np.uint8)
+
+    def test_fused_sobel_matches_convolution(self):
+        """Тест совпадения слитого прохода Собеля с двумя свёртками."""
+        gray = self.processor._rgb_to_grayscale(self.image)
+        row_index = self.processor._reflect_indices(gray.shape[0], 1)
+        col_index = self.processor._reflect_indices(gray.shape[1], 1)
+        magnitude = np.empty_like(gray[np.newaxis])
+        gradient_x = np.empty_like(magnitude)
+        gradient_y = np.empty_like(magnitude)
+
+        max_magnitudes = self.processor._sobel_magnitude(
+            gray[np.newaxis], row_index, col_index, magnitude, gradient_x, gradient_y, True,
+        )
+        magnitude, gradient_x, gradient_y = magnitude[0], gradient_x[0], gradient_y[0]
+
+        expected_x = dense_convolution(gray, sobel_kernel_x)
+        expected_y = dense_convolution(gray, sobel_kernel_y)
+        np.testing.assert_allclose(gradient_x, expected_x, atol=1e-3)
+        np.testing.assert_allclose(gradient_y, expected_y, atol=1e-3)
+        np.testing.assert_allclose(magnitude, np.sqrt(expected_x ** 2 + expected_y ** 2), atol=1e-3)
+        self.assertAlmostEqual(max_magnitudes[0], float(magnitude.max()), places=3)
+
+    def test_edge_detection(self):
+        """Тест совпадения обнаружения границ с библиотечной реализацией."""
+        edges = self.processor.edge_detection(self.image)
+        self.assertEqual(edges.dtype, np.uint8)
+        self.assertEqual(edges.shape, self.image.shape[:2])
+        self.assertEqual(set(np.unique(edges)), {0, 255})
+        np.testing.assert_array_equal(edges, ImageProcessing().edge_detection(self.image))
+
+        test_images = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_images")
+        for name in ("NotreDame.jpg", "chessboard.jpg"):
+            image = cv2.imread(os.path.join(test_images, name))
+            np.testing.assert_array_equal(
+                self.processor.edge_detection(image), ImageProcessing().edge_detection(image),
+            )
+
+        flat = np.full((10, 10, 3), 128, dtype=np.uint8)
+        self.assertEqual(self.processor.edge_detection(flat).max(), 0)
+
+    def test_integer_mode(self):
+        """Тест совпадения целочисленного режима с вещественным."""
+        processor = CustomImageProcessing(integer_mode=True)
+        gray = processor._rgb_to_grayscale_fixed(self.image)
+        self.assertEqual(gray.dtype, np.uint8)
+        np.testing.assert_array_equal(gray, cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY))
+        np.testing.assert_array_equal(
+            self.processor._rgb_to_grayscale(self.image), processor._canny_grayscale(self.image).astype(np.float32),
+        )
+        np.testing.assert_array_equal(
+            processor._canny_grayscale(self.image), cv2.cvtColor(self.image, cv2.COLOR_RGB2GRAY),
+        )
+
+        expected = self.processor.edge_detection(self.image)
+        np.testing.assert_array_equal(processor.edge_detection(self.image), expected)
+
+        images = np.stack([self.image, np.full_like(self.image, 9)])
+        edges = processor.edge_detection_batch(images)
+        np.testing.assert_array_equal(edges[0], expected)
+        self.assertEqual(edges[1].max(), 0)
+
+    def test_edge_detection_grayscale(self):
+        """Тест обнаружения границ на изображении, декодированном в оттенках серого."""
+        gray = cv2.GaussianBlur(cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY), (3, 3), 0)
+        expected = cv2.Canny(gray, 200, 300)
+
+        np.testing.assert_array_equal(self.processor.edge_detection(gray), expected)
+        np.testing.assert_array_equal(CustomImageProcessing(integer_mode=True).edge_detection(gray), expected)
+
+    def test_canny_matches_opencv(self):
+        """Тест совпадения детектора Канни с cv2.Canny."""
+        rng = np.random.default_rng(5)
+        gray = cv2.GaussianBlur(rng.integers(0, 256, (67, 89), dtype=np.uint8), (5, 5), 1.5)
+        image = np.dstack([gray, gray, gray])
+
+        for low_threshold, high_threshold in ((50.0, 100.0), (200.0, 300.0)):
+            edges = self.processor.canny_edge_detection(image, low_threshold, high_threshold)
+            expected = cv2.Canny(gray, low_threshold, high_threshold, L2gradient=False)
+            self.assertEqual(edges.dtype, np.uint8)
+            np.testing.assert_array_equal(edges, expected)
+
+        np.testing.assert_array_equal(
+            self.processor.canny_edge_detection(image, 300.0, 200.0),
+            self.processor.canny_edge_detection(image, 200.0, 300.0),
+        )
+
+    def test_edge_detection_batch(self):
+        """Тест пакетного обнаружения границ."""
+        rng = np.random.default_rng(4)
+        images = rng.integers(0, 256, (3, 40, 30, 3), dtype=np.uint8)
+        images[1] = 7
+
+        edges = self.processor.edge_detection_batch(images)
+
+        self.assertEqual(edges.shape, (3, 40, 30))
+        for index in range(3):
+            np.testing.assert_array_equal(edges[index], self.processor.edge_detection(images[index]))
+        with self.assertRaises(ValueError):
+            self.processor.edge_detection_batch(images[0])
+
+
+class TestCustomCornerDetection(unittest.TestCase):
+    def setUp(self):
+        """Создание тестового изображения."""
+        rng = np.random.default_rng(6)
+        self.processor = CustomImageProcessing()
+        self.gray = (rng.random((150, 83)) * 255).astype(np.float32)
+
+    def test_fused_harris_matches_convolution(self):
+        """Тест совпадения слитого отклика Харриса с расчётом через свёртки."""
+        harris_k = 0.04
+        gradient_x = dense_convolution(self.gray, sobel_kernel_x)
+        gradient_y = dense_convolution(self.gray, sobel_kernel_y)
+        smoothed_xx = dense_convolution(gradient_x * gradient_x, gaussian_kernel)
+        smoothed_yy = dense_convolution(gradient_y * gradient_y, gaussian_kernel)
+        smoothed_xy = dense_convolution(gradient_x * gradient_y, gaussian_kernel)
+        trace = smoothed_xx + smoothed_yy
+        expected = smoothed_xx * smoothed_yy - smoothed_xy * smoothed_xy - harris_k * trace * trace
+
+        response = self.processor._compute_harris_response(self.gray, harris_k)
+
+        self.assertEqual(response.dtype, np.float32)
+        np.testing.assert_allclose(response, expected, rtol=1e-3, atol=1e-3 * np.abs(expected).max())
+
+
+    def test_non_maximum_suppression(self):
+        """Тест совпадения скомпилированного подавления немаксимумов с окном 3x3."""
+        rng = np.random.default_rng(7)
+        response = np.round(rng.random((60, 70)), 2).astype(np.float32)
+        mask = response > 0.5
+
+        expected = np.zeros_like(mask)
+        for row in range(1, response.shape[0] - 1):
+            for col in range(1, response.shape[1] - 1):
+                if mask[row, col]:
+                    neighborhood = response[row - 1: row + 2, col - 1: col + 2]
+                    expected[row, col] = response[row, col] == np.max(neighborhood)
+
+        np.testing.assert_array_equal(self.processor._non_maximum_suppression(response, mask), expected)
+
+        wide = self.processor._non_maximum_suppression(response, mask, 3)
+        self.assertFalse(wide[:3].any() or wide[-3:].any())
+        self.assertTrue(np.all(expected[wide]))
+        self.assertLess(wide.sum(), expected.sum())
+
+
+    def test_adaptive_threshold(self):
+        """Тест выбора порога без полной сортировки."""
+        rng = np.random.default_rng(8)
+        response = rng.random((40, 50)).astype(np.float32)
+
+        for target in (0, 10, 1000, 1999):
+            expected = np.sort(response.flatten())[::-1][target]
+            expected = max(0.1, min(0.9, float(expected)))
+            self.assertEqual(self.processor._find_adaptive_threshold(response, target), expected)
+
+        self.assertEqual(self.processor._find_adaptive_threshold(response, 5000), 0.1)
+        self.assertEqual(self.processor._find_adaptive_threshold(np.empty((0, 0), dtype=np.float32), 5), 0.5)
+
+    def test_top_corners(self):
+        """Тест получения координат пикселей с наибольшим откликом."""
+        rng = np.random.default_rng(9)
+        response = rng.random((30, 20)).astype(np.float32)
+
+        rows, cols, values = self.processor._find_top_corners(response, 5)
+
+        np.testing.assert_array_equal(values, np.sort(response.ravel())[::-1][:5])
+        np.testing.assert_array_equal(response[rows, cols], values)
+        self.assertEqual(len(self.processor._find_top_corners(response, 0)[0]), 0)
+
+
+    def test_harris_response_tiles(self):
+        """Тест совпадения отклика в плитках с откликом по всему изображению."""
+        image = np.random.default_rng(10).integers(0, 256, (75, 101, 3), dtype=np.uint8)
+        gray = self.processor._rgb_to_grayscale(image)
+        expected = self.processor._compute_harris_response(gray, 0.04)
+        tile_rows, tile_cols = np.nonzero(np.ones((3, 4), dtype=np.bool_))
+
+        response = self.processor._harris_response_tiles(
+            image, self.processor._reflect_indices(75, 1), self.processor._reflect_indices(101, 1),
+            0.04, tile_rows, tile_cols,
+        )
+
+        tiles = response.reshape(3, 4, 32, 32).transpose(0, 2, 1, 3).reshape(96, 128)
+        np.testing.assert_array_equal(tiles[:75, :101], expected)
+        self.assertTrue(np.all(np.isneginf(tiles[75:])))
+
+    def test_find_corners_pyramid(self):
+        """Тест пирамидального поиска углов."""
+        image = np.full((512, 640, 3), 30, dtype=np.uint8)
+        rng = np.random.default_rng(11)
+        for _ in range(25):
+            top, left = rng.integers(10, 420), rng.integers(10, 540)
+            height, width = rng.integers(20, 80, size=2)
+            image[top:top + height, left:left + width] = rng.integers(80, 255, size=3)
+
+        reference = self.processor.find_corners(image)
+        corners = self.processor.find_corners(image, pyramid_levels=2)
+
+        self.assertEqual(corners.shape, image.shape[:2])
+        self.assertGreater(np.count_nonzero(reference), 0)
+        self.assertGreaterEqual(corner_recall(reference, corners), 0.9)
+        self.assertEqual(self.processor.corner_detection(image, 2).shape, image.shape)
+        with self.assertRaises(ValueError):
+            self.processor.find_corners(image, pyramid_levels=-1)
+
+    def test_corner_keypoints(self):
+        """Тест углов (y, x, response): отрисовка всех углов совпадает с corner_detection."""
+        image = np.full((512, 640, 3), 30, dtype=np.uint8)
+        rng = np.random.default_rng(12)
+        for _ in range(25):
+            top, left = rng.integers(10, 420), rng.integers(10, 540)
+            height, width = rng.integers(20, 80, size=2)
+            image[top:top + height, left:left + width] = rng.integers(80, 255, size=3)
+
+        for levels in (0, 2):
+            corners = self.processor.corner_keypoints(image, max_keypoints=None, pyramid_levels=levels)
+            mask = self.processor.find_corners(image, levels)
+
+            self.assertEqual(corners.dtype, keypoint_dtype)
+            self.assertEqual(corners.size, np.count_nonzero(mask))
+            self.assertTrue(np.all(mask[corners["y"], corners["x"]]))
+            self.assertTrue(np.all(np.diff(corners["response"]) <= 0))
+            self.assertTrue(np.all(corners["response"] > 0))
+            drawn = self.processor.draw_corners(image.copy(), corners)
+            np.testing.assert_array_equal(drawn, self.processor.corner_detection(image, levels))
+
+        strongest = self.processor.corner_keypoints(image, max_keypoints=10)
+        np.testing.assert_array_equal(strongest, self.processor.corner_keypoints(image, max_keypoints=None)[:10])
+
+    def test_run_methods(self):
+        """Тест графа операций: результаты совпадают с отдельными методами, отклик - с слитым."""
+        image = np.random.default_rng(14).integers(0, 256, (70, 90, 3), dtype=np.uint8)
+        image[20:50, 30:60] = 220
+        gray = self.processor._rgb_to_grayscale(image)
+
+        gradient_x, gradient_y = self.processor.operator_graph().run(image, ["sobel"])["sobel"]
+        np.testing.assert_array_equal(
+            self.processor._compute_harris_response_gradients(gradient_x, gradient_y, 0.04),
+            self.processor._compute_harris_response(gray, 0.04),
+        )
+
+        for processor in (self.processor, CustomImageProcessing(integer_mode=True)):
+            results = processor.run_methods(image, ["edges", "corners", "circles"])
+            np.testing.assert_array_equal(results["edges"], processor.edge_detection(image))
+            np.testing.assert_array_equal(results["corners"], processor.corner_detection(image))
+            np.testing.assert_array_equal(results["circles"], processor.circle_detection(image))
+
+    def test_run_methods_shares_sobel(self):
+        """Тест: границы и углы в одном вызове run_methods считают градиенты Собеля один раз."""
+        image = np.random.default_rng(15).integers(0, 256, (70, 90, 3), dtype=np.uint8)
+        sobel_gradients = CustomImageProcessing._sobel_gradients
+        harris_response = CustomImageProcessing._harris_response
+
+        with (
+            patch.object(CustomImageProcessing, "_sobel_gradients", wraps=sobel_gradients) as sobel,
+            patch.object(CustomImageProcessing, "_harris_response", wraps=harris_response) as harris,
+        ):
+            self.processor.run_methods(image, ["edges", "corners"])
+
+        self.assertEqual(sobel.call_count, 1)
+        self.assertEqual(harris.call_count, 0)
+
+
+class TestTiledProcessing(unittest.TestCase):
+    def setUp(self):
+        """Создание тестового изображения с углами."""
+        rng = np.random.default_rng(6)
+        self.image = rng.integers(0, 60, (83, 57, 3), dtype=np.uint8)
+        self.image[20:50, 10:40] = 200
+        self.image[60:70, 30:50] = 120
+
+    def test_tiled_matches_full_image(self):
+        """Тест совпадения обработки по полосам с обработкой целого изображения."""
+        for integer_mode in (False, True):
+            processor = CustomImageProcessing(integer_mode=integer_mode, suppression_radius=2)
+            edges = processor.edge_detection(self.image)
+            corners = processor.corner_detection(self.image)
+            for strip_height in (1, 6, 40, 1000):
+                tiled_edges = np.zeros(self.image.shape[:2], dtype=np.uint8)
+                tiled_corners = np.zeros_like(self.image)
+                processor.edge_detection_tiled(self.image, tiled_edges, strip_height)
+                processor.corner_detection_tiled(self.image, tiled_corners, strip_height)
+                np.testing.assert_array_equal(tiled_edges, edges)
+                np.testing.assert_array_equal(tiled_corners, corners)
+
+    def test_tiled_memmap(self):
+        """Тест обработки по полосам файлов, отображённых в память."""
+        processor = CustomImageProcessing()
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "image.raw")
+            self.image.tofile(input_path)
+            output_path = os.path.join(directory, "edges.npy")
+
+            image = memmap_io.open_image(input_path, self.image.shape)
+            output = memmap_io.create_output(output_path, self.image.shape[:2])
+            processor.edge_detection_tiled(image, output, 16)
+            del image, output
+
+            np.testing.assert_array_equal(np.load(output_path), processor.edge_detection(self.image))
+            with self.assertRaises(ValueError):
+                memmap_io.open_image(input_path)
+
+    def test_tiled_wrong_output(self):
+        """Тест проверки формы выходного массива."""
+        with self.assertRaises(ValueError):
+            CustomImageProcessing().edge_detection_tiled(self.image, np.zeros(self.image.shape, dtype=np.uint8))
+
+
+class TestCustomCircleDetection(unittest.TestCase):
+    def setUp(self):
+        """Создание изображения с двумя кругами."""
+        rng = np.random.default_rng(10)
+        self.processor = CustomImageProcessing()
+        image = np.full((240, 320, 3), 40, dtype=np.uint8)
+        cv2.circle(image, (90, 110), 40, (200, 180, 160), -1)
+        cv2.circle(image, (230, 140), 60, (90, 200, 90), -1)
+        self.image = np.clip(image + rng.normal(0, 6, image.shape), 0, 255).astype(np.uint8)
+
+    def test_find_circles(self):
+        """Тест поиска окружностей градиентным преобразованием Хафа."""
+        circles = self.processor.find_circles(self.image, 20, 80)
+
+        self.assertEqual(circles.shape, (2, 3))
+        for expected in ((90, 110, 40), (230, 140, 60)):
+            distances = np.abs(circles - np.array(expected)).max(axis=1)
+            self.assertLessEqual(distances.min(), 3)
+
+    def test_circle_detection(self):
+        """Тест визуализации найденных окружностей."""
+        result = self.processor.circle_detection(self.image, 20, 80)
+
+        self.assertEqual(result.shape, self.image.shape)
+        self.assertTrue(np.any(np.all(result == [0, 255, 0], axis=2)))
+        with self.assertRaises(ValueError):
+            self.processor.find_circles(self.image, 50, 20)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+import argparse
+import unittest
+
+import cv2
+import numpy as np
+
+from lab1.utils.image_decode import DecodePolicy, add_decode_args, decode_policy_from_args, image_size
+
+
+class TestImageDecode(unittest.TestCase):
+    def setUp(self):
+        """Создание гладкого изображения 300x500 в JPEG и PNG."""
+        rows, cols = np.mgrid[0:300, 0:500]
+        self.image = np.dstack([rows * 255 // 300, cols * 255 // 500, (rows + cols) % 256]).astype(np.uint8)
+        self.jpeg = cv2.imencode(".jpg", self.image)[1].tobytes()
+        self.png = cv2.imencode(".png", self.image)[1].tobytes()
+
+    def test_image_size(self):
+        """Тест чтения размеров из заголовка JPEG и PNG."""
+        self.assertEqual(image_size(self.jpeg), (300, 500))
+        self.assertEqual(image_size(self.png), (300, 500))
+        self.assertIsNone(image_size(b"not an image"))
+        self.assertIsNone(image_size(self.jpeg[:4]))
+
+    def test_decode_grayscale(self):
+        """Тест декодирования в оттенках серого: форма (H, W), яркость близка к cvtColor."""
+        policy = DecodePolicy.for_methods(["edges"])
+        image = policy.decode(self.jpeg)
+
+        self.assertTrue(policy.grayscale)
+        self.assertFalse(DecodePolicy.for_methods(["edges", "corners"]).grayscale)
+        self.assertEqual(image.shape, (300, 500))
+        expected = cv2.cvtColor(cv2.imdecode(np.frombuffer(self.jpeg, np.uint8), cv2.IMREAD_COLOR), cv2.COLOR_BGR2GRAY)
+        self.assertLess(np.abs(image.astype(np.int16) - expected).mean(), 1)
+
+    def test_decode_reduced(self):
+        """Тест уменьшения при декодировании: большая сторона не больше max_size."""
+        for data in (self.jpeg, self.png):
+            for max_size, flag in ((200, cv2.IMREAD_REDUCED_COLOR_2), (100, cv2.IMREAD_REDUCED_COLOR_4)):
+                policy = DecodePolicy(max_size=max_size)
+                self.assertEqual(policy.flags(image_size(data)), flag)
+                self.assertEqual(policy.decode(data).shape, (max_size * 3 // 5, max_size, 3))
+
+        self.assertEqual(DecodePolicy(max_size=1000).decode(self.jpeg).shape, (300, 500, 3))
+        self.assertEqual(DecodePolicy(grayscale=True, max_size=100).decode(self.jpeg).shape, (60, 100))
+        self.assertIsNone(DecodePolicy(max_size=100).decode(b"not an image"))
+        with self.assertRaises(ValueError):
+            DecodePolicy(max_size=0)
+
+    def test_decode_args(self):
+        """Тест политики из аргументов командной строки: серое - только для методов, которым хватает яркости."""
+        parser = argparse.ArgumentParser()
+        add_decode_args(parser)
+
+        args = parser.parse_args(["--grayscale-decode", "--max-size", "200"])
+        self.assertEqual(decode_policy_from_args(args, ["edges"]), DecodePolicy(grayscale=True, max_size=200))
+        self.assertEqual(decode_policy_from_args(args, ["edges", "corners"]), DecodePolicy(max_size=200))
+        self.assertEqual(decode_policy_from_args(parser.parse_args([]), ["edges"]), DecodePolicy())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
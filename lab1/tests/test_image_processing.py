@@ -0,0 +1,107 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from lab1.implementation import ImageProcessing
+from lab1.implementation.keypoints import keypoint_dtype
+from lab1.utils.corner_recall import corner_recall
+
+
+class TestCircleDetection(unittest.TestCase):
+    def setUp(self):
+        """Создание изображения с двумя кругами."""
+        self.processor = ImageProcessing()
+        self.image = np.full((1200, 1600, 3), 40, dtype=np.uint8)
+        cv2.circle(self.image, (400, 500), 120, (200, 180, 160), -1)
+        cv2.circle(self.image, (1100, 700), 200, (90, 200, 90), -1)
+        self.expected = np.array([[400, 500, 120], [1100, 700, 200]])
+
+    def assert_circles_found(self, circles: np.ndarray, tolerance: int) -> None:
+        """Проверяет, что каждая ожидаемая окружность найдена с точностью tolerance."""
+        self.assertEqual(circles.shape[1], 3)
+        for expected in self.expected:
+            self.assertLessEqual(np.abs(circles - expected).max(axis=1).min(), tolerance)
+
+    def test_find_circles_full_resolution(self):
+        """Тест поиска окружностей на полном разрешении."""
+        self.assert_circles_found(self.processor.find_circles(self.image, 80, 250, pyramid_levels=0), 15)
+
+    def test_find_circles_pyramid(self):
+        """Тест поиска окружностей от грубого к точному."""
+        self.assertGreater(self.processor._choose_pyramid_levels(self.image.shape[:2], 250), 0)
+        self.assert_circles_found(self.processor.find_circles(self.image, 80, 250), 3)
+
+    def test_circle_detection(self):
+        """Тест визуализации найденных окружностей."""
+        result = self.processor.circle_detection(self.image, 80, 250)
+
+        self.assertEqual(result.shape, self.image.shape)
+        self.assertTrue(np.any(np.all(result == [0, 255, 0], axis=2)))
+        with self.assertRaises(ValueError):
+            self.processor.find_circles(self.image, 80, 250, pyramid_levels=-1)
+
+
+
+class TestCornerDetection(unittest.TestCase):
+    def setUp(self):
+        """Создание изображения с прямоугольниками."""
+        self.processor = ImageProcessing()
+        self.image = np.full((512, 640, 3), 30, dtype=np.uint8)
+        rng = np.random.default_rng(11)
+        for _ in range(25):
+            top, left = rng.integers(10, 420), rng.integers(10, 540)
+            height, width = rng.integers(20, 80, size=2)
+            self.image[top:top + height, left:left + width] = rng.integers(80, 255, size=3)
+
+    def test_edge_detection_grayscale(self):
+        """Тест обнаружения границ на изображении, декодированном в оттенках серого."""
+        gray = cv2.cvtColor(self.image, cv2.COLOR_RGB2GRAY)
+
+        np.testing.assert_array_equal(self.processor.edge_detection(gray), self.processor.edge_detection(self.image))
+
+    def test_corner_detection(self):
+        """Тест совпадения визуализации с расширенным откликом cv2.cornerHarris."""
+        gray = np.float32(cv2.cvtColor(self.image, cv2.COLOR_RGB2GRAY))
+        dst = cv2.dilate(cv2.cornerHarris(gray, 2, 3, 0.04), None)
+        expected = self.image.copy()
+        expected[dst > 0.01 * dst.max()] = [255, 0, 0]
+
+        np.testing.assert_array_equal(self.processor.corner_detection(self.image), expected)
+
+    def test_find_corners_pyramid(self):
+        """Тест пирамидального поиска углов."""
+        reference = self.processor.find_corners(self.image)
+        corners = self.processor.find_corners(self.image, pyramid_levels=2)
+
+        self.assertEqual(corners.shape, self.image.shape[:2])
+        self.assertGreaterEqual(corner_recall(reference, corners), 0.95)
+        with self.assertRaises(ValueError):
+            self.processor.find_corners(self.image, pyramid_levels=10)
+
+    def test_corner_keypoints(self):
+        """Тест углов (y, x, response): отрисовка всех углов совпадает с corner_detection."""
+        corners = self.processor.corner_keypoints(self.image, max_keypoints=None)
+
+        self.assertEqual(corners.dtype, keypoint_dtype)
+        self.assertEqual(corners.size, np.count_nonzero(self.processor.find_corners(self.image)))
+        self.assertTrue(np.all(np.diff(corners["response"]) <= 0))
+        drawn = self.processor.draw_corners(self.image.copy(), corners)
+        np.testing.assert_array_equal(drawn, self.processor.corner_detection(self.image))
+
+        strongest = self.processor.corner_keypoints(self.image, max_keypoints=5)
+        np.testing.assert_array_equal(strongest, corners[:5])
+        with self.assertRaises(ValueError):
+            self.processor.draw_corners(self.image[..., 0].copy(), corners)
+
+    def test_run_methods(self):
+        """Тест графа операций: результаты совпадают с отдельными методами."""
+        results = self.processor.run_methods(self.image, ["edges", "corners", "circles"])
+
+        np.testing.assert_array_equal(results["edges"], self.processor.edge_detection(self.image))
+        np.testing.assert_array_equal(results["corners"], self.processor.corner_detection(self.image))
+        np.testing.assert_array_equal(results["circles"], self.processor.circle_detection(self.image))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+import unittest
+
+from lab1.utils import metrics
+from lab1.utils.time_measure import measure_time
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.enabled = metrics.registry.enabled
+        metrics.registry.reset()
+
+    def tearDown(self):
+        metrics.set_enabled(self.enabled)
+        metrics.registry.reset()
+
+    def test_percentiles(self):
+        """Тест перцентилей по гистограмме: погрешность не больше ширины корзины."""
+        stats = metrics.FunctionStats()
+        for value in range(1, 1001):
+            stats.record(value * 1000)
+
+        self.assertEqual(stats.count, 1000)
+        self.assertEqual((stats.min_ns, stats.max_ns), (1000, 1_000_000))
+        for percent in metrics.summary_percentiles:
+            expected = percent * 10_000
+            self.assertLess(abs(stats.percentile(percent) - expected), expected / metrics.histogram_sub_buckets)
+        self.assertEqual(stats.percentile(100), 1_000_000)
+
+    def test_measure_time(self):
+        """Тест декоратора: замер при включённом реестре, пропуск при выключенном."""
+        @measure_time
+        def square(value):
+            return value * value
+
+        metrics.set_enabled(True)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square.__name__, "square")
+        self.assertEqual(metrics.registry.stats(square.__qualname__).count, 1)
+
+        metrics.set_enabled(False)
+        square(4)
+        self.assertEqual(metrics.registry.stats(square.__qualname__).count, 1)
+
+    def test_collect_and_merge(self):
+        """Тест объединения замеров процесса пула с замерами родителя."""
+        worker = metrics.MetricsRegistry()
+        worker.record("edge_detection", 2000)
+        worker.record("edge_detection", 4000)
+        snapshot = worker.collect()
+        self.assertIsNone(worker.stats("edge_detection"))
+
+        metrics.registry.record("edge_detection", 1000)
+        metrics.registry.merge(snapshot)
+        stats = metrics.registry.stats("edge_detection")
+
+        self.assertEqual((stats.count, stats.total_ns), (3, 7000))
+        self.assertEqual((stats.min_ns, stats.max_ns), (1000, 4000))
+        self.assertIn("edge_detection: вызовов 3", metrics.registry.summary())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,74 @@
+import unittest
+import weakref
+
+import numpy as np
+
+from lab1.implementation.operator_graph import Operator, OperatorGraph
+
+
+class TestOperatorGraph(unittest.TestCase):
+    def setUp(self):
+        """Граф: общий узел gray с двумя потребителями."""
+        self.calls = []
+        self.released = None
+
+        def node(name, function):
+            def wrapper(*values):
+                self.calls.append(name)
+                return function(*values)
+            return wrapper
+
+        def check_released(gradient):
+            # к этому моменту у gray не осталось потребителей
+            self.released = self.gray_reference() is None
+            return gradient.sum()
+
+        def gray(image):
+            result = image.astype(np.float32) / 2
+            self.gray_reference = weakref.ref(result)
+            return result
+
+        self.graph = OperatorGraph([
+            Operator("gray", ("image",), node("gray", gray)),
+            Operator("gradient", ("gray",), node("gradient", lambda values: np.diff(values, axis=1))),
+            Operator("edges", ("gradient",), node("edges", np.abs)),
+            Operator(
+                "corners", ("gray", "gradient"), node("corners", lambda values, gradient: values[:, 1:] * gradient),
+            ),
+            Operator("total", ("gradient",), node("total", check_released)),
+        ])
+        self.image = np.arange(12, dtype=np.uint8).reshape(3, 4)
+
+    def test_shared_nodes_once(self):
+        """Тест: общие узлы считаются один раз, ненужные не считаются."""
+        results = self.graph.run(self.image, ["edges", "corners"])
+
+        self.assertEqual(sorted(self.calls), ["corners", "edges", "gradient", "gray"])
+        self.assertEqual(list(results), ["edges", "corners"])
+        np.testing.assert_array_equal(results["edges"], np.full((3, 3), 0.5, dtype=np.float32))
+
+        self.calls.clear()
+        self.graph.run(self.image, ["edges"])
+        self.assertNotIn("corners", self.calls)
+
+    def test_release_intermediates(self):
+        """Тест освобождения промежуточного результата после последнего потребителя."""
+        self.graph.run(self.image, ["total"])
+        self.assertTrue(self.released)
+
+        self.graph.run(self.image, ["total", "gray"])
+        self.assertFalse(self.released)
+
+    def test_invalid_graph(self):
+        """Тест ошибок: неизвестный узел, повтор имени и цикл."""
+        with self.assertRaises(ValueError):
+            self.graph.run(self.image, ["circles"])
+        with self.assertRaises(ValueError):
+            OperatorGraph([Operator("gray", ("image",), abs), Operator("gray", ("image",), abs)])
+        cyclic = OperatorGraph([Operator("a", ("b",), abs), Operator("b", ("a",), abs)])
+        with self.assertRaises(ValueError):
+            cyclic.plan(["a"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
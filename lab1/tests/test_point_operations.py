@@ -0,0 +1,56 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from lab1.implementation import point_operations
+
+
+class TestPointOperations(unittest.TestCase):
+    def setUp(self):
+        """Создание тестового изображения."""
+        rng = np.random.default_rng(0)
+        self.image = rng.integers(0, 256, (31, 43, 3), dtype=np.uint8)
+
+    def test_build_lut(self):
+        """Тест построения таблицы из нескольких преобразований."""
+        identity = point_operations.build_lut()
+        np.testing.assert_array_equal(identity, np.arange(256, dtype=np.uint8))
+
+        gamma = point_operations.build_lut(gamma=2.2)
+        expected = np.array([(i / 255.0) ** (1 / 2.2) * 255 for i in range(256)]).astype(np.uint8)
+        np.testing.assert_array_equal(gamma, expected)
+
+        table = point_operations.build_lut(gamma=0.5, contrast=1.5, brightness=-20.0, low=10, high=200)
+        values = (np.arange(256) / 255.0) ** 2.0 * 255 * 1.5 - 20.0
+        np.testing.assert_array_equal(table, np.clip(values, 10, 200).astype(np.uint8))
+
+        with self.assertRaises(ValueError):
+            point_operations.build_lut(gamma=0.0)
+        with self.assertRaises(ValueError):
+            point_operations.build_lut(low=100, high=50)
+
+    def test_lut_cache(self):
+        """Тест запоминания таблиц и ограничения размера кэша."""
+        point_operations.build_lut.cache_clear()
+        table = point_operations.build_lut(gamma=1.7)
+        self.assertIs(point_operations.build_lut(gamma=1.7), table)
+        self.assertFalse(table.flags.writeable)
+
+        for index in range(point_operations.lut_cache_size + 10):
+            point_operations.build_lut(gamma=1.0 + index / 100)
+        self.assertEqual(point_operations.build_lut.cache_info().currsize, point_operations.lut_cache_size)
+
+    def test_apply_lut(self):
+        """Тест применения таблицы (совпадение с cv2.LUT)."""
+        table = point_operations.build_lut(gamma=0.8, contrast=1.2)
+        result = point_operations.apply_lut(self.image, table)
+
+        self.assertEqual(result.shape, self.image.shape)
+        np.testing.assert_array_equal(result, cv2.LUT(self.image, table))
+        with self.assertRaises(ValueError):
+            point_operations.apply_lut(self.image.astype(np.float32), table)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from lab1.utils import result_cache
+from lab1.utils.result_cache import ResultCache, cache_temp_suffix
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(os.path.join(self.directory.name, "cache"), max_bytes=350)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_key(self):
+        """Тест ключа: меняется от метода, реализации, расширения и параметров."""
+        key = ResultCache.key("abc", "edges", "lib", ".png", {"pyramid_levels": 0})
+
+        self.assertEqual(key, ResultCache.key("abc", "edges", "lib", ".PNG", {"pyramid_levels": 0}))
+        self.assertEqual(
+            len({
+                key,
+                ResultCache.key("abd", "edges", "lib", ".png", {"pyramid_levels": 0}),
+                ResultCache.key("abc", "corners", "lib", ".png", {"pyramid_levels": 0}),
+                ResultCache.key("abc", "edges", "custom", ".png", {"pyramid_levels": 0}),
+                ResultCache.key("abc", "edges", "lib", ".jpg", {"pyramid_levels": 0}),
+                ResultCache.key("abc", "edges", "lib", ".png", {"pyramid_levels": 2}),
+            }),
+            6,
+        )
+
+    def test_fingerprint_sources(self):
+        """Тест отпечатка: учитывает модули отрисовки результатов, а не только реализации."""
+        fingerprint = result_cache.implementation_fingerprint.__wrapped__()
+
+        self.assertEqual(fingerprint, result_cache.implementation_fingerprint())
+        with patch.object(result_cache, "fingerprint_sources", ("implementation/*.py",)):
+            self.assertNotEqual(result_cache.implementation_fingerprint.__wrapped__(), fingerprint)
+        with patch.object(result_cache, "fingerprint_sources", ("implementation/*.py", "batch.py")):
+            self.assertNotEqual(result_cache.implementation_fingerprint.__wrapped__(), fingerprint)
+
+    def test_get_put(self):
+        """Тест записи и чтения: запись атомарна, временных файлов не остаётся."""
+        self.assertIsNone(self.cache.get("ab01"))
+        self.cache.put("ab01", b"result")
+
+        self.assertEqual(self.cache.get("ab01"), b"result")
+        self.assertEqual(self.cache.size(), len(b"result"))
+        for _, _, names in os.walk(self.cache.directory):
+            self.assertFalse(any(name.endswith(cache_temp_suffix) for name in names))
+
+    def test_evict(self):
+        """Тест вытеснения: удаляются записи, которые дольше всего не читались."""
+        for index, key in enumerate(("aa01", "bb02", "cc03")):
+            self.cache.put(key, bytes(100))
+            past = time.time() - 100 + index
+            os.utime(os.path.join(self.cache.directory, key[:2], key), (past, past))
+        # чтение делает первую запись самой свежей
+        self.assertIsNotNone(self.cache.get("aa01"))
+        self.cache.put("dd04", bytes(100))
+
+        self.assertIsNone(self.cache.get("bb02"))
+        for key in ("aa01", "cc03", "dd04"):
+            self.assertIsNotNone(self.cache.get(key))
+        self.assertLessEqual(self.cache.size(), self.cache.max_bytes)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
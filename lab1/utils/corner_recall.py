@@ -0,0 +1,38 @@
+"""
+Модуль corner_recall.py
+
+Сравнение найденных углов с эталонным прогоном (например, пирамидального режима
+с полным разрешением).
+"""
+
+import numpy as np
+
+
+def corner_recall(reference: np.ndarray, detected: np.ndarray, tolerance: int = 1) -> float:
+    """
+    Доля эталонных углов, рядом с которыми есть найденный угол.
+
+    Args:
+        reference (np.ndarray): Маска эталонных углов (H, W)
+        detected (np.ndarray): Маска найденных углов (H, W)
+        tolerance (int): Допустимое смещение в пикселях по каждой оси
+
+    Returns:
+        float: Полнота от 0 до 1 (1, если эталонных углов нет)
+    """
+    if reference.shape != detected.shape:
+        raise ValueError(f"Размеры масок не совпадают: {reference.shape} и {detected.shape}")
+
+    reference_count = np.count_nonzero(reference)
+    if reference_count == 0:
+        return 1.0
+
+    # расширяем найденные углы квадратом (2 * tolerance + 1) сдвигами маски
+    height, width = detected.shape
+    padded = np.pad(detected.astype(bool), tolerance)
+    near_detected = np.zeros(detected.shape, dtype=bool)
+    for row_offset in range(2 * tolerance + 1):
+        for col_offset in range(2 * tolerance + 1):
+            near_detected |= padded[row_offset:row_offset + height, col_offset:col_offset + width]
+
+    return np.count_nonzero(reference.astype(bool) & near_detected) / reference_count
@@ -0,0 +1,185 @@
+"""
+Модуль image_decode.py
+
+Политика декодирования загруженных изображений.
+
+Конвейеры загрузки (lab2, lab4, lab5) получают изображение байтами и раньше
+всегда декодировали его cv2.IMREAD_COLOR в полном размере, хотя обнаружение
+границ сразу переводит его в оттенки серого. DecodePolicy задаёт:
+- grayscale - декодировать сразу в оттенки серого (IMREAD_GRAYSCALE), когда
+  нужны только границы: для JPEG это яркость без перевода цвета;
+- max_size - предельный размер большей стороны: JPEG декодируется с
+  уменьшением в 2, 4 или 8 раз (IMREAD_REDUCED_*, масштабирование в DCT
+  дешевле полного декодирования), остаток уменьшается cv2.resize.
+
+Размеры для выбора уменьшения читаются из заголовка JPEG или PNG без
+декодирования. Точки входа конвейеров добавляют одинаковые аргументы
+командной строки (add_decode_args) и строят политику по методам, которые
+считает конвейер (decode_policy_from_args).
+"""
+
+import argparse
+import struct
+from dataclasses import dataclass
+from typing import Iterable
+
+import cv2
+import numpy as np
+
+# уменьшение при декодировании: (во сколько раз, флаг цвета, флаг оттенков серого)
+reduced_decode_flags = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+)
+grayscale_methods = frozenset({"edges"})  # методы, которым достаточно яркости
+
+png_signature = b"\x89PNG\r\n\x1a\n"
+# маркеры SOF с размерами кадра (C4 - таблицы Хаффмана, C8 - резерв, CC - арифметическое кодирование)
+jpeg_frame_markers = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# маркеры без поля длины
+jpeg_standalone_markers = frozenset({0x01, *range(0xD0, 0xD9)})
+
+
+def image_size(data: bytes) -> tuple[int, int] | None:
+    """
+    Читает размеры изображения из заголовка JPEG или PNG.
+
+    Args:
+        data (bytes): Закодированное изображение
+
+    Returns:
+        tuple[int, int] | None: Высота и ширина или None для других форматов
+         и повреждённых заголовков
+    """
+    if data[:8] == png_signature and len(data) >= 24:
+        width, height = struct.unpack(">II", data[16:24])
+        return height, width
+    if data[:2] != b"\xff\xd8":
+        return None
+
+    offset = 2
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            # байт-заполнитель перед маркером
+            offset += 1
+            continue
+        if marker in jpeg_standalone_markers:
+            offset += 2
+            continue
+        (length,) = struct.unpack(">H", data[offset + 2:offset + 4])
+        if marker in jpeg_frame_markers:
+            if offset + 9 > len(data):
+                return None
+            height, width = struct.unpack(">HH", data[offset + 5:offset + 9])
+            return height, width
+        offset += 2 + length
+
+    return None
+
+
+@dataclass(frozen=True)
+class DecodePolicy:
+    """
+    Способ декодирования изображения.
+
+    Attributes:
+        grayscale (bool): Декодировать сразу в оттенки серого (результат (H, W)).
+        max_size (int | None): Предельный размер большей стороны (None - полный размер).
+    """
+    grayscale: bool = False
+    max_size: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_size is not None and self.max_size < 1:
+            raise ValueError("Предельный размер изображения должен быть >= 1")
+
+    @classmethod
+    def for_methods(cls, methods: Iterable[str], max_size: int | None = None) -> "DecodePolicy":
+        """
+        Политика для набора методов: оттенки серого, если нужны только границы.
+
+        Args:
+            methods (Iterable[str]): Методы обработки: edges, corners, circles
+            max_size (int | None): Предельный размер большей стороны
+
+        Returns:
+            DecodePolicy: Политика декодирования
+        """
+        methods = set(methods)
+        return cls(grayscale=bool(methods) and methods <= grayscale_methods, max_size=max_size)
+
+    def flags(self, size: tuple[int, int] | None = None) -> int:
+        """
+        Флаг cv2.imdecode для изображения заданного размера.
+
+        Выбирается наибольшее уменьшение, при котором большая сторона остаётся
+        не меньше max_size, чтобы не терять разрешение до окончательного resize.
+
+        Args:
+            size (tuple[int, int] | None): Высота и ширина из заголовка (None - неизвестны)
+
+        Returns:
+            int: Флаг декодирования
+        """
+        if self.max_size is not None and size is not None:
+            for factor, color_flag, grayscale_flag in reduced_decode_flags:
+                if max(size) >= self.max_size * factor:
+                    return grayscale_flag if self.grayscale else color_flag
+
+        return cv2.IMREAD_GRAYSCALE if self.grayscale else cv2.IMREAD_COLOR
+
+    def decode(self, data: bytes) -> np.ndarray | None:
+        """
+        Декодирует изображение по политике.
+
+        Args:
+            data (bytes): Закодированное изображение
+
+        Returns:
+            np.ndarray | None: Изображение (H, W, 3) или (H, W) для grayscale,
+             None, если декодировать не удалось
+        """
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        image = cv2.imdecode(buffer, self.flags(image_size(data) if self.max_size is not None else None))
+        if image is None or self.max_size is None:
+            return image
+
+        height, width = image.shape[:2]
+        if max(height, width) > self.max_size:
+            scale = self.max_size / max(height, width)
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+        return image
+
+
+def add_decode_args(parser: argparse.ArgumentParser) -> None:
+    """
+    Добавляет аргументы командной строки политики декодирования.
+
+    Args:
+        parser (argparse.ArgumentParser): Парсер аргументов
+    """
+    parser.add_argument("--grayscale-decode", action="store_true",
+                        help="Декодировать изображения сразу в оттенках серого, если методам "
+                             "обработки достаточно яркости (исходные изображения сохраняются серыми)")
+    parser.add_argument("--max-size", type=int, default=None,
+                        help="Предельный размер большей стороны изображения при декодировании")
+
+
+def decode_policy_from_args(args: argparse.Namespace, methods: Iterable[str]) -> DecodePolicy:
+    """
+    Политика декодирования по аргументам add_decode_args.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы
+        methods (Iterable[str]): Методы обработки, которые считает конвейер
+
+    Returns:
+        DecodePolicy: Политика декодирования
+    """
+    return DecodePolicy.for_methods(methods if args.grayscale_decode else (), args.max_size)
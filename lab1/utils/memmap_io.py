@@ -0,0 +1,50 @@
+"""
+Модуль memmap_io.py
+
+Открытие изображений, отображённых в память (np.memmap), для обработки по полосам.
+
+Поддерживаются файлы .npy (форма и тип берутся из заголовка) и «сырые» файлы
+без заголовка: пиксели uint8 подряд, форма задаётся явно.
+"""
+
+import os
+
+import numpy as np
+
+npy_extension = ".npy"
+
+
+def open_image(path: str, shape: tuple[int, ...] | None = None) -> np.ndarray:
+    """
+    Отображает изображение в память только для чтения.
+
+    Args:
+        path (str): Путь к файлу .npy или к сырому файлу uint8
+        shape (tuple[int, ...] | None): Форма изображения для сырого файла, например (H, W, 3)
+
+    Returns:
+        np.ndarray: Массив np.memmap; данные читаются с диска по мере обращения
+    """
+    if os.path.splitext(path)[1].lower() == npy_extension:
+        return np.load(path, mmap_mode="r")
+    if shape is None:
+        raise ValueError(f"Для файла без заголовка {path} нужно указать форму изображения")
+
+    return np.memmap(path, dtype=np.uint8, mode="r", shape=tuple(shape))
+
+
+def create_output(path: str, shape: tuple[int, ...]) -> np.ndarray:
+    """
+    Создаёт выходной файл uint8 заданной формы и отображает его в память.
+
+    Args:
+        path (str): Путь к файлу .npy или к сырому файлу
+        shape (tuple[int, ...]): Форма результата
+
+    Returns:
+        np.ndarray: Массив np.memmap для записи
+    """
+    if os.path.splitext(path)[1].lower() == npy_extension:
+        return np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=tuple(shape))
+
+    return np.memmap(path, dtype=np.uint8, mode="w+", shape=tuple(shape))
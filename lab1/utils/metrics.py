@@ -0,0 +1,273 @@
+"""
+Модуль metrics.py
+
+Реестр замеров времени выполнения функций.
+
+Для каждой функции хранятся число вызовов, суммарное, минимальное и максимальное
+время и гистограмма с логарифмическими корзинами (16 корзин на каждую степень
+двойки, погрешность перцентилей не больше 1/16). Гистограммы складываются,
+поэтому процессы пула копят замеры у себя, а родитель объединяет их через
+collect() в процессе пула и merge() в родителе. Сводка печатается при выходе
+из основного процесса.
+
+Замеры включены по умолчанию; выключаются переменной окружения
+IMAGE_METRICS=0 или вызовом set_enabled(False). Выключенный декоратор
+measure_time только проверяет флаг и вызывает функцию.
+"""
+
+import atexit
+import math
+import multiprocessing
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+metrics_env_var = "IMAGE_METRICS"
+histogram_sub_bits = 4  # 2^4 корзин на степень двойки
+histogram_sub_buckets = 1 << histogram_sub_bits
+summary_percentiles = (50, 95, 99)
+
+
+def _bucket_index(elapsed_ns: int) -> int:
+    """Номер корзины гистограммы для времени в наносекундах."""
+    if elapsed_ns < histogram_sub_buckets:
+        return elapsed_ns
+    shift = elapsed_ns.bit_length() - 1 - histogram_sub_bits
+    return ((shift + 1) << histogram_sub_bits) + (elapsed_ns >> shift) - histogram_sub_buckets
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """Границы [нижняя, верхняя) корзины гистограммы в наносекундах."""
+    if index < histogram_sub_buckets:
+        return index, index + 1
+    shift = (index >> histogram_sub_bits) - 1
+    mantissa = (index & (histogram_sub_buckets - 1)) + histogram_sub_buckets
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class FunctionStats:
+    """Замеры одной функции: счётчики и гистограмма времени."""
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets: dict[int, int] = {}
+
+    def record(self, elapsed_ns: int) -> None:
+        """
+        Добавляет один замер.
+
+        Args:
+            elapsed_ns (int): Время выполнения в наносекундах
+        """
+        if self.count == 0 or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.count += 1
+        self.total_ns += elapsed_ns
+        index = _bucket_index(elapsed_ns)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: "FunctionStats") -> None:
+        """
+        Добавляет замеры другого набора.
+
+        Args:
+            other (FunctionStats): Замеры той же функции из другого процесса
+        """
+        if other.count == 0:
+            return
+        if self.count == 0 or other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def percentile(self, percent: float) -> float:
+        """
+        Оценивает перцентиль времени по гистограмме.
+
+        Args:
+            percent (float): Перцентиль от 0 до 100
+
+        Returns:
+            float: Время в наносекундах (середина корзины, в пределах [min, max])
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        # крайние значения известны точно
+        if rank == 1:
+            return float(self.min_ns)
+        if rank >= self.count:
+            return float(self.max_ns)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                lower, upper = _bucket_bounds(index)
+                return min(max((lower + upper - 1) / 2, self.min_ns), self.max_ns)
+
+        return float(self.max_ns)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Представление из простых типов для передачи между процессами."""
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "buckets": dict(self.buckets),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "FunctionStats":
+        """Восстанавливает замеры из представления to_dict."""
+        stats = cls()
+        stats.count = data["count"]
+        stats.total_ns = data["total_ns"]
+        stats.min_ns = data["min_ns"]
+        stats.max_ns = data["max_ns"]
+        stats.buckets = {int(index): count for index, count in data["buckets"].items()}
+        return stats
+
+
+class MetricsRegistry:
+    """Замеры функций текущего процесса."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._stats: dict[str, FunctionStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        """
+        Добавляет замер функции.
+
+        Args:
+            name (str): Имя функции
+            elapsed_ns (int): Время выполнения в наносекундах
+        """
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = FunctionStats()
+            stats.record(elapsed_ns)
+
+    def stats(self, name: str) -> FunctionStats | None:
+        """Замеры функции или None, если она не вызывалась."""
+        return self._stats.get(name)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Копия замеров из простых типов (сериализуется pickle и json).
+
+        Returns:
+            dict[str, dict[str, Any]]: Замеры по именам функций
+        """
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def collect(self) -> dict[str, dict[str, Any]]:
+        """
+        Возвращает замеры и очищает реестр; используется в процессах пула,
+        чтобы каждый замер попал к родителю ровно один раз.
+
+        Returns:
+            dict[str, dict[str, Any]]: Замеры по именам функций
+        """
+        with self._lock:
+            snapshot = {name: stats.to_dict() for name, stats in self._stats.items()}
+            self._stats.clear()
+        return snapshot
+
+    def merge(self, snapshot: dict[str, dict[str, Any]]) -> None:
+        """
+        Объединяет замеры другого процесса с текущими.
+
+        Args:
+            snapshot (dict[str, dict[str, Any]]): Результат snapshot() или collect()
+        """
+        with self._lock:
+            for name, data in snapshot.items():
+                stats = self._stats.get(name)
+                if stats is None:
+                    stats = self._stats[name] = FunctionStats()
+                stats.merge(FunctionStats.from_dict(data))
+
+    def reset(self) -> None:
+        """Удаляет все замеры."""
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self) -> str:
+        """
+        Текстовая сводка: число вызовов, суммарное время и перцентили по функциям.
+
+        Returns:
+            str: Сводка, функции упорядочены по суммарному времени
+        """
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda item: item[1].total_ns, reverse=True)
+            lines = ["Замеры времени выполнения:"]
+            for name, stats in items:
+                percentiles = ", ".join(
+                    f"p{percent} {stats.percentile(percent) / 1e6:.3f} мс" for percent in summary_percentiles
+                )
+                lines.append(
+                    f"  {name}: вызовов {stats.count}, всего {stats.total_ns / 1e9:.4f} с, {percentiles}, "
+                    f"max {stats.max_ns / 1e6:.3f} мс"
+                )
+        return "\n".join(lines)
+
+
+registry = MetricsRegistry(enabled=os.environ.get(metrics_env_var, "1") != "0")
+
+
+def set_enabled(enabled: bool) -> None:
+    """
+    Включает или выключает замеры во всём процессе.
+
+    Args:
+        enabled (bool): True - замерять, False - вызывать функции без замеров
+    """
+    registry.enabled = enabled
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    """
+    Замеряет время выполнения блока кода.
+
+    Args:
+        name (str): Имя, под которым замер попадёт в реестр
+    """
+    if not registry.enabled:
+        yield
+        return
+    start_ns = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        registry.record(name, time.perf_counter_ns() - start_ns)
+
+
+def _print_summary() -> None:
+    """Печатает сводку при выходе из основного процесса."""
+    # процессы пула отдают замеры родителю через collect()
+    if multiprocessing.parent_process() is not None:
+        return
+    if registry.enabled and registry.snapshot():
+        print(registry.summary())
+
+
+atexit.register(_print_summary)
@@ -0,0 +1,208 @@
+"""
+Модуль result_cache.py
+
+Дисковый кэш результатов обработки с адресацией по содержимому.
+
+Ключ - SHA-256 от байтов входного файла, метода, реализации, её параметров,
+расширения результата и отпечатка исходного кода lab1.implementation и модулей,
+которые рисуют и кодируют результат (batch.py, main.py), поэтому изменение
+изображения, параметров или кода даёт новый ключ, а старые записи со временем
+вытесняются. Значение - закодированный результат (байты файла
+.png и т. п.): при попадании он записывается в выходной файл без декодирования
+входа и повторной обработки.
+
+Запись атомарна: данные пишутся во временный файл в той же директории и
+переносятся os.replace, поэтому процессы пула могут писать в кэш одновременно,
+а прерванный запуск не оставляет обрезанных записей. Размер кэша ограничен;
+при превышении удаляются записи, которые дольше всего не читались (время
+изменения файла обновляется при каждом попадании).
+"""
+
+import functools
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any
+
+default_cache_size = 1 << 30  # 1 ГБ
+cache_format_version = 1
+cache_temp_suffix = ".tmp"
+# исходники lab1, от которых зависит содержимое записей: реализации, а также
+# отрисовка результатов и их кодирование
+fingerprint_sources = ("implementation/*.py", "batch.py", "main.py")
+
+
+@functools.lru_cache(maxsize=1)
+def implementation_fingerprint() -> str:
+    """
+    Отпечаток исходного кода: меняется при любой правке файлов fingerprint_sources.
+
+    Returns:
+        str: SHA-256 исходных файлов реализаций и модулей отрисовки результатов
+    """
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for pattern in fingerprint_sources:
+        for path in sorted(glob.glob(os.path.join(directory, pattern))):
+            digest.update(os.path.relpath(path, directory).encode())
+            with open(path, "rb") as file:
+                digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Кэш результатов в директории: по файлу на запись, записи разложены
+    по поддиректориям по первым двум символам ключа.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = default_cache_size) -> None:
+        """
+        Args:
+            directory (str): Директория кэша (создаётся при первой записи)
+            max_bytes (int): Предельный суммарный размер записей в байтах
+        """
+        if max_bytes < 0:
+            raise ValueError("Размер кэша должен быть >= 0")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # размер записей по оценке этого процесса, уточняется при вытеснении
+        self._size: int | None = None
+
+    @staticmethod
+    def key(image_digest: str, method: str, impl: str, extension: str, params: dict[str, Any] | None = None) -> str:
+        """
+        Ключ записи.
+
+        Args:
+            image_digest (str): SHA-256 байтов входного файла (hexdigest)
+            method (str): Метод обработки
+            impl (str): Реализация - lib или custom
+            extension (str): Расширение результата, определяет кодирование
+            params (dict[str, Any] | None): Параметры, влияющие на результат
+
+        Returns:
+            str: Ключ (hexdigest)
+        """
+        description = json.dumps(
+            {
+                "version": cache_format_version,
+                "source": implementation_fingerprint(),
+                "image": image_digest,
+                "method": method,
+                "impl": impl,
+                "extension": extension.lower(),
+                "params": params or {},
+            },
+            sort_keys=True,
+        )
+
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Путь к файлу записи."""
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Читает запись и отмечает её как недавно использованную.
+
+        Args:
+            key (str): Ключ записи
+
+        Returns:
+            bytes | None: Закодированный результат или None, если записи нет
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            os.utime(path)
+        except FileNotFoundError:
+            # запись могла быть вытеснена другим процессом между чтением и utime
+            return None
+
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Атомарно записывает результат и при превышении размера вытесняет старые записи.
+
+        Args:
+            key (str): Ключ записи
+            data (bytes): Закодированный результат
+        """
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=cache_temp_suffix)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """Записи кэша: время последнего использования, размер и путь."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for subdirectory in os.scandir(self.directory):
+            if not subdirectory.is_dir():
+                continue
+            for entry in os.scandir(subdirectory.path):
+                if entry.name.endswith(cache_temp_suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        return entries
+
+    def size(self) -> int:
+        """
+        Суммарный размер записей на диске.
+
+        Returns:
+            int: Размер в байтах
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """
+        Удаляет записи, которые дольше всего не использовались, пока размер
+        кэша не станет не больше max_bytes.
+
+        Returns:
+            int: Число удалённых записей
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._size = total
+
+        return removed
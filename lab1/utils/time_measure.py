@@ -1,12 +1,27 @@
+import functools
 import time
 
+from lab1.utils import metrics
+
 
 def measure_time(func):
+    """
+    Записывает время выполнения функции в реестр metrics.registry.
+
+    Время замеряется через perf_counter_ns, сводка печатается при выходе
+    из программы. Если замеры выключены (metrics.set_enabled(False)), обёртка
+    только вызывает функцию.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"Метод {func.__name__} выполнен за {end_time - start_time:.4f} секунд")
-        return result
+        if not metrics.registry.enabled:
+            return func(*args, **kwargs)
+        start_ns = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            metrics.registry.record(name, time.perf_counter_ns() - start_ns)
 
     return wrapper
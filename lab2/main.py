@@ -1,10 +1,18 @@
-from lab2.CatImage import CatImage
-from lab2.CatImageProcessor import CatImageProcessor
-import cv2
-import os
+import argparse
+
+from lab1.utils.image_decode import add_decode_args, decode_policy_from_args
+from lab2.processor.CatImageProcessor import CatImageProcessor
+
+
+def parse_args():
+    """Парсинг аргументов командной строки."""
+    parser = argparse.ArgumentParser(description='Загрузка и обработка изображений кошек')
+    add_decode_args(parser)
+    return parser
 
 
 def main():
+    args = parse_args().parse_args()
     try:
         # Запрос количества изображений
         limit = int(input("Введите количество изображений: "))
@@ -12,7 +20,7 @@ def main():
             print("Максимальное количество изображений за один запрос - 100. Установлено 100.")
             limit = 100
 
-        processor = CatImageProcessor()
+        processor = CatImageProcessor(decode_policy_from_args(args, CatImageProcessor.PROCESSING_METHODS))
         api_data = processor.get_json_images(limit)
         if api_data:
             cat_images = processor.json_to_cat_images(api_data)
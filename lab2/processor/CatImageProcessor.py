@@ -6,6 +6,7 @@ import numpy as np
 import requests
 from dotenv import load_dotenv
 
+from lab1.utils.image_decode import DecodePolicy
 from lab1.utils.time_measure import measure_time
 from lab2.CatImage import CatImage
 
@@ -19,15 +20,21 @@ class CatImageProcessor:
     _BASE_URL: Final[str] = "https://api.thecatapi.com/v1/images/search"
     _DEFAULT_OUTPUT_DIR: Final[str] = "../cat_images"
     _ENV_PATH: Final[str] = "/lab2/env/.env"
+    # методы обработки изображений, по ним выбирается политика декодирования
+    PROCESSING_METHODS: Final[Tuple[str, ...]] = ("edges",)
 
-    def __init__(self) -> None:
+    def __init__(self, decode_policy: DecodePolicy = DecodePolicy()) -> None:
         """
         Инициализация процессора.
+
+        Args:
+            decode_policy: политика декодирования загруженных изображений
+             (оттенки серого, предельный размер)
         """
         self._api_key: str = self._get_api_key()
+        self._decode_policy: DecodePolicy = decode_policy
 
     @staticmethod
-    @measure_time
     def _create_breed_directory(safe_breed: str, output_dir: str) -> str:
         """
         Создает безопасную директорию для породы.
@@ -94,7 +101,6 @@ class CatImageProcessor:
         """Property для получения API ключа (только чтение)."""
         return self._api_key
 
-    @measure_time
     def _get_api_key(self) -> str:
         """
         Получает API ключ из переменных окружения.
@@ -152,8 +158,7 @@ class CatImageProcessor:
         """
         try:
             img_response = requests.get(image_url)
-            img_array = np.frombuffer(img_response.content, np.uint8)
-            image = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+            image = self._decode_policy.decode(img_response.content)
 
             return image
 
@@ -6,6 +6,7 @@ from typing import List, Dict, Any
 import aiohttp
 from dotenv import load_dotenv
 
+from lab1.utils.image_decode import DecodePolicy
 from lab4.AsyncPipelineManager import AsyncPipelineManager
 
 
@@ -18,14 +19,18 @@ class AsyncCatImageProcessor:
     _BASE_URL = "https://api.thecatapi.com/v1/images/search"
     _DEFAULT_OUTPUT_DIR = "cat_images_async"
     _ENV_PATH = "D:/chromedriver/6401zhilyaevmi/lab2/env/.env"
+    # методы обработки изображений, по ним выбирается политика декодирования
+    PROCESSING_METHODS = ("edges",)
 
-    def __init__(self, max_download_workers: int = 5, max_process_workers: int = None, max_save_workers: int = 3):
+    def __init__(self, max_download_workers: int = 5, max_process_workers: int = None, max_save_workers: int = 3,
+                 decode_policy: DecodePolicy = DecodePolicy()):
         self.api_key = self._get_api_key()
         self.pipeline_manager = AsyncPipelineManager(
             max_download_workers=max_download_workers,
             max_process_workers=max_process_workers,
             max_save_workers=max_save_workers,
-            output_dir=self._DEFAULT_OUTPUT_DIR
+            output_dir=self._DEFAULT_OUTPUT_DIR,
+            decode_policy=decode_policy
         )
 
     def _get_api_key(self) -> str:
@@ -1,4 +1,5 @@
 import asyncio
+import multiprocessing
 import os
 import time
 from concurrent.futures import ProcessPoolExecutor
@@ -6,11 +7,17 @@ from typing import Dict, List, Any
 
 import aiohttp
 
+from lab1.utils.image_decode import DecodePolicy
+from lab4.memory.SharedBufferPool import SharedBufferPool
 from lab4.stats.ProcessingStats import ProcessingStats
 from lab4.workers.DownloadWorker import DownloadWorker
-from lab4.workers.ProcessWorker import ProcessWorker
+from lab4.workers.ProcessWorker import ProcessWorker, init_process_worker
 from lab4.workers.SaveWorker import SaveWorker
 
+# процессы пула запускаются заново, а не через fork: после ядер numba в родителе
+# (потоки TBB/OpenMP) копия процесса может зависнуть на унаследованных блокировках
+pool_start_method = "spawn"
+
 
 class AsyncPipelineManager:
     """
@@ -19,7 +26,7 @@ class AsyncPipelineManager:
     """
 
     def __init__(self, max_download_workers: int = 5, max_process_workers: int = None, max_save_workers: int = 3,
-                 output_dir: str = "cat_images_async"):
+                 output_dir: str = "cat_images_async", decode_policy: DecodePolicy = DecodePolicy()):
         self.download_queue: asyncio.Queue = asyncio.Queue()
         self.process_queue: asyncio.Queue = asyncio.Queue()
         self.save_queue: asyncio.Queue = asyncio.Queue()
@@ -28,6 +35,8 @@ class AsyncPipelineManager:
         self.max_process_workers = max_process_workers or os.cpu_count()
         self.max_save_workers = max_save_workers
         self.output_dir = output_dir
+        # как DownloadWorker декодирует загруженные изображения
+        self.decode_policy = decode_policy
 
         self.stats = ProcessingStats()
         self.is_running = False
@@ -36,7 +45,14 @@ class AsyncPipelineManager:
         self.process_tasks: List[asyncio.Task] = []
         self.save_tasks: List[asyncio.Task] = []
 
-        self.process_executor = ProcessPoolExecutor(max_workers=self.max_process_workers)
+        # сегменты разделяемой памяти для обмена изображениями с процессами пула
+        self.buffer_pool = SharedBufferPool(max_free_buffers=self.max_process_workers + self.max_save_workers)
+
+        self.process_executor = ProcessPoolExecutor(
+            max_workers=self.max_process_workers,
+            initializer=init_process_worker,
+            mp_context=multiprocessing.get_context(pool_start_method),
+        )
 
     async def initialize_from_api(self, api_urls: List[str]) -> None:
         """
@@ -103,8 +119,9 @@ class AsyncPipelineManager:
         # Ждем завершения всех задач
         await asyncio.gather(*self.download_tasks, *self.process_tasks, *self.save_tasks)
 
-        # Закрываем ProcessPool
+        # Закрываем ProcessPool и удаляем сегменты разделяемой памяти
         self.process_executor.shutdown()
+        self.buffer_pool.close()
 
         self.stats.end_time = time.time()
         return self.stats
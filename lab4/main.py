@@ -1,15 +1,26 @@
+import argparse
 import asyncio
 import sys
 import time
 
+from lab1.utils.image_decode import DecodePolicy, add_decode_args, decode_policy_from_args
 from lab4.AsyncCatImageProcessor import AsyncCatImageProcessor
 
 sys.path.append('.')
 
-from lab2.CatImageProcessor import CatImageProcessor
+from lab2.processor.CatImageProcessor import CatImageProcessor
 
 
-async def test_async_version(limit: int = 5):
+def parse_args():
+    """Парсинг аргументов командной строки."""
+    parser = argparse.ArgumentParser(description='Сравнение синхронной и асинхронной обработки изображений кошек')
+    parser.add_argument('-l', '--limit', type=int, default=1,
+                        help='Количество изображений для загрузки')
+    add_decode_args(parser)
+    return parser
+
+
+async def test_async_version(limit: int = 5, decode_policy: DecodePolicy = DecodePolicy()):
     print(f"\n=== Тестирование АСИНХРОННОЙ версии ({limit} изображений) ===")
 
     start_time = time.time()
@@ -18,7 +29,8 @@ async def test_async_version(limit: int = 5):
         processor = AsyncCatImageProcessor(
             max_download_workers=3,
             max_process_workers=4,
-            max_save_workers=2
+            max_save_workers=2,
+            decode_policy=decode_policy
         )
         result = await processor.run_pipeline(limit)
 
@@ -35,13 +47,13 @@ async def test_async_version(limit: int = 5):
         return float('inf')
 
 
-def test_sync_version(limit: int = 5):
+def test_sync_version(limit: int = 5, decode_policy: DecodePolicy = DecodePolicy()):
     print(f"\n=== Тестирование СИНХРОННОЙ версии ({limit} изображений) ===")
 
     start_time = time.time()
 
     try:
-        processor = CatImageProcessor()
+        processor = CatImageProcessor(decode_policy)
         api_data = processor.get_json_images(limit)
 
         if api_data:
@@ -59,18 +71,20 @@ def test_sync_version(limit: int = 5):
         return float('inf')
 
 
-async def main():
-    limit = 1
+async def main(args):
+    limit = args.limit
 
     print("СРАВНЕНИЕ ПРОИЗВОДИТЕЛЬНОСТИ: СИНХРОННАЯ vs АСИНХРОННАЯ")
     print("=" * 60)
 
-    async_time = await test_async_version(limit)
+    async_time = await test_async_version(
+        limit, decode_policy_from_args(args, AsyncCatImageProcessor.PROCESSING_METHODS),
+    )
 
     print("\nПауза между тестами...")
     await asyncio.sleep(2)
 
-    sync_time = test_sync_version(limit)
+    sync_time = test_sync_version(limit, decode_policy_from_args(args, CatImageProcessor.PROCESSING_METHODS))
 
     # Вывод результатов сравнения
     print("\n" + "=" * 60)
@@ -93,4 +107,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(parse_args().parse_args()))
@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Tuple
+
+import numpy as np
+
+# сколько байт сегментов процесс пула держит открытыми после обработки (сегменты
+# переиспользуются, открывать их заново дорого, но открытый сегмент держит память,
+# даже если родитель его уже удалил)
+attached_buffers_max_bytes = 64 * 1024 * 1024
+
+# сегменты, открытые в процессе пула, по имени
+_attached_buffers: "OrderedDict[str, shared_memory.SharedMemory]" = OrderedDict()
+
+
+def edges_buffer_size(shape: Tuple[int, ...]) -> int:
+    """
+    Размер сегмента для изображения формы shape и двух карт границ (H, W) uint8.
+    """
+    return int(np.prod(shape)) + 2 * shape[0] * shape[1]
+
+
+def edges_buffer_views(
+        buffer: shared_memory.SharedMemory,
+        shape: Tuple[int, ...]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Массивы поверх сегмента: изображение, границы lib и границы custom.
+    Сегмент может быть больше нужного - используется его начало.
+    """
+    image_size = int(np.prod(shape))
+    edges_shape = tuple(shape[:2])
+    edges_size = edges_shape[0] * edges_shape[1]
+    image = np.ndarray(shape, dtype=np.uint8, buffer=buffer.buf)
+    lib_edges = np.ndarray(edges_shape, dtype=np.uint8, buffer=buffer.buf, offset=image_size)
+    custom_edges = np.ndarray(edges_shape, dtype=np.uint8, buffer=buffer.buf, offset=image_size + edges_size)
+    return image, lib_edges, custom_edges
+
+
+def attach_buffer(name: str) -> shared_memory.SharedMemory:
+    """
+    Открывает сегмент родителя в процессе пула.
+    Открытые сегменты запоминаются, потому что пул родителя отдаёт одни и те же
+    сегменты для следующих изображений. Давно не использованные закрываются,
+    пока открытые вместе занимают больше attached_buffers_max_bytes; текущий
+    сегмент остаётся открытым при любом размере.
+    """
+    buffer = _attached_buffers.pop(name, None)
+    if buffer is None:
+        buffer = shared_memory.SharedMemory(name=name)
+    _attached_buffers[name] = buffer
+
+    attached_bytes = sum(attached.size for attached in _attached_buffers.values())
+    while len(_attached_buffers) > 1 and attached_bytes > attached_buffers_max_bytes:
+        _, oldest = _attached_buffers.popitem(last=False)
+        attached_bytes -= oldest.size
+        try:
+            oldest.close()
+        except BufferError:
+            pass
+    return buffer
+
+
+class SharedBufferPool:
+    """
+    Пул сегментов разделяемой памяти для обмена изображениями с процессами пула.
+    Через границу процессов передаются только имя сегмента и форма изображения,
+    сами данные не сериализуются. Освобождённые сегменты переиспользуются
+    для следующих изображений, поэтому сегменты создаются один раз на пайплайн.
+    Пул принадлежит родительскому процессу (AsyncPipelineManager), который
+    удаляет все сегменты в close().
+    Пул создаётся до пула процессов: тогда процессы пула (в том числе запущенные
+    через spawn) используют трекер ресурсов родителя и не удаляют открытые ими
+    сегменты при своём завершении.
+    """
+
+    def __init__(self, max_free_buffers: int = 8):
+        resource_tracker.ensure_running()
+        self.max_free_buffers = max_free_buffers
+        self.created = 0
+        self.reused = 0
+        self._free: List[shared_memory.SharedMemory] = []
+        self._in_use: dict[str, shared_memory.SharedMemory] = {}
+
+    def acquire(self, size: int) -> shared_memory.SharedMemory:
+        """
+        Выдаёт сегмент не меньше size байт: наименьший подходящий из свободных или новый.
+        """
+        fitting = [buffer for buffer in self._free if buffer.size >= size]
+        if fitting:
+            buffer = min(fitting, key=lambda candidate: candidate.size)
+            self._free.remove(buffer)
+            self.reused += 1
+        else:
+            buffer = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            self.created += 1
+        self._in_use[buffer.name] = buffer
+        return buffer
+
+    def release(self, buffer: shared_memory.SharedMemory) -> None:
+        """
+        Возвращает сегмент в пул. Если свободных сегментов больше max_free_buffers,
+        удаляется наименьший из них.
+        """
+        if self._in_use.pop(buffer.name, None) is None:
+            return
+        self._free.append(buffer)
+        if len(self._free) > self.max_free_buffers:
+            smallest = min(self._free, key=lambda candidate: candidate.size)
+            self._free.remove(smallest)
+            self._destroy(smallest)
+
+    def close(self) -> None:
+        """
+        Удаляет все сегменты пула, в том числе не возвращённые.
+        """
+        for buffer in [*self._free, *self._in_use.values()]:
+            self._destroy(buffer)
+        self._free.clear()
+        self._in_use.clear()
+
+    @staticmethod
+    def _destroy(buffer: shared_memory.SharedMemory) -> None:
+        try:
+            buffer.close()
+        except BufferError:
+            # на сегмент ещё ссылаются массивы; память освободится вместе с ними
+            pass
+        try:
+            buffer.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,87 @@
+import unittest
+from multiprocessing import shared_memory
+from unittest.mock import patch
+
+from lab4.memory import SharedBufferPool as shared_buffer_pool
+from lab4.memory.SharedBufferPool import SharedBufferPool, attach_buffer, edges_buffer_size, edges_buffer_views
+
+
+class TestSharedBufferPool(unittest.TestCase):
+    def setUp(self):
+        """Создание пула сегментов."""
+        self.pool = SharedBufferPool(max_free_buffers=2)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_reuse(self):
+        """Тест переиспользования: возвращённый сегмент выдаётся снова для изображения той же формы."""
+        shape = (30, 40, 3)
+        buffer = self.pool.acquire(edges_buffer_size(shape))
+        image, lib_edges, custom_edges = edges_buffer_views(buffer, shape)
+        image[...] = 5
+        self.assertEqual(lib_edges.shape, (30, 40))
+        del image, lib_edges, custom_edges
+        self.pool.release(buffer)
+
+        again = self.pool.acquire(edges_buffer_size(shape))
+        self.assertEqual(again.name, buffer.name)
+        self.assertTrue((edges_buffer_views(again, shape)[0] == 5).all())
+        self.assertEqual((self.pool.created, self.pool.reused), (1, 1))
+
+    def test_grow(self):
+        """Тест роста: для большего изображения создаётся новый сегмент, затем выдаётся наименьший подходящий."""
+        small_shape, large_shape = (20, 20, 3), (60, 80, 3)
+        small = self.pool.acquire(edges_buffer_size(small_shape))
+        self.pool.release(small)
+
+        large = self.pool.acquire(edges_buffer_size(large_shape))
+        self.assertNotEqual(large.name, small.name)
+        self.assertGreaterEqual(large.size, edges_buffer_size(large_shape))
+        self.assertEqual(self.pool.created, 2)
+        self.pool.release(large)
+
+        self.assertEqual(self.pool.acquire(edges_buffer_size(small_shape)).name, small.name)
+        self.assertEqual(self.pool.acquire(edges_buffer_size(small_shape)).name, large.name)
+
+    def test_close_unlinks(self):
+        """Тест закрытия: удаляются и свободные, и не возвращённые сегменты."""
+        free = self.pool.acquire(100)
+        in_use = self.pool.acquire(200)
+        self.pool.release(free)
+        names = [free.name, in_use.name]
+
+        self.pool.close()
+
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_free_limit(self):
+        """Тест предела свободных сегментов: лишний наименьший сегмент удаляется."""
+        buffers = [self.pool.acquire(size) for size in (100, 200, 300)]
+        for buffer in buffers:
+            self.pool.release(buffer)
+
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=buffers[0].name)
+        self.assertEqual(self.pool.acquire(50).name, buffers[1].name)
+
+    def test_attached_bytes_limit(self):
+        """Тест открытых сегментов процесса пула: давно не использованные закрываются сверх предела по байтам."""
+        buffers = [self.pool.acquire(size) for size in (4096, 4096, 16384)]
+        with patch.object(shared_buffer_pool, "attached_buffers_max_bytes", 10000), \
+                patch.object(shared_buffer_pool, "_attached_buffers", type(shared_buffer_pool._attached_buffers)()):
+            attach_buffer(buffers[0].name)
+            attach_buffer(buffers[1].name)
+            self.assertEqual(list(shared_buffer_pool._attached_buffers), [buffers[0].name, buffers[1].name])
+            self.assertIs(attach_buffer(buffers[0].name), shared_buffer_pool._attached_buffers[buffers[0].name])
+
+            # сегмент больше предела остаётся открытым один
+            attach_buffer(buffers[2].name)
+            self.assertEqual(list(shared_buffer_pool._attached_buffers), [buffers[2].name])
+            shared_buffer_pool._attached_buffers[buffers[2].name].close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
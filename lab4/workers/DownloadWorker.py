@@ -3,7 +3,6 @@ import time
 from typing import Optional
 
 import aiohttp
-import cv2
 import numpy as np
 
 
@@ -64,15 +63,15 @@ class DownloadWorker:
 
     async def _download_single_image(self, url: str) -> Optional[np.ndarray]:
         """
-        Загружает одно изображение по URL и преобразует в numpy array.
+        Загружает одно изображение по URL и преобразует в numpy array
+        по политике декодирования пайплайна (оттенки серого, уменьшение).
         """
         try:
             async with self.session.get(url, timeout=10) as response:
                 if response.status == 200:
                     content = await response.read()
 
-                    img_array = np.frombuffer(content, dtype=np.uint8)
-                    image = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+                    image = self.pipeline_manager.decode_policy.decode(content)
 
                     if image is not None:
                         return image
@@ -1,35 +1,60 @@
 import asyncio
 import os
 import time
-from typing import Tuple
-
-import numpy as np
+from typing import Any, Dict, Optional, Tuple
 
 from lab1.implementation import ImageProcessing
+from lab1.implementation import custom_image_processing
 from lab1.implementation.custom_image_processing import CustomImageProcessing
+from lab1.utils import metrics
+from lab4.memory.SharedBufferPool import attach_buffer, edges_buffer_size, edges_buffer_views
+
+# обработчики процесса пула, создаются в init_process_worker
+_lib_processor: Optional[ImageProcessing] = None
+_custom_processor: Optional[CustomImageProcessing] = None
 
 
-def process_single_image_wrapper(args: Tuple[np.ndarray, int]) -> Tuple[int, np.ndarray, np.ndarray]:
+def init_process_worker() -> None:
+    """
+    Инициализатор процесса пула: компилирует (или загружает из кэша) ядра numba
+    и создаёт обработчики до первого изображения, сообщает, сколько это заняло.
+    """
+    global _lib_processor, _custom_processor
+    timings = custom_image_processing.warmup()
+    _lib_processor = ImageProcessing()
+    _custom_processor = CustomImageProcessing()
+    # время компиляции не должно попасть в замеры обработки
+    metrics.registry.reset()
+    print(f"Numba warmup finished in {timings['total']:.2f}s (PID {os.getpid()})")
+
+
+def process_single_image_wrapper(
+        args: Tuple[str, Tuple[int, ...], int]
+) -> Tuple[int, Dict[str, Dict[str, Any]]]:
     """
     Обертка для обработки одного изображения в отдельном процессе.
-    Принимает и возвращает только простые, сериализуемые типы.
+    Изображение и результаты лежат в сегменте разделяемой памяти родителя
+    (см. SharedBufferPool): процесс получает только имя сегмента и форму
+    изображения и записывает границы lib и custom в тот же сегмент.
+    Возвращает индекс и замеры времени, накопленные процессом с прошлого
+    вызова (metrics.registry.collect()), их объединяет родитель.
     """
-    image, index = args
+    buffer_name, shape, index = args
+    image, lib_edges, custom_edges = edges_buffer_views(attach_buffer(buffer_name), shape)
 
     try:
         print(f"Convolution for image {index} started (PID {os.getpid()})")
-        lib_processor = ImageProcessing()
-        custom_processor = CustomImageProcessing()
-        lib_edges = lib_processor.edge_detection(image)
-        custom_edges = custom_processor.edge_detection(image)
+        lib_edges[...] = _lib_processor.edge_detection(image)
+        custom_edges[...] = _custom_processor.edge_detection(image)
         print(f"Convolution for image {index} finished (PID {os.getpid()})")
-        return index, lib_edges, custom_edges
 
     except Exception as e:
         print(f"Processing error for image {index} in PID {os.getpid()}: {e}")
-        # Возвращаем пустые массивы в случае ошибки
-        empty_image = np.zeros_like(image)
-        return index, empty_image, empty_image
+        # Пустые результаты в случае ошибки
+        lib_edges[...] = 0
+        custom_edges[...] = 0
+
+    return index, metrics.registry.collect()
 
 
 class ProcessWorker:
@@ -59,26 +84,36 @@ class ProcessWorker:
                 print(f"{self.worker_name}: Convolution for image {index} started")
                 start_time = time.time()
 
+                # Изображение копируется в сегмент из пула, процессу передаются имя сегмента и форма;
+                # сегмент возвращается в пул после сохранения (SaveWorker) или при ошибке
+                buffer_pool = self.pipeline_manager.buffer_pool
+                buffer = buffer_pool.acquire(edges_buffer_size(image_data.shape))
                 try:
+                    shared_image, lib_edges, custom_edges = edges_buffer_views(buffer, image_data.shape)
+                    shared_image[...] = image_data
+
                     processed_data = await asyncio.get_event_loop().run_in_executor(
                         self.pipeline_manager.process_executor,
                         process_single_image_wrapper,
-                        (image_data, index)
+                        (buffer.name, image_data.shape, index)
                     )
 
                     if processed_data is not None:
-                        result_index, lib_edges, custom_edges = processed_data
-                        save_task = (result_index, url, image_data, lib_edges, custom_edges)
+                        result_index, worker_metrics = processed_data
+                        metrics.registry.merge(worker_metrics)
+                        save_task = (result_index, url, image_data, lib_edges, custom_edges, buffer)
                         await self.pipeline_manager.save_queue.put(save_task)
 
                         self.pipeline_manager.stats.processed += 1
                         print(
                             f"{self.worker_name}: Convolution for image {index} finished - {time.time() - start_time:.2f}s")
                     else:
+                        buffer_pool.release(buffer)
                         self.pipeline_manager.stats.errors += 1
                         print(f"{self.worker_name}: Convolution for image {index} failed")
 
                 except Exception as e:
+                    buffer_pool.release(buffer)
                     self.pipeline_manager.stats.errors += 1
                     print(f"{self.worker_name}: Error processing image {index}: {e}")
 
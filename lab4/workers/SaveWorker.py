@@ -34,7 +34,7 @@ class SaveWorker:
                 except asyncio.TimeoutError:
                     break
 
-                index, _, original_image, lib_edges, custom_edges = task
+                index, _, original_image, lib_edges, custom_edges, buffer = task
                 print(f"{self.worker_name}: Saving image {index} started")
                 start_time = time.time()
 
@@ -57,6 +57,9 @@ class SaveWorker:
                     print(f"{self.worker_name}: Error saving image {index}: {e}")
 
                 finally:
+                    # границы лежат в сегменте разделяемой памяти - после записи он снова свободен
+                    del lib_edges, custom_edges
+                    self.pipeline_manager.buffer_pool.release(buffer)
                     self.pipeline_manager.save_queue.task_done()
 
             except Exception as e:
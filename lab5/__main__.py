@@ -13,6 +13,7 @@ __package__ = "lab5"
 print("Я МЕТКА" + __package__)
 # Используем относительные импорты
 
+from lab1.utils.image_decode import add_decode_args, decode_policy_from_args
 from .src.CatImageProcessor import CatImageProcessor
 from .src.logging_config import setup_logging, add_logging_args
 
@@ -26,6 +27,9 @@ def parse_args():
     parser.add_argument('-l', '--limit', type=int, default=10,
                         help='Количество изображений для загрузки (макс 100)')
 
+    # Добавляем аргументы политики декодирования
+    add_decode_args(parser)
+
     # Добавляем аргументы для логирования
     add_logging_args(parser)
 
@@ -47,7 +51,8 @@ async def async_main(args):
             limit = 100
 
         logger.debug(f"Запрошено изображений: {limit}")
-        processor = CatImageProcessor()
+        decode_policy = decode_policy_from_args(args, CatImageProcessor.PROCESSING_METHODS)
+        processor = CatImageProcessor(decode_policy)
 
         # Синхронное получение JSON с данными изображений
         logger.info("Получение данных изображений из API...")
@@ -7,20 +7,22 @@ import time
 from typing import List, Dict, Any, Optional
 
 import aiohttp
-import cv2
 import numpy as np
 import requests
 from dotenv import load_dotenv
 
+from lab1.utils.image_decode import DecodePolicy
 from .CatsResponse import CatsResponse, CatImageDTO, Breed
 
 logger = logging.getLogger(__name__)
 
 
 class CatClient:
-    def __init__(self) -> None:
+    def __init__(self, decode_policy: DecodePolicy = DecodePolicy()) -> None:
         self._base_url: str = "https://api.thecatapi.com/v1/images/search"
         self._api_key: str = self._get_api_key()
+        # как декодировать загруженные изображения (оттенки серого, предельный размер)
+        self._decode_policy: DecodePolicy = decode_policy
         logger.debug("Инициализирован CatClient")
 
     @staticmethod
@@ -65,8 +67,7 @@ class CatClient:
                 response.raise_for_status()
                 img_data = await response.read()
 
-            img_array = np.frombuffer(img_data, np.uint8)
-            image = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+            image = self._decode_policy.decode(img_data)
 
             if image is None:
                 logger.warning(f"Не удалось декодировать изображение с URL: {image_url}")
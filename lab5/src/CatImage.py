@@ -50,6 +50,15 @@ class CatImage:
         self._custom_image = self._custom_image_processor.edge_detection(self._image)
         logger.debug(f"Обработка границ завершена для породы: {self._breed}")
 
+    def attach_images(self, image: np.ndarray, lib_image: np.ndarray, custom_image: np.ndarray) -> None:
+        """
+        Подставляет изображение и границы, посчитанные вне объекта
+        (массивы поверх разделяемой памяти, без копирования).
+        """
+        self._image = image
+        self._lib_image = lib_image
+        self._custom_image = custom_image
+
     def __add__(self, other):
         if isinstance(other, CatImage):
             other_array = other._image
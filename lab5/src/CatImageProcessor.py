@@ -6,23 +6,38 @@ import logging
 import multiprocessing
 import os
 import time
-from multiprocessing import Pool, current_process
-from typing import List, Optional
+from multiprocessing import current_process, shared_memory
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiofiles
 import aiohttp
 import cv2
 import numpy as np
 
+from lab1.utils import metrics
+from lab1.utils.image_decode import DecodePolicy
 from .CatClient import CatClient
 from .CatImage import CatImage
+from .SharedImageBatch import ImageDescriptor, SharedImageBatch
+from .lab1.implementation import custom_image_processing, image_processing
 
 logger = logging.getLogger(__name__)
 
+# процессы пула запускаются заново, а не через fork: после ядер numba в родителе
+# (потоки TBB/OpenMP) копия процесса может зависнуть на унаследованных блокировках
+pool_start_method = "spawn"
+
+# обработчики процесса пула, создаются в _init_worker
+_lib_processor: Optional[image_processing.ImageProcessing] = None
+_custom_processor: Optional[custom_image_processing.CustomImageProcessing] = None
+
 
 class CatImageProcessor:
-    def __init__(self) -> None:
-        self._cat_client = CatClient()
+    # методы обработки изображений, по ним выбирается политика декодирования
+    PROCESSING_METHODS: Tuple[str, ...] = ("edges",)
+
+    def __init__(self, decode_policy: DecodePolicy = DecodePolicy()) -> None:
+        self._cat_client = CatClient(decode_policy)
         logger.debug("Инициализирован CatImageProcessor")
 
     async def get_cat_images(self, limit: int) -> List[CatImage]:
@@ -70,39 +85,83 @@ class CatImageProcessor:
         return None
 
     async def process_images(self, cat_images: List[CatImage]) -> List[CatImage]:
-        """Многопроцессорная обработка изображений"""
+        """
+        Многопроцессорная обработка изображений.
+        Каждое изображение копируется в свой сегмент разделяемой памяти, процессам
+        пула передаются только описатели, границы записываются в тот же сегмент
+        и подставляются в CatImage без копирования. CatImage держит только
+        сегмент своего изображения.
+        """
         start_time = time.time()
         logger.info(f"Начало многопроцессорной обработки {len(cat_images)} изображений...")
+        if not cat_images:
+            return []
 
-        with Pool(multiprocessing.cpu_count()) as pool:
-            processed_images = list(pool.map(self._process_single_image_wrapper,
-                                             enumerate(cat_images, 1)))
+        batch = SharedImageBatch([cat_image.image for cat_image in cat_images])
+        try:
+            context = multiprocessing.get_context(pool_start_method)
+            with context.Pool(multiprocessing.cpu_count(), initializer=self._init_worker) as pool:
+                results = pool.map(self._process_single_image_wrapper, enumerate(batch.descriptors, 1))
+        finally:
+            batch.close()
+
+        for worker_metrics in results:
+            metrics.registry.merge(worker_metrics)
+        for index, cat_image in enumerate(cat_images):
+            # исходный массив изображения больше не нужен - остаётся только копия в сегменте
+            cat_image.attach_images(*batch.views(index))
 
         process_time = time.time() - start_time
         logger.info(f"Обработка завершена за {process_time:.2f} секунд")
 
-        return processed_images
+        return cat_images
+
+    @staticmethod
+    def _init_worker() -> None:
+        """Прогрев ядер numba и создание обработчиков в процессе пула до первого изображения"""
+        global _lib_processor, _custom_processor
+        timings = custom_image_processing.warmup()
+        _lib_processor = image_processing.ImageProcessing()
+        _custom_processor = custom_image_processing.CustomImageProcessing()
+        # время компиляции не должно попасть в замеры обработки
+        metrics.registry.reset()
+        logger.info(f"Прогрев numba завершён за {timings['total']:.2f} секунд (PID {current_process().pid})")
 
     @staticmethod
-    def _process_single_image_wrapper(args) -> CatImage:
-        """Wrapper для передачи индекса вместе с изображением"""
-        index, cat_image = args
-        return CatImageProcessor._process_single_image(cat_image, index)
+    def _process_single_image_wrapper(args: Tuple[int, ImageDescriptor]) -> Dict[str, Dict[str, Any]]:
+        """
+        Wrapper для передачи индекса вместе с описателем изображения.
+        Возвращает замеры времени процесса пула, накопленные с прошлого вызова,
+        для объединения в родителе.
+        """
+        index, descriptor = args
+        CatImageProcessor._process_single_image(descriptor, index)
+        return metrics.registry.collect()
 
     @staticmethod
-    def _process_single_image(cat_image: CatImage, index: int) -> CatImage:
-        """Обработка одного изображения в отдельном процессе"""
+    def _process_single_image(descriptor: ImageDescriptor, index: int) -> None:
+        """Обработка одного изображения из разделяемой памяти в отдельном процессе"""
         pid = current_process().pid
         logger.debug(f"Свертка для изображения {index} начата (PID {pid})")
         start_time = time.time()
 
-        cat_image.process_edges()
+        buffer = shared_memory.SharedMemory(name=descriptor.buffer_name)
+        try:
+            image, lib_edges, custom_edges = descriptor.views(buffer)
+            lib_edges[...] = _lib_processor.edge_detection(image)
+            custom_edges[...] = _custom_processor.edge_detection(image)
+            # сегмент закрывается только без массивов поверх него
+            del image, lib_edges, custom_edges
+        finally:
+            try:
+                buffer.close()
+            except BufferError:
+                # после ошибки массивы ещё живы в трассировке; сегмент закроется вместе с ними
+                pass
 
         process_time = time.time() - start_time
         logger.debug(f"Свертка для изображения {index} завершена (PID {pid}) - {process_time:.2f} секунд")
 
-        return cat_image
-
     async def save_images(self, cat_images: List[CatImage], output_dir: str = "cat_images") -> None:
         """Асинхронное сохранение изображений с использованием aiofiles"""
         if not cat_images:
@@ -0,0 +1,115 @@
+"""
+Пакет изображений в разделяемой памяти, по сегменту на изображение.
+
+Процессам пула передаются только описатели ImageDescriptor (имя сегмента
+и форма), изображение и его результаты лежат в своём сегменте. Родитель
+получает результаты массивами поверх того же сегмента, без копирования.
+"""
+import logging
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _shares_segment(array: np.ndarray) -> bool:
+    """Лежит ли массив поверх сегмента: цепочка base доходит до массива с _owner."""
+    base = array.base
+    while isinstance(base, np.ndarray):
+        if getattr(base, "_owner", None) is not None:
+            return True
+        base = base.base
+    return False
+
+
+class SharedArray(np.ndarray):
+    """
+    Массив поверх сегмента изображения. Держит ссылку только на свой сегмент,
+    поэтому тот не закрывается, пока жив сам массив или его срезы, а сегменты
+    остальных изображений пакета освобождаются независимо. Массивы со своей памятью
+    (astype, copy) ссылку не получают, результаты ufunc и редукций (sum, + и т. п.)
+    возвращаются обычными np.ndarray.
+    """
+
+    def __array_finalize__(self, obj) -> None:
+        self._owner = getattr(obj, "_owner", None) if _shares_segment(self) else None
+
+    def __array_wrap__(self, array, context=None, return_scalar=False):
+        if getattr(array, "_owner", None) is not None:
+            # результат записан в сам массив (out=...)
+            return super().__array_wrap__(array, context, return_scalar)
+        array = array.view(np.ndarray)
+        return array[()] if return_scalar else array
+
+
+@dataclass(frozen=True)
+class ImageDescriptor:
+    """Сегмент изображения и форма изображения; за ним в сегменте лежат границы lib и custom."""
+    buffer_name: str
+    shape: Tuple[int, ...]
+
+    @staticmethod
+    def segment_size(shape: Tuple[int, ...]) -> int:
+        """Размер сегмента в байтах для изображения формы shape и двух карт границ."""
+        return int(np.prod(shape)) + 2 * shape[0] * shape[1]
+
+    def views(self, buffer: shared_memory.SharedMemory) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Изображение, границы lib и границы custom поверх открытого сегмента."""
+        edges_shape = tuple(self.shape[:2])
+        lib_offset = int(np.prod(self.shape))
+        custom_offset = lib_offset + self.shape[0] * self.shape[1]
+        return (
+            np.ndarray(self.shape, dtype=np.uint8, buffer=buffer.buf, offset=0),
+            np.ndarray(edges_shape, dtype=np.uint8, buffer=buffer.buf, offset=lib_offset),
+            np.ndarray(edges_shape, dtype=np.uint8, buffer=buffer.buf, offset=custom_offset),
+        )
+
+
+class SharedImageBatch:
+    """
+    Изображения пакета и места для двух карт границ каждого изображения,
+    каждое изображение - в своём сегменте разделяемой памяти.
+    """
+
+    def __init__(self, images: List[np.ndarray]) -> None:
+        self._buffers: List[shared_memory.SharedMemory] = []
+        self.descriptors: List[ImageDescriptor] = []
+        try:
+            for image in images:
+                size = ImageDescriptor.segment_size(image.shape)
+                buffer = shared_memory.SharedMemory(create=True, size=max(size, 1))
+                self._buffers.append(buffer)
+                descriptor = ImageDescriptor(buffer.name, tuple(image.shape))
+                self.descriptors.append(descriptor)
+                descriptor.views(buffer)[0][...] = image
+                logger.debug(f"Создан сегмент {buffer.name} на {size} байт")
+        except BaseException:
+            self.close()
+            raise
+
+    def views(self, index: int) -> Tuple[SharedArray, SharedArray, SharedArray]:
+        """
+        Изображение и его границы lib и custom поверх сегмента изображения
+        (без копирования). Массивы держат только сегмент этого изображения.
+        """
+        buffer = self._buffers[index]
+        arrays = []
+        for array in self.descriptors[index].views(buffer):
+            shared = array.view(SharedArray)
+            shared._owner = buffer
+            arrays.append(shared)
+        return arrays[0], arrays[1], arrays[2]
+
+    def close(self) -> None:
+        """
+        Удаляет имена сегментов. Уже полученные массивы остаются рабочими,
+        память каждого сегмента освобождается вместе с последним массивом поверх него.
+        """
+        for buffer in self._buffers:
+            try:
+                buffer.unlink()
+            except FileNotFoundError:
+                pass
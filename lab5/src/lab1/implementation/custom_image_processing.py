@@ -12,6 +12,8 @@
 
 """
 
+import time
+
 import numpy as np
 from numba import njit
 
@@ -20,6 +22,9 @@ from lab1.utils.time_measure import measure_time
 
 max_pixel_value = 255.0
 
+# размер изображения для прогрева ядер numba
+warmup_size = 64
+
 red_coefficient = 0.299
 green_coefficient = 0.587
 blue_coefficient = 0.114
@@ -98,7 +103,7 @@ class CustomImageProcessing(interfaces.IImageProcessing):
         return self.conv(image, padded, kernel_height, kernel_width, kernel)
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def conv(image, padded, kernel_height, kernel_width, kernel):
         output = np.zeros_like(image)
         for rows in range(image.shape[0]):
@@ -113,11 +118,14 @@ class CustomImageProcessing(interfaces.IImageProcessing):
         Преобразует RGB-изображение в оттенки серого.
 
         Args:
-            image (np.ndarray): Входное RGB-изображение.
+            image (np.ndarray): Входное RGB-изображение; изображение (H, W),
+             декодированное сразу в оттенках серого, только переводится в float32.
 
         Returns:
             np.ndarray: Одноканальное изображение в оттенках серого.
         """
+        if image.ndim == 2:
+            return image.astype(np.float32)
         # Стандартные коэффициенты восприятия яркости человеческим глазом
 
         blue_channel = image[:, :, 0]  # B-канал (синий)
@@ -251,7 +259,7 @@ class CustomImageProcessing(interfaces.IImageProcessing):
             return np.zeros_like(harris_response)
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def _find_adaptive_threshold(
             response_norm: np.ndarray,
             target_corners_number: int,
@@ -309,7 +317,7 @@ class CustomImageProcessing(interfaces.IImageProcessing):
         return local_maxima_mask
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def _visualize_corners(image: np.ndarray, corners_mask: np.ndarray) -> np.ndarray:
         """Визуализирует найденные углы на изображении."""
         result_image = image.copy().astype(np.uint8)
@@ -348,3 +356,28 @@ class CustomImageProcessing(interfaces.IImageProcessing):
             NotImplementedError: Ошибка о не написании
         """
         raise NotImplementedError("Метод обнаружения окружностей пока не реализован.")
+
+
+def warmup() -> dict[str, float]:
+    """
+    Заранее компилирует ядра numba (или загружает их из кэша на диске).
+
+    Вызывается из инициализатора пула процессов, чтобы первое изображение
+    не платило за компиляцию.
+
+    Returns:
+        dict[str, float]: Время прогрева каждой операции в секундах и итог под ключом "total"
+    """
+    image = np.random.default_rng(0).integers(0, 256, (warmup_size, warmup_size, 3), dtype=np.uint8)
+    processor = CustomImageProcessing()
+
+    timings = {}
+    start_total = time.perf_counter()
+    for name, operation in (("edge_detection", processor.edge_detection),
+                            ("corner_detection", processor.corner_detection)):
+        start_time = time.perf_counter()
+        operation(image)
+        timings[name] = time.perf_counter() - start_time
+    timings["total"] = time.perf_counter() - start_total
+
+    return timings
@@ -75,11 +75,14 @@ class ImageProcessing(interfaces.IImageProcessing):
         в чёрно-белое.
 
         Args:
-            image (np.ndarray): Входное RGB-изображение.
+            image (np.ndarray): Входное RGB-изображение; изображение (H, W),
+             декодированное сразу в оттенках серого, возвращается без изменений.
 
         Returns:
             np.ndarray: Одноканальное изображение в оттенках серого.
         """
+        if image.ndim == 2:
+            return image
         return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
 
     def _gamma_correction(self, image: np.ndarray, gamma: float) -> np.ndarray:
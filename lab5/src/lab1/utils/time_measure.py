@@ -1,20 +1,7 @@
-import time
-
 import cv2
 import numpy as np
 
 
-def measure_time(func):
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"{func.__name__} выполнено за {end_time - start_time:.4f} секунд")
-        return result
-
-    return wrapper
-
-
 # Если нужно преобразовать черно-белое в цветное
 def ensure_3_channels(image: np.ndarray) -> np.ndarray:
     if len(image.shape) == 2:  # черно-белое (H, W)
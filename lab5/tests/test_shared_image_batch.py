@@ -0,0 +1,130 @@
+import asyncio
+import gc
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+import weakref
+from multiprocessing import shared_memory
+from unittest.mock import patch
+
+import numpy as np
+
+from lab5 import CatImage
+from lab5 import CatImageProcessor
+from lab5.src.SharedImageBatch import SharedImageBatch
+
+# корень репозитория: пакеты lab1 и lab5 импортируются из него
+repository_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestSharedImageBatch(unittest.TestCase):
+    def setUp(self):
+        """Создание цветного и серого тестовых изображений."""
+        rng = np.random.default_rng(3)
+        self.images = [
+            rng.integers(0, 256, (40, 60, 3), dtype=np.uint8),
+            rng.integers(0, 256, (30, 20), dtype=np.uint8),
+        ]
+
+    def test_views(self):
+        """Тест описателей: запись через сегмент, открытый по имени, видна в пакете."""
+        batch = SharedImageBatch(self.images)
+        buffer = shared_memory.SharedMemory(name=batch.descriptors[1].buffer_name)
+        image, lib_edges, custom_edges = batch.descriptors[1].views(buffer)
+        np.testing.assert_array_equal(image, self.images[1])
+        lib_edges[...] = 7
+        custom_edges[...] = 9
+        del image, lib_edges, custom_edges
+        buffer.close()
+        batch.close()
+
+        first_image, first_lib, _ = batch.views(0)
+        image, lib_edges, custom_edges = batch.views(1)
+        np.testing.assert_array_equal(first_image, self.images[0])
+        self.assertEqual(first_lib.shape, (40, 60))
+        self.assertTrue((lib_edges == 7).all())
+        self.assertTrue((custom_edges == 9).all())
+        # массивы работают и после удаления имени сегмента
+        self.assertEqual(image.shape, (30, 20))
+
+    def test_derived_arrays(self):
+        """Тест производных массивов: ссылку на сегмент держат только массивы поверх него."""
+        batch = SharedImageBatch(self.images)
+        image, _, _ = batch.views(0)
+        batch.close()
+
+        self.assertIs(image[10:, ::2]._owner, image._owner)
+        self.assertIs(image.view(np.int8)._owner, image._owner)
+        self.assertIsNone(image.astype(np.float32)._owner)
+        self.assertIsNone(image.copy()._owner)
+        self.assertIs(type(image.sum(axis=2)), np.ndarray)
+        self.assertIs(type(image + 1), np.ndarray)
+        self.assertIsInstance(image.max(), np.uint8)
+        np.add(image, 0, out=image)
+        np.testing.assert_array_equal(image, self.images[0])
+
+    def test_segment_per_image(self):
+        """Тест сегментов: массивы одного изображения не удерживают сегменты остальных."""
+        batch = SharedImageBatch(self.images)
+        first_image = batch.views(0)[0]
+        second_lib = batch.views(1)[1]
+        self.assertNotEqual(batch.descriptors[0].buffer_name, batch.descriptors[1].buffer_name)
+        self.assertIsNot(first_image._owner, second_lib._owner)
+        second_segment = weakref.ref(second_lib._owner)
+        batch.close()
+
+        del batch, second_lib
+        gc.collect()
+        self.assertIsNone(second_segment())
+        np.testing.assert_array_equal(first_image, self.images[0])
+
+    def test_process_images(self):
+        """Тест многопроцессорной обработки: результаты совпадают с process_edges."""
+        with patch('lab5.src.CatClient.CatClient._get_api_key', return_value="test_api_key_123"):
+            processor = CatImageProcessor()
+        cat_images = [CatImage(image, "http://test.com", "TestBreed") for image in self.images[:1]]
+        expected = CatImage(self.images[0].copy(), "http://test.com", "TestBreed")
+        expected.process_edges()
+
+        loop = asyncio.new_event_loop()
+        try:
+            processed = loop.run_until_complete(processor.process_images(cat_images))
+        finally:
+            loop.close()
+
+        self.assertIs(processed[0], cat_images[0])
+        np.testing.assert_array_equal(processed[0].image, self.images[0])
+        np.testing.assert_array_equal(processed[0].lib_image, expected.lib_image)
+        np.testing.assert_array_equal(processed[0].custom_image, expected.custom_image)
+
+    def test_process_images_after_numba(self):
+        """
+        Тест запуска пула после параллельных ядер numba в том же процессе
+        (как при общем прогоне lab1 и lab5): процесс завершается, а не зависает.
+        """
+        script = textwrap.dedent("""
+            import asyncio
+            from unittest.mock import patch
+
+            import numpy as np
+
+            from lab1.implementation.custom_image_processing import CustomImageProcessing
+            from lab5 import CatImage, CatImageProcessor
+
+            image = np.random.default_rng(3).integers(0, 256, (40, 60, 3), dtype=np.uint8)
+            CustomImageProcessing().edge_detection(image)
+            with patch('lab5.src.CatClient.CatClient._get_api_key', return_value="test_api_key_123"):
+                processor = CatImageProcessor()
+            processed = asyncio.run(processor.process_images([CatImage(image, "http://test.com", "TestBreed")]))
+            assert processed[0].custom_image.shape == (40, 60)
+        """)
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=repository_root, capture_output=True, text=True, timeout=300,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)